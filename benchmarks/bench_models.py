@@ -0,0 +1,65 @@
+"""Benchmark: validated vs trusted task deserialization.
+
+Compares Task.from_storage (full model_validate), Task.model_construct and the
+__slots__ TaskView on synthetic storage rows — the per-row cost `task list`
+pays before rendering.
+
+    python benchmarks/bench_models.py [--rows 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from task_manager.models import Task  # noqa: E402
+from task_manager.views import TaskView  # noqa: E402
+
+
+def make_rows(n: int) -> list[dict]:
+    priorities = ("low", "medium", "high", "urgent")
+    statuses = ("open", "in_progress", "done", "cancelled")
+    return [
+        Task(
+            title=f"Task number {i}",
+            description="Synthetic benchmark row" if i % 3 else "",
+            status=statuses[i % 4],
+            priority=priorities[i % 4],
+            tags=[f"tag{i % 7}", f"tag{i % 11}"],
+            project=f"project{i % 13}" if i % 2 else None,
+            due_date=f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}" if i % 5 else None,
+        ).to_storage()
+        for i in range(n)
+    ]
+
+
+def bench(label: str, fn, rows: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            fn(row)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<24} {best * 1000:9.1f} ms  {len(rows) / best:12,.0f} rows/s")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    validated = bench("Task.from_storage", Task.from_storage, rows, args.repeat)
+    bench("Task.model_construct", lambda r: Task.model_construct(**r), rows, args.repeat)
+    view = bench("TaskView", TaskView, rows, args.repeat)
+    print(f"TaskView speedup over validation: {validated / view:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark: list output throughput per --format.
+
+Writes synthetic storage rows through each list renderer into an in-memory
+buffer — the streamed Rich table, TSV, JSON Lines and a JSON array — and, for
+the JSON formats, with and without orjson.
+
+    python benchmarks/bench_output.py [--rows 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from bench_models import make_rows  # noqa: E402
+from rich.console import Console  # noqa: E402
+
+from task_manager.cli import output  # noqa: E402
+from task_manager.utils import serialize  # noqa: E402
+
+
+def bench(label: str, write, rows: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        buf = io.StringIO()
+        start = time.perf_counter()
+        write(rows, buf)
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:<24} {best * 1000:9.1f} ms  {len(rows) / best:12,.0f} rows/s")
+    return best
+
+
+def table(rows: list[dict], buf: io.StringIO) -> None:
+    target = Console(file=buf, width=160, height=50, force_terminal=True)
+    output.stream_task_table(rows, target=target)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    rich_table = bench("table (rich)", table, rows, args.repeat)
+    tsv = bench("tsv", output.write_task_tsv, rows, args.repeat)
+    if serialize.orjson is not None:
+        bench("jsonl (orjson)", output.write_task_jsonl, rows, args.repeat)
+        bench("json (orjson)", output.write_task_json, rows, args.repeat)
+    serialize.orjson = None
+    bench("jsonl (stdlib)", output.write_task_jsonl, rows, args.repeat)
+    bench("json (stdlib)", output.write_task_json, rows, args.repeat)
+    print(f"tsv speedup over table: {rich_table / tsv:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
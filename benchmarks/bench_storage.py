@@ -0,0 +1,294 @@
+"""Benchmark: storage backends, filters, search and CLI latency, with JSON results.
+
+Each (backend, size) case runs in a fresh child process — so peak memory (max
+RSS) belongs to that case alone — against a store loaded from a synthetic
+dataset (see datasets.py):
+
+    load          create_many() of the whole dataset
+    create        create() of new tasks
+    get           get() of random IDs on a warm instance
+    get_cold      new instance, empty parse cache, one get() — what `task show` pays
+    list          list() of everything
+    list_filtered list(status=open, tags=[tag1])
+    list_page     list(sort_by=priority, limit=20)
+    search        search() for a word
+    update        update() of status on random tasks
+    update_tags   edit_tags() on random tasks
+    cli_*         end-to-end `task` subprocess: list --limit 20, show, search
+
+Backend "memory" times apply_filters / sort_and_page over in-memory rows.
+Reads report the best of --repeat runs; writes scale their count down as the
+store grows (a JSON write rewrites the file) and run once.
+
+    python benchmarks/bench_storage.py --sizes 1k,10k --backends json,sqlite \\
+        --output results.json [--baseline previous.json]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from datasets import generate, parse_size  # noqa: E402
+
+from task_manager import __version__  # noqa: E402
+
+BACKENDS = ("json", "json-journal", "sqlite", "memory")
+
+
+def _peak_rss_mb() -> float | None:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024  # bytes vs KiB
+
+
+def _best(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _once(fn: Callable[[], object]) -> float:
+    return _best(fn, 1)
+
+
+class Case:
+    """Timings for one (backend, size), collected in the child process."""
+
+    def __init__(self, backend: str, size: int, args: argparse.Namespace) -> None:
+        self.backend = backend
+        self.size = size
+        self.args = args
+        self.results: list[dict] = []
+        self.rng = random.Random(args.seed)
+
+    def record(self, op: str, ops: int, seconds: float) -> None:
+        self.results.append(
+            {
+                "backend": self.backend,
+                "size": self.size,
+                "op": op,
+                "ops": ops,
+                "seconds": seconds,
+                "ops_per_sec": ops / seconds if seconds else None,
+            }
+        )
+
+    def run(self) -> dict:
+        rows = generate(
+            self.size, tags=self.args.tags, projects=self.args.projects, seed=self.args.seed
+        )
+        if self.backend == "memory":
+            self._filters(rows)
+        else:
+            with tempfile.TemporaryDirectory(prefix="task-bench-") as data_dir:
+                self._storage(rows, Path(data_dir))
+        return {"results": self.results, "peak_rss_mb": _peak_rss_mb()}
+
+    def _filters(self, rows: list[dict]) -> None:
+        from task_manager.utils.filters import apply_filters, sort_and_page
+
+        repeat = self.args.repeat
+        self.record(
+            "apply_filters",
+            len(rows),
+            _best(lambda: apply_filters(rows, status=["open"], tags=["tag1"]), repeat),
+        )
+        self.record(
+            "sort_and_page",
+            len(rows),
+            _best(lambda: sort_and_page(rows, sort_by="priority", limit=20), repeat),
+        )
+
+    def _storage(self, rows: list[dict], data_dir: Path) -> None:
+        from task_manager.storage import create_many, edit_tags, get_backend
+
+        args = self.args
+
+        def open_backend():
+            try:
+                from task_manager.storage.json_backend import cache_clear
+            except ImportError:
+                pass
+            else:
+                cache_clear()
+            return get_backend(self.backend, data_dir=data_dir)
+
+        backend = open_backend()
+        self.record("load", len(rows), _once(lambda: create_many(backend, rows)))
+
+        ids = [row["id"] for row in rows]
+        reads = min(args.ops, len(ids))
+        writes = max(3, min(args.ops, 1_000_000 // self.size))
+        sample = self.rng.sample(ids, reads)
+        write_sample = self.rng.sample(ids, min(writes, len(ids)))
+        extra = generate(writes, seed=args.seed + 1)
+
+        self.record("create", writes, _once(lambda: [backend.create(r) for r in extra]))
+        backend.list()  # warm the instance (and, for JSON, the parse cache)
+        self.record("get", reads, _best(lambda: [backend.get(i) for i in sample], args.repeat))
+        self.record("get_cold", 1, _best(lambda: open_backend().get(sample[0]), args.repeat))
+        self.record("list", 1, _best(backend.list, args.repeat))
+        self.record(
+            "list_filtered",
+            1,
+            _best(lambda: backend.list(status=["open"], tags=["tag1"]), args.repeat),
+        )
+        self.record(
+            "list_page",
+            1,
+            _best(lambda: backend.list(sort_by="priority", limit=20), args.repeat),
+        )
+        self.record("search", 1, _best(lambda: backend.search("budget"), args.repeat))
+        self.record(
+            "update",
+            len(write_sample),
+            _once(lambda: [backend.update(i, {"status": "done"}) for i in write_sample]),
+        )
+        self.record(
+            "update_tags",
+            len(write_sample),
+            _once(lambda: [edit_tags(backend, i, add=["bench"]) for i in write_sample]),
+        )
+        if hasattr(backend, "close"):
+            backend.close()
+        if args.cli_runs:
+            self._cli(data_dir, sample[0])
+
+    def _cli(self, data_dir: Path, task_id: str) -> None:
+        env = {**os.environ, "PYTHONPATH": str(ROOT / "src"), "TASK_DATA_DIR": str(data_dir)}
+        base = [sys.executable, "-m", "task_manager", "--no-plugins", "--storage", self.backend]
+        commands = {
+            "cli_list": ["--format", "tsv", "list", "--limit", "20"],
+            "cli_show": ["show", task_id],
+            "cli_search": ["--format", "tsv", "search", "budget"],
+        }
+        for op, argv in commands.items():
+            timings = []
+            for _ in range(self.args.cli_runs):
+                start = time.perf_counter()
+                subprocess.run(base + argv, env=env, capture_output=True, check=True)
+                timings.append(time.perf_counter() - start)
+            self.record(op, 1, statistics.median(timings))
+
+
+def _metadata(args: argparse.Namespace) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import orjson  # noqa: F401
+
+        has_orjson = True
+    except ImportError:
+        has_orjson = False
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "version": __version__,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "sqlite": sqlite3.sqlite_version,
+        "orjson": has_orjson,
+        "args": {k: v for k, v in vars(args).items() if k not in ("case", "output", "baseline")},
+    }
+
+
+def _key(result: dict) -> tuple:
+    return (result["backend"], result["size"], result["op"])
+
+
+def _print(results: list[dict], baseline: dict[tuple, dict]) -> None:
+    for r in results:
+        line = (
+            f"{r['backend']:<13} {r['size']:>9,} {r['op']:<14} "
+            f"{r['seconds'] * 1000:11.2f} ms  {r['ops_per_sec'] or 0:14,.0f} ops/s"
+        )
+        old = baseline.get(_key(r))
+        if old and old.get("seconds"):
+            line += f"  {old['seconds'] / r['seconds']:6.2f}x vs baseline"
+        print(line, flush=True)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1k,10k", help="comma-separated: 1k,10k,100k,1m or N")
+    parser.add_argument("--backends", default=",".join(BACKENDS))
+    parser.add_argument("--tags", type=int, default=50, help="distinct tags in the dataset")
+    parser.add_argument("--projects", type=int, default=20, help="distinct projects")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--ops", type=int, default=200, help="random gets/updates per case")
+    parser.add_argument("--repeat", type=int, default=3, help="best-of runs for reads")
+    parser.add_argument("--cli-runs", type=int, default=5, help="0 skips the CLI timings")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="earlier --output to compare against")
+    parser.add_argument("--case", help=argparse.SUPPRESS)  # child mode: backend:size
+    args = parser.parse_args()
+
+    if args.case:
+        backend, size = args.case.rsplit(":", 1)
+        json.dump(Case(backend, int(size), args).run(), sys.stdout)
+        return
+
+    baseline = {}
+    if args.baseline:
+        baseline = {_key(r): r for r in json.loads(args.baseline.read_text())["results"]}
+
+    report = {"meta": _metadata(args), "results": [], "memory": []}
+    child_args = sys.argv[1:]
+    for size in (parse_size(s) for s in args.sizes.split(",")):
+        for backend in args.backends.split(","):
+            if backend not in BACKENDS:
+                parser.error(f"unknown backend {backend!r}; choose from {', '.join(BACKENDS)}")
+            proc = subprocess.run(
+                [sys.executable, __file__, *child_args, "--case", f"{backend}:{size}"],
+                capture_output=True,
+                text=True,
+            )
+            if proc.returncode:
+                sys.stderr.write(proc.stderr)
+                sys.exit(f"case {backend}:{size} failed")
+            case = json.loads(proc.stdout)
+            _print(case["results"], baseline)
+            report["results"].extend(case["results"])
+            report["memory"].append(
+                {"backend": backend, "size": size, "peak_rss_mb": case["peak_rss_mb"]}
+            )
+            print(f"{backend:<13} {size:>9,} peak RSS {case['peak_rss_mb'] or 0:9.1f} MB\n")
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Synthetic, reproducible task datasets for the benchmarks.
+
+Rows are built as storage dicts directly (the shape Task.to_storage produces)
+so a million of them take seconds, not minutes. The same (size, seed,
+cardinalities) always yields the same rows, IDs included, so runs on different
+versions measure the same data.
+
+    from datasets import generate
+    rows = generate(10_000, tags=50, projects=20, seed=0)
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from task_manager.contracts import Priority, Status  # noqa: E402
+
+SIZES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+_WORDS = (
+    "review deploy write fix plan call email update draft test refactor design "
+    "migrate release document audit invoice order book schedule clean prepare"
+).split()
+_NOUNS = (
+    "report server budget meeting client backlog roadmap database invoice "
+    "dashboard contract newsletter website pipeline proposal onboarding"
+).split()
+_BASE_TIME = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _base32(value: int, length: int) -> str:
+    return "".join(_CROCKFORD[(value >> (5 * k)) & 0x1F] for k in reversed(range(length)))
+
+
+def parse_size(text: str) -> int:
+    """'10k' -> 10000; plain integers pass through."""
+    return SIZES.get(text.lower()) or int(text)
+
+
+def task_id(i: int, seed: int = 0) -> str:
+    """Deterministic ULID-shaped ID; sorts in creation order like real ones."""
+    return _base32(1_700_000_000_000 + i, 10) + _base32(seed * 1_000_003 + i, 16)
+
+
+def generate(
+    n: int,
+    *,
+    tags: int = 50,
+    projects: int = 20,
+    contexts: int = 5,
+    seed: int = 0,
+) -> list[dict]:
+    """`n` storage rows. `tags`/`projects`/`contexts` set how many distinct values exist."""
+    rng = random.Random(seed)
+    statuses = [s.value for s in Status]
+    priorities = [p.value for p in Priority]
+    tag_pool = [f"tag{t}" for t in range(tags)]
+    rows = []
+    for i in range(n):
+        created = _BASE_TIME + timedelta(seconds=i * 37)
+        updated = created + timedelta(minutes=rng.randrange(0, 10_000))
+        title = f"{rng.choice(_WORDS).capitalize()} {rng.choice(_NOUNS)} {i}"
+        rows.append(
+            {
+                "id": task_id(i, seed),
+                "title": title,
+                "description": (
+                    f"{rng.choice(_WORDS)} the {rng.choice(_NOUNS)} before {rng.choice(_NOUNS)}"
+                    if rng.random() < 0.6
+                    else ""
+                ),
+                "status": rng.choices(statuses, weights=(50, 20, 25, 5))[0],
+                "priority": rng.choices(priorities, weights=(25, 45, 20, 10))[0],
+                "tags": sorted(set(rng.sample(tag_pool, k=min(len(tag_pool), rng.randrange(4))))),
+                "project": f"project{rng.randrange(projects)}" if rng.random() < 0.7 else None,
+                "context": f"ctx{rng.randrange(contexts)}" if rng.random() < 0.4 else None,
+                "due_date": (
+                    (created + timedelta(days=rng.randrange(1, 90))).date().isoformat()
+                    if rng.random() < 0.5
+                    else None
+                ),
+                "created_at": created.isoformat(),
+                "updated_at": updated.isoformat(),
+            }
+        )
+    return rows
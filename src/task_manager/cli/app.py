@@ -1,25 +1,81 @@
-"""Root Typer application. Assembles all sub-commands."""
+"""Root Typer application. Assembles all sub-commands.
+
+Sub-commands are resolved lazily: a command's module is imported (and its
+click command built) only when that command is invoked or listed in --help.
+Command modules keep Rich, pydantic and sqlite3 imports inside function
+bodies so `task config path` and friends start without them.
+"""
 
 from __future__ import annotations
 
+import importlib
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 import typer
-from rich.console import Console
+from typer.core import TyperGroup
+from typer.main import get_command_from_info, get_group
+from typer.models import CommandInfo
 
+from task_manager.cli.output import OUTPUT_FORMATS, err_console
 from task_manager.config import Settings
 from task_manager.errors import TaskManagerError
+from task_manager.utils import trace
+
+# name -> (module, attribute). Attribute is a command function or a Typer sub-app.
+_LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "add": ("task_manager.cli.commands.add", "add"),
+    "list": ("task_manager.cli.commands.list_", "list_tasks"),
+    "show": ("task_manager.cli.commands.show", "show"),
+    "update": ("task_manager.cli.commands.update", "update"),
+    "delete": ("task_manager.cli.commands.delete", "delete"),
+    "complete": ("task_manager.cli.commands.complete", "complete"),
+    "tag": ("task_manager.cli.commands.tag", "tag"),
+    "search": ("task_manager.cli.commands.search", "search"),
+    "import": ("task_manager.cli.commands.import_", "import_tasks"),
+    "export": ("task_manager.cli.commands.export", "export_tasks"),
+    "config": ("task_manager.cli.commands.config_cmd", "config_app"),
+    "db": ("task_manager.cli.commands.db", "db_app"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """TyperGroup that imports and builds sub-commands on first lookup."""
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        eager = super().list_commands(ctx)
+        return eager + [name for name in _LAZY_COMMANDS if name not in eager]
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        cmd = super().get_command(ctx, cmd_name)
+        if cmd is None and cmd_name in _LAZY_COMMANDS:
+            cmd = _build_command(cmd_name)
+            self.add_command(cmd, cmd_name)
+        return cmd
+
+
+def _build_command(name: str) -> Any:
+    module_name, attr = _LAZY_COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attr)
+    if isinstance(target, typer.Typer):
+        group = get_group(target)
+        group.name = name
+        return group
+    return get_command_from_info(
+        CommandInfo(name=name, callback=target),
+        pretty_exceptions_short=app.pretty_exceptions_short,
+        rich_markup_mode=app.rich_markup_mode,
+    )
+
 
 app = typer.Typer(
     name="task",
     help="Production CLI task manager.",
+    cls=LazyGroup,
     no_args_is_help=True,
     pretty_exceptions_enable=False,
 )
 
-err_console = Console(stderr=True)
-
 
 @app.callback()
 def main_callback(
@@ -28,7 +84,7 @@ def main_callback(
         None,
         "--storage",
         "-s",
-        help="Override storage backend (json|sqlite)",
+        help="Override storage backend (json|json-journal|sqlite)",
         envvar="TASK_STORAGE_BACKEND",
     ),
     data_dir: Optional[Path] = typer.Option(
@@ -38,10 +94,47 @@ def main_callback(
         envvar="TASK_DATA_DIR",
     ),
     no_plugins: bool = typer.Option(False, "--no-plugins", help="Skip plugin loading"),
+    output_format: Optional[str] = typer.Option(
+        None,
+        "--format",
+        help="Output format for list/search/show: table|json|jsonl|tsv (default: auto)",
+        envvar="TASK_OUTPUT_FORMAT",
+    ),
+    trace_target: Optional[str] = typer.Option(
+        None,
+        "--trace",
+        metavar="stderr|FILE",
+        help=(
+            "Time each phase: a summary on stderr, or a Chrome trace-event JSON file "
+            "(0/false/off: disabled)"
+        ),
+        envvar="TASK_TRACE",
+    ),
+    profile: Optional[Path] = typer.Option(
+        None,
+        "--profile",
+        metavar="FILE",
+        help="Write cProfile stats for the run to FILE (read with python -m pstats)",
+        envvar="TASK_PROFILE",
+    ),
 ) -> None:
     """Global options applied to all commands."""
-    settings = Settings.load()
-    errors = settings.validate()
+    if output_format is not None and output_format not in OUTPUT_FORMATS:
+        raise typer.BadParameter(
+            f"must be one of {', '.join(OUTPUT_FORMATS)}", param_hint="--format"
+        )
+
+    # First, so they cover config and plugin loading too. Close callbacks run
+    # last-registered first: these report after everything else has finished.
+    if profile:
+        _start_profile(ctx, profile)
+    if trace_target and trace_target.strip().lower() not in _TRACE_OFF:
+        _start_trace(ctx, trace_target)
+
+    with trace.span("config.load"):
+        settings = Settings.load()
+    with trace.span("config.validate"):
+        errors = settings.validate()
     if errors:
         for err in errors:
             err_console.print(f"[red]Config error:[/red] {err}")
@@ -57,44 +150,68 @@ def main_callback(
             **({"data_dir": data_dir} if data_dir else {}),
         )
 
-    # Ensure storage backends are registered
-    import task_manager.storage.json_backend  # noqa: F401
-    import task_manager.storage.sqlite_backend  # noqa: F401
-
     ctx.ensure_object(dict)
     ctx.obj["settings"] = settings
     ctx.obj["no_plugins"] = no_plugins
+    ctx.obj["format"] = output_format
 
     # Load plugins
     if not no_plugins:
         from task_manager.plugins.hooks import DefaultHookRegistry
         from task_manager.plugins.loader import load_plugins
 
-        hooks = DefaultHookRegistry()
-        load_plugins(settings.plugins_dir, hooks)
+        hooks = DefaultHookRegistry(dispatch=settings.hook_dispatch, timeout=settings.hook_timeout)
+        # Plugins unchanged since the last run are only imported when one of
+        # their events fires.
+        with trace.span("plugins.load"):
+            load_plugins(
+                settings.plugins_dir,
+                hooks,
+                manifest_path=settings.data_dir / "plugins.manifest.json",
+            )
         ctx.obj["hooks"] = hooks
+        # Deliver background-queued events before the command's process exits.
+        ctx.call_on_close(hooks.close)
+
+
+# --trace / TASK_TRACE values that mean "off" and "summary on stderr"; anything
+# else is a file path.
+_TRACE_OFF = frozenset({"", "0", "false", "off", "no"})
+_TRACE_STDERR = frozenset({"-", "1", "stderr", "true", "on", "yes"})
+
+
+def _start_trace(ctx: typer.Context, target: str) -> None:
+    import sys
+
+    tracer = trace.enable()
+    root = trace.span(f"task {ctx.invoked_subcommand or ''}".strip())
+    root.__enter__()
+
+    def report() -> None:
+        root.__exit__(None, None, None)
+        trace.disable()
+        if target.strip().lower() in _TRACE_STDERR:
+            sys.stderr.write(tracer.summary() + "\n")
+        else:
+            tracer.write_chrome(Path(target))
+            sys.stderr.write(f"Trace written to {target}\n")
+
+    ctx.call_on_close(report)
+
+
+def _start_profile(ctx: typer.Context, path: Path) -> None:
+    import cProfile
+    import sys
+
+    profiler = cProfile.Profile()
 
+    def report() -> None:
+        profiler.disable()
+        profiler.dump_stats(path)
+        sys.stderr.write(f"Profile written to {path}\n")
 
-# Register commands
-from task_manager.cli.commands.add import add  # noqa: E402
-from task_manager.cli.commands.complete import complete  # noqa: E402
-from task_manager.cli.commands.config_cmd import config_app  # noqa: E402
-from task_manager.cli.commands.delete import delete  # noqa: E402
-from task_manager.cli.commands.list_ import list_tasks  # noqa: E402
-from task_manager.cli.commands.search import search  # noqa: E402
-from task_manager.cli.commands.show import show  # noqa: E402
-from task_manager.cli.commands.tag import tag  # noqa: E402
-from task_manager.cli.commands.update import update  # noqa: E402
-
-app.command("add")(add)
-app.command("list")(list_tasks)
-app.command("show")(show)
-app.command("update")(update)
-app.command("delete")(delete)
-app.command("complete")(complete)
-app.command("tag")(tag)
-app.command("search")(search)
-app.add_typer(config_app, name="config")
+    ctx.call_on_close(report)
+    profiler.enable()
 
 
 def main() -> None:
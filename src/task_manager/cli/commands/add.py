@@ -9,7 +9,6 @@ import typer
 from task_manager.cli.output import print_task_created
 from task_manager.cli.validators import parse_due_date
 from task_manager.contracts import Priority
-from task_manager.models import Task
 
 
 def add(
@@ -23,6 +22,7 @@ def add(
     due: Optional[str] = typer.Option(None, "--due", help="Due date (YYYY-MM-DD or 'tomorrow')"),
 ) -> None:
     """Create a new task."""
+    from task_manager.models import Task
     from task_manager.storage import get_backend
 
     settings = ctx.obj["settings"]
@@ -40,12 +40,12 @@ def add(
         due_date=due_date,
     )
 
-    storage.create(task.to_storage())
+    row = storage.create(task.to_storage())
 
     hooks = ctx.obj.get("hooks")
     if hooks:
         from task_manager.contracts import HookEvent
 
-        hooks.emit(HookEvent.TASK_CREATED, task.to_storage())
+        hooks.emit(HookEvent.TASK_CREATED, row)
 
     print_task_created(task)
@@ -7,7 +7,6 @@ import typer
 from task_manager.cli.commands.show import _resolve_task_id
 from task_manager.cli.output import print_task_completed
 from task_manager.contracts import Status
-from task_manager.models import Task
 from task_manager.utils.time import utcnow_iso
 
 
@@ -17,6 +16,7 @@ def complete(
 ) -> None:
     """Mark a task as done."""
     from task_manager.errors import TaskManagerError
+    from task_manager.models import Task
     from task_manager.storage import get_backend
 
     settings = ctx.obj["settings"]
@@ -34,7 +34,7 @@ def complete(
         if hooks:
             from task_manager.contracts import HookEvent
 
-            hooks.emit(HookEvent.TASK_COMPLETED, task.to_storage())
+            hooks.emit(HookEvent.TASK_COMPLETED, updated_data)
 
         print_task_completed(task)
     except TaskManagerError as exc:
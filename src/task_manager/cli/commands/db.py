@@ -0,0 +1,60 @@
+"""task db — inspect and upgrade the storage schema."""
+
+from __future__ import annotations
+
+import typer
+
+from task_manager.cli.output import console
+
+db_app = typer.Typer(help="Inspect and migrate the storage schema.")
+
+
+def _open_sqlite(ctx: typer.Context):  # noqa: ANN202
+    """Open the SQLite backend without auto-migrating; exit for schemaless backends."""
+    settings = ctx.obj["settings"]
+    if settings.storage_backend != "sqlite":
+        console.print(
+            f"[dim]Storage backend {settings.storage_backend!r} has no schema to migrate.[/dim]"
+        )
+        raise typer.Exit(0)
+
+    from task_manager.storage.sqlite_backend import SqliteBackend
+
+    return SqliteBackend(data_dir=settings.data_dir, auto_migrate=False)
+
+
+@db_app.command("status")
+def db_status(ctx: typer.Context) -> None:
+    """Show the schema version and any pending migrations."""
+    from task_manager.storage.sqlite_migrations import LATEST_VERSION
+
+    with _open_sqlite(ctx) as backend:
+        pending = backend.pending_migrations()
+        console.print(f"  [dim]Schema version:[/dim] {backend.schema_version()}")
+        console.print(f"  [dim]Latest:[/dim]         {LATEST_VERSION}")
+        if not pending:
+            console.print("  [green]Up to date[/green]")
+        for migration in pending:
+            console.print(
+                f"  [yellow]pending[/yellow] {migration.version}: {migration.description}"
+            )
+
+
+@db_app.command("migrate")
+def db_migrate(ctx: typer.Context) -> None:
+    """Apply pending schema migrations."""
+    with _open_sqlite(ctx) as backend:
+        applied = backend.migrate()
+        if not applied:
+            console.print("[green]Schema already up to date.[/green]")
+        for migration in applied:
+            console.print(f"[green]Applied[/green] {migration.version}: {migration.description}")
+
+
+@db_app.command("vacuum")
+def db_vacuum(ctx: typer.Context) -> None:
+    """Compact the database and rebuild the full-text search index."""
+    with _open_sqlite(ctx) as backend:
+        rebuilt = backend.vacuum()
+        suffix = " and rebuilt the search index" if rebuilt else ""
+        console.print(f"[green]Vacuumed[/green] tasks.db{suffix}.")
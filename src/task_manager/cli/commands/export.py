@@ -0,0 +1,49 @@
+"""task export — write all tasks as JSON Lines or CSV."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import typer
+
+from task_manager.cli.output import err_console
+
+
+def export_tasks(
+    ctx: typer.Context,
+    path: str = typer.Argument("-", help="File to write, or '-' for stdout"),
+    fmt: Optional[str] = typer.Option(
+        None, "--format", "-f", help="jsonl or csv (default: from file suffix, else jsonl)"
+    ),
+    chunk_size: int = typer.Option(1000, "--chunk-size", min=1, help="Tasks per write"),
+) -> None:
+    """Export tasks to a JSON Lines or CSV file."""
+    from task_manager.errors import TaskManagerError
+    from task_manager.storage import get_backend, scan_tasks
+    from task_manager.utils.serialize import FORMATS, WRITERS, detect_format, open_stream
+
+    fmt = fmt or detect_format(path) or "jsonl"
+    if fmt not in FORMATS:
+        raise typer.BadParameter(f"--format must be one of: {', '.join(FORMATS)}")
+
+    settings = ctx.obj["settings"]
+    storage = get_backend(settings.storage_backend, data_dir=settings.data_dir)
+
+    exported = 0
+    try:
+        with open_stream(path, "w") as stream, err_console.status("Exporting...") as status:
+            write = WRITERS[fmt](stream)
+            # One chunk per write: the SQLite backend never holds the whole store.
+            for chunk in scan_tasks(storage, chunk_size):
+                exported += write(chunk)
+                stream.flush()
+                status.update(f"Exported {exported} tasks...")
+    except OSError as exc:
+        err_console.print(
+            f"[red]Error:[/red] Cannot write {path}: {exc.strerror or exc} "
+            f"({exported} tasks exported before the error)"
+        )
+        raise typer.Exit(TaskManagerError.exit_code) from exc
+
+    # Summary goes to stderr so stdout stays clean when piping.
+    err_console.print(f"[green]Exported[/green] {exported} tasks")
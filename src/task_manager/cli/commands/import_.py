@@ -0,0 +1,88 @@
+"""task import — bulk-load tasks from JSON Lines or CSV."""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Iterator
+from typing import Any, Optional
+
+import typer
+
+from task_manager.cli.output import console, err_console
+
+
+def _validated(
+    rows: Iterator[tuple[int, dict[str, Any]]], *, skip_invalid: bool, skipped: list[int]
+) -> Iterator[dict[str, Any]]:
+    """Validate each raw row through Task; yield storage dicts."""
+    from pydantic import ValidationError
+
+    from task_manager.errors import ValidationRejected
+    from task_manager.models import Task
+
+    for lineno, row in rows:
+        try:
+            yield Task.model_validate(row).to_storage()
+        except ValidationError as exc:
+            if not skip_invalid:
+                raise ValidationRejected(f"line {lineno}: {exc}") from exc
+            skipped.append(lineno)
+            err_console.print(f"[yellow]Skipped[/yellow] line {lineno}: invalid task")
+
+
+def import_tasks(
+    ctx: typer.Context,
+    path: str = typer.Argument(..., help="File to read, or '-' for stdin"),
+    fmt: Optional[str] = typer.Option(
+        None, "--format", "-f", help="jsonl or csv (default: from file suffix)"
+    ),
+    chunk_size: int = typer.Option(1000, "--chunk-size", min=1, help="Tasks per write"),
+    skip_invalid: bool = typer.Option(
+        False, "--skip-invalid", help="Skip rows that fail validation instead of stopping"
+    ),
+) -> None:
+    """Import tasks from a JSON Lines or CSV file."""
+    from task_manager.contracts import HookEvent
+    from task_manager.errors import TaskManagerError, ValidationRejected
+    from task_manager.storage import create_many, get_backend
+    from task_manager.utils.serialize import FORMATS, READERS, chunked, detect_format, open_stream
+
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise typer.BadParameter(f"Use --format with one of: {', '.join(FORMATS)}")
+
+    settings = ctx.obj["settings"]
+    storage = get_backend(settings.storage_backend, data_dir=settings.data_dir)
+    hooks = ctx.obj.get("hooks")
+    # Skip the per-task emit loop entirely when no plugin listens.
+    notify = hooks is not None and hooks.has_handlers(HookEvent.TASK_CREATED)
+
+    imported = 0
+    skipped: list[int] = []
+    try:
+        with open_stream(path) as stream, err_console.status("Importing...") as status:
+            rows = _validated(READERS[fmt](stream), skip_invalid=skip_invalid, skipped=skipped)
+            for chunk in chunked(rows, chunk_size):
+                create_many(storage, chunk)
+                if notify:
+                    for task_data in chunk:
+                        hooks.emit(HookEvent.TASK_CREATED, task_data)
+                imported += len(chunk)
+                status.update(f"Imported {imported} tasks...")
+    except (ValueError, csv.Error) as exc:
+        # Malformed input (bad JSON line, broken CSV) rather than an invalid task.
+        err = ValidationRejected(str(exc))
+        console.print(f"[red]Error:[/red] {err} ({imported} tasks imported before the error)")
+        raise typer.Exit(err.exit_code) from exc
+    except OSError as exc:
+        console.print(
+            f"[red]Error:[/red] Cannot read {path}: {exc.strerror or exc} "
+            f"({imported} tasks imported before the error)"
+        )
+        raise typer.Exit(TaskManagerError.exit_code) from exc
+    except TaskManagerError as exc:
+        console.print(f"[red]Error:[/red] {exc} ({imported} tasks imported before the error)")
+        raise typer.Exit(exc.exit_code) from exc
+
+    suffix = f", skipped {len(skipped)}" if skipped else ""
+    console.print(f"[green]Imported[/green] {imported} tasks{suffix}")
@@ -6,8 +6,9 @@ from typing import Optional
 
 import typer
 
-from task_manager.cli.output import print_task_list
-from task_manager.models import Task
+from task_manager.cli.output import print_task_list, resolve_list_format
+
+_PAGE_SIZE = 20
 
 
 def list_tasks(
@@ -23,20 +24,66 @@ def list_tasks(
     ),
     project: Optional[str] = typer.Option(None, "--project", help="Filter by project"),
     context: Optional[str] = typer.Option(None, "--context", help="Filter by context"),
+    query: Optional[str] = typer.Option(
+        None,
+        "--query",
+        "-q",
+        help="Filter expression, e.g. 'due<today and priority>=high and not tag:blocked'",
+    ),
+    sort: Optional[str] = typer.Option(
+        None,
+        "--sort",
+        help="Sort by priority, due_date, updated_at, status or created_at ('-' to reverse)",
+    ),
+    limit: Optional[int] = typer.Option(None, "--limit", "-n", min=1, help="Show at most N tasks"),
+    page: Optional[int] = typer.Option(
+        None, "--page", min=1, help=f"Page number (page size: --limit, default {_PAGE_SIZE})"
+    ),
 ) -> None:
-    """List tasks with optional filters."""
-    from task_manager.storage import get_backend
+    """List tasks with optional filters.
+
+    --query terms are FIELD OP VALUE over status, priority, project, context,
+    tag, due, created and updated, combined with and, or, not and parentheses.
+    Dates: YYYY-MM-DD, today, tomorrow, yesterday or offsets like -7d.
+    """
+    from task_manager.storage import get_backend, list_tasks
+    from task_manager.utils.filters import parse_sort
+
+    where = None
+    if query is not None:
+        from task_manager.utils.query import parse_query
+
+        try:
+            where = parse_query(query)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--query") from exc
+    if sort is not None:
+        try:
+            parse_sort(sort)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint="--sort") from exc
+    if page is not None and limit is None:
+        limit = _PAGE_SIZE
+    offset = (page - 1) * limit if page else 0
 
     settings = ctx.obj["settings"]
     storage = get_backend(settings.storage_backend, data_dir=settings.data_dir)
 
-    results = storage.list(
+    results = list_tasks(
+        storage,
         status=status.split(",") if status else None,
         priority=priority.split(",") if priority else None,
         tags=tags.split(",") if tags else None,
         project=project,
         context=context,
+        where=where,
+        sort_by=sort,
+        limit=limit,
+        offset=offset,
     )
 
-    tasks = [Task.from_storage(r) for r in results]
-    print_task_list(tasks, date_format=settings.date_format)
+    print_task_list(
+        results,
+        date_format=settings.date_format,
+        fmt=resolve_list_format(settings, ctx.obj.get("format")),
+    )
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 import typer
 
-from task_manager.cli.output import print_task_list
-from task_manager.models import Task
+from task_manager.cli.output import print_task_list, resolve_list_format
 
 
 def search(
@@ -19,5 +18,8 @@ def search(
     storage = get_backend(settings.storage_backend, data_dir=settings.data_dir)
 
     results = storage.search(query)
-    tasks = [Task.from_storage(r) for r in results]
-    print_task_list(tasks, date_format=settings.date_format)
+    print_task_list(
+        results,
+        date_format=settings.date_format,
+        fmt=resolve_list_format(settings, ctx.obj.get("format")),
+    )
@@ -4,22 +4,24 @@ from __future__ import annotations
 
 import typer
 
-from task_manager.cli.output import print_task_detail
-from task_manager.models import Task
+from task_manager.cli.output import print_task_data, print_task_detail
+
+# How many candidates to fetch (and report) for an ambiguous prefix.
+_AMBIGUOUS_LIMIT = 10
 
 
 def _resolve_task_id(storage: object, prefix: str) -> str:
     """Resolve a task ID prefix to a full ID. Raises on not found or ambiguous."""
     from task_manager.errors import AmbiguousTaskId, TaskNotFound
+    from task_manager.storage import resolve_prefix
 
     # Try exact match first
     result = storage.get(prefix)
     if result is not None:
         return prefix
 
-    # Prefix search
-    all_tasks = storage.list()
-    matches = [t["id"] for t in all_tasks if t["id"].startswith(prefix.upper())]
+    # Prefix search — index range scan where the backend supports it
+    matches = resolve_prefix(storage, prefix.upper(), limit=_AMBIGUOUS_LIMIT)
 
     if len(matches) == 0:
         raise TaskNotFound(prefix)
@@ -35,6 +37,7 @@ def show(
     """Show details of a single task."""
     from task_manager.errors import TaskManagerError
     from task_manager.storage import get_backend
+    from task_manager.views import TaskView
 
     settings = ctx.obj["settings"]
     storage = get_backend(settings.storage_backend, data_dir=settings.data_dir)
@@ -42,8 +45,11 @@ def show(
     try:
         resolved_id = _resolve_task_id(storage, task_id)
         data = storage.get(resolved_id)
-        task = Task.from_storage(data)
-        print_task_detail(task, date_format=settings.date_format)
+        fmt = ctx.obj.get("format")
+        if fmt is None or fmt == "table":
+            print_task_detail(TaskView(data), date_format=settings.date_format)
+        else:
+            print_task_data(data, fmt)
     except TaskManagerError as exc:
         from task_manager.cli.output import console
 
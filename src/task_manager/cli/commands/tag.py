@@ -8,8 +8,6 @@ import typer
 
 from task_manager.cli.commands.show import _resolve_task_id
 from task_manager.cli.output import print_task_updated
-from task_manager.models import Task
-from task_manager.utils.time import utcnow_iso
 
 
 def tag(
@@ -22,7 +20,8 @@ def tag(
 ) -> None:
     """Add or remove tags from a task."""
     from task_manager.errors import TaskManagerError
-    from task_manager.storage import get_backend
+    from task_manager.models import Task
+    from task_manager.storage import edit_tags, get_backend
 
     if not add and not remove:
         from task_manager.cli.output import console
@@ -33,23 +32,13 @@ def tag(
     settings = ctx.obj["settings"]
     storage = get_backend(settings.storage_backend, data_dir=settings.data_dir)
 
+    add_tags = {t.strip().lower() for t in add.split(",") if t.strip()} if add else set()
+    rm_tags = {t.strip().lower() for t in remove.split(",") if t.strip()} if remove else set()
+
     try:
         resolved_id = _resolve_task_id(storage, task_id)
-        data = storage.get(resolved_id)
-        current_tags = set(data.get("tags", []))
-
-        if add:
-            new_tags = {t.strip().lower() for t in add.split(",") if t.strip()}
-            current_tags |= new_tags
-
-        if remove:
-            rm_tags = {t.strip().lower() for t in remove.split(",") if t.strip()}
-            current_tags -= rm_tags
-
-        updated_data = storage.update(
-            resolved_id,
-            {"tags": sorted(current_tags), "updated_at": utcnow_iso()},
-        )
+        # One atomic edit, so concurrent taggers don't drop each other's changes.
+        updated_data = edit_tags(storage, resolved_id, add=add_tags, remove=rm_tags)
         task = Task.from_storage(updated_data)
         print_task_updated(task)
     except TaskManagerError as exc:
@@ -9,7 +9,6 @@ import typer
 from task_manager.cli.commands.show import _resolve_task_id
 from task_manager.cli.output import print_task_updated
 from task_manager.contracts import Priority, Status
-from task_manager.models import Task
 from task_manager.utils.time import utcnow_iso
 
 
@@ -26,6 +25,7 @@ def update(
 ) -> None:
     """Update fields of an existing task."""
     from task_manager.errors import TaskManagerError
+    from task_manager.models import Task
     from task_manager.storage import get_backend
 
     settings = ctx.obj["settings"]
@@ -65,7 +65,7 @@ def update(
         if hooks:
             from task_manager.contracts import HookEvent
 
-            hooks.emit(HookEvent.TASK_UPDATED, task.to_storage())
+            hooks.emit(HookEvent.TASK_UPDATED, updated_data)
 
         print_task_updated(task)
     except TaskManagerError as exc:
@@ -1,15 +1,49 @@
-"""Output formatters. Rich tables for list view, plain text for single items."""
+"""Output formatters. Streamed tables for list view, plain text for single items.
+
+Rich is imported on first use, not at module import: `console` and
+`err_console` are proxies that build the real Console when first touched.
+
+List output is written row by row from storage dicts. On a terminal that is a
+fixed-width table whose header repeats every screenful; when stdout is piped
+it is TSV or JSONL (see `Settings.pipe_format`) and Rich is never loaded.
+The global `--format` option picks a format explicitly; the machine formats
+(json, jsonl, tsv) serialize storage dicts as-is, for `show` as well.
+"""
 
 from __future__ import annotations
 
-from rich import box
-from rich.console import Console
-from rich.table import Table
+import sys
+from collections.abc import Callable, Iterable
+from typing import IO, TYPE_CHECKING, Any
 
 from task_manager.contracts import Priority, Status
-from task_manager.models import Task
+from task_manager.utils.trace import traced
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from task_manager.config import Settings
+    from task_manager.models import Task
+    from task_manager.views import TaskView
+
+
+class _LazyConsole:
+    """Stands in for a rich Console until an attribute is first accessed."""
 
-console = Console()
+    def __init__(self, **kwargs: Any) -> None:
+        self._kwargs = kwargs
+        self._console: Console | None = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console(**self._kwargs)
+        return getattr(self._console, name)
+
+
+console: Console = _LazyConsole()  # type: ignore[assignment]
+err_console: Console = _LazyConsole(stderr=True)  # type: ignore[assignment]
 
 _PRIORITY_COLOR = {
     Priority.LOW: "dim",
@@ -26,40 +60,206 @@ _STATUS_COLOR = {
 }
 
 
-def print_task_list(tasks: list[Task], *, date_format: str = "%Y-%m-%d") -> None:
-    if not tasks:
-        console.print("[dim]No tasks found.[/dim]")
-        return
-
-    table = Table(box=box.SIMPLE_HEAD, show_footer=False)
-    table.add_column("ID", style="dim", width=12)
-    table.add_column("Title", min_width=20)
-    table.add_column("Status", width=12)
-    table.add_column("Priority", width=10)
-    table.add_column("Tags", width=20)
-    table.add_column("Due", width=12)
-    table.add_column("Project", width=12)
-
-    for task in tasks:
-        status_color = _STATUS_COLOR.get(task.status, "white")
-        priority_color = _PRIORITY_COLOR.get(task.priority, "white")
-        due_str = task.due_date.strftime(date_format) if task.due_date else ""
-        tags_str = ", ".join(task.tags) if task.tags else ""
-
-        table.add_row(
-            task.id[:10],
-            task.title,
-            f"[{status_color}]{task.status.value}[/{status_color}]",
-            f"[{priority_color}]{task.priority.value}[/{priority_color}]",
-            tags_str,
-            due_str,
-            task.project or "",
+# (header, width). Title takes whatever the terminal has left over.
+_TABLE_COLUMNS = (
+    ("ID", 10),
+    ("Title", 0),
+    ("Status", 11),
+    ("Priority", 8),
+    ("Tags", 20),
+    ("Due", 10),
+    ("Project", 12),
+)
+_MIN_TITLE_WIDTH = 20
+_GAP = "  "
+
+# Terminal control characters (escape sequences included) never reach the table.
+_CONTROL_CHARS = {**dict.fromkeys([*range(32), 127]), ord("\t"): " ", ord("\n"): " "}
+
+# Values accepted by the global --format option.
+OUTPUT_FORMATS = ("table", "json", "jsonl", "tsv")
+
+# Backslash escapes keep one task per TSV line whatever the title contains.
+_TSV_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def resolve_list_format(settings: Settings, requested: str | None = None) -> str:
+    """The --format choice if given; else 'table' on a terminal, the pipe format otherwise."""
+    if requested is not None:
+        return requested
+    if settings.rich_output and sys.stdout.isatty():
+        return "table"
+    return settings.pipe_format
+
+
+@traced("render.list")
+def print_task_list(
+    rows: Iterable[dict[str, Any]], *, date_format: str = "%Y-%m-%d", fmt: str = "table"
+) -> None:
+    """Write storage rows as they arrive, in one of OUTPUT_FORMATS."""
+    if fmt == "table":
+        count = stream_task_table(rows, date_format=date_format)
+    elif fmt == "tsv":
+        count = write_task_tsv(rows, sys.stdout)
+    elif fmt == "jsonl":
+        count = write_task_jsonl(rows, sys.stdout)
+    elif fmt == "json":
+        count = write_task_json(rows, sys.stdout)
+    else:
+        raise ValueError(f"Unknown list format: {fmt!r}")
+    if not count:
+        target = console if fmt == "table" else err_console
+        target.print("[dim]No tasks found.[/dim]")
+
+
+def stream_task_table(
+    rows: Iterable[dict[str, Any]],
+    *,
+    date_format: str = "%Y-%m-%d",
+    target: Console | None = None,
+    header_every: int | None = None,
+) -> int:
+    """Print one fixed-width line per row. Returns the number of rows printed.
+
+    Unlike rich.table.Table nothing is measured up front, so the first row is
+    on screen before the rest have been read. Rich is only asked for the
+    terminal size and the escape codes of each style; lines are assembled as
+    plain strings and written straight to the console's file.
+    """
+    from task_manager.views import TaskView
+
+    out = target if target is not None else console
+    fixed = sum(width for _, width in _TABLE_COLUMNS) + len(_GAP) * (len(_TABLE_COLUMNS) - 1)
+    title_width = max(out.width - fixed, _MIN_TITLE_WIDTH)
+    widths = [width or title_width for _, width in _TABLE_COLUMNS]
+    if header_every is None:
+        header_every = max(out.height - 3, 10)
+
+    style = _style_codes(out)
+    header = style("bold", _GAP.join(_fit(name, w) for (name, _), w in zip(_TABLE_COLUMNS, widths)))
+    rule = style("dim", _GAP.join("─" * width for width in widths))
+    status_cells = {
+        s: style(_STATUS_COLOR.get(s, "white"), _fit(s.value, widths[2])) for s in Status
+    }
+    priority_cells = {
+        p: style(_PRIORITY_COLOR.get(p, "white"), _fit(p.value, widths[3])) for p in Priority
+    }
+
+    write = out.file.write
+    count = 0
+    for row in rows:
+        if count % header_every == 0:
+            write(("\n" if count else "") + header + "\n" + rule + "\n")
+        task = TaskView(row)
+        cells = (
+            style("dim", _fit(task.id[:10], widths[0])),
+            _fit(task.title, widths[1]),
+            status_cells[task.status],
+            priority_cells[task.priority],
+            _fit(", ".join(task.tags), widths[4]),
+            _fit(task.due_date.strftime(date_format) if task.due_date else "", widths[5]),
+            _fit(task.project or "", widths[6]),
         )
+        write(_GAP.join(cells) + "\n")
+        count += 1
+    return count
+
+
+def _style_codes(out: Console) -> Callable[[str, str], str]:
+    """Return style(name, text) wrapping text in the console's escape codes for `name`."""
+    if out.color_system is None or out.legacy_windows:
+        return lambda name, text: text
+
+    from rich.console import COLOR_SYSTEMS
+    from rich.style import Style
+
+    color_system = COLOR_SYSTEMS[out.color_system]
+    codes: dict[str, tuple[str, str]] = {}
+
+    def style(name: str, text: str) -> str:
+        if name not in codes:
+            start, _, end = (
+                Style.parse(name).render("\0", color_system=color_system).partition("\0")
+            )
+            codes[name] = (start, end)
+        start, end = codes[name]
+        return start + text + end
+
+    return style
+
+
+def _fit(text: str, width: int) -> str:
+    """Pad or truncate `text` to exactly `width` terminal cells."""
+    if not text.isprintable():
+        text = text.translate(_CONTROL_CHARS)
+    if text.isascii():
+        return text.ljust(width) if len(text) <= width else text[: width - 1] + "…"
+
+    from rich.cells import cell_len, set_cell_size
+
+    if cell_len(text) > width:
+        return set_cell_size(text, width - 1) + "…"
+    return set_cell_size(text, width)
+
+
+def write_task_tsv(rows: Iterable[dict[str, Any]], out: IO[str]) -> int:
+    """id, title, status, priority, tags, due_date, project — one task per line."""
+    count = 0
+    for row in rows:
+        # id, status, priority and due_date are generated values; only free
+        # text can contain a tab, newline or backslash.
+        title = _tsv_text(row["title"])
+        tags = _tsv_text(",".join(row.get("tags", ())))
+        project = _tsv_text(row.get("project") or "")
+        status = row.get("status", "open")
+        priority = row.get("priority", "medium")
+        due = row.get("due_date") or ""
+        out.write(f"{row['id']}\t{title}\t{status}\t{priority}\t{tags}\t{due}\t{project}\n")
+        count += 1
+    return count
+
+
+def _tsv_text(text: str) -> str:
+    if text.isprintable() and "\\" not in text:
+        return text
+    return text.translate(_TSV_ESCAPES)
+
+
+def write_task_jsonl(rows: Iterable[dict[str, Any]], out: IO[str]) -> int:
+    """Storage rows verbatim, one JSON object per line."""
+    from task_manager.utils.serialize import jsonl_writer
+
+    return jsonl_writer(out)(rows)
+
+
+def write_task_json(rows: Iterable[dict[str, Any]], out: IO[str]) -> int:
+    """Storage rows as a single JSON array, still written one row at a time."""
+    from task_manager.utils.serialize import dumps
+
+    count = 0
+    out.write("[")
+    for row in rows:
+        out.write(("," if count else "") + "\n" + dumps(row))
+        count += 1
+    out.write("\n]\n" if count else "]\n")
+    return count
+
+
+@traced("render.data")
+def print_task_data(row: dict[str, Any], fmt: str) -> None:
+    """One storage row in a machine format: a JSON object or a single TSV line."""
+    if fmt == "tsv":
+        write_task_tsv([row], sys.stdout)
+    elif fmt in ("json", "jsonl"):
+        from task_manager.utils.serialize import dumps
 
-    console.print(table)
+        sys.stdout.write(dumps(row) + "\n")
+    else:
+        raise ValueError(f"Unknown data format: {fmt!r}")
 
 
-def print_task_detail(task: Task, *, date_format: str = "%Y-%m-%d") -> None:
+@traced("render.detail")
+def print_task_detail(task: Task | TaskView, *, date_format: str = "%Y-%m-%d") -> None:
     """Single task view — key/value pairs."""
     priority_color = _PRIORITY_COLOR.get(task.priority, "white")
     status_color = _STATUS_COLOR.get(task.status, "white")
@@ -84,17 +284,21 @@ def print_task_detail(task: Task, *, date_format: str = "%Y-%m-%d") -> None:
     console.print(f"  [dim]Updated:[/dim]     {task.updated_at}")
 
 
+@traced("render.message")
 def print_task_created(task: Task) -> None:
     console.print(f"[green]Created[/green] task [{task.id[:10]}] {task.title!r}")
 
 
+@traced("render.message")
 def print_task_updated(task: Task) -> None:
     console.print(f"[yellow]Updated[/yellow] task [{task.id[:10]}] {task.title!r}")
 
 
+@traced("render.message")
 def print_task_deleted(task_id: str) -> None:
     console.print(f"[red]Deleted[/red] task [{task_id[:10]}]")
 
 
+@traced("render.message")
 def print_task_completed(task: Task) -> None:
     console.print(f"[green]Completed[/green] task [{task.id[:10]}] {task.title!r}")
@@ -17,6 +17,19 @@ CONFIG_DIR = Path.home() / ".task-manager"
 CONFIG_FILE = CONFIG_DIR / "config.toml"
 PLUGINS_DIR = CONFIG_DIR / "plugins"
 
+# How list output is written when stdout is not a terminal.
+PIPE_FORMATS = ("tsv", "jsonl", "table")
+
+# How plugin hooks run: inline, or queued to a background thread.
+HOOK_DISPATCH_MODES = ("sync", "background")
+
+
+def _float(value: object) -> float:
+    try:
+        return float(value)  # type: ignore[arg-type]
+    except (TypeError, ValueError):
+        return float("nan")  # rejected by validate()
+
 
 def _load_toml() -> dict:
     if CONFIG_FILE.exists():
@@ -33,12 +46,16 @@ class Settings:
     default_priority: str
     date_format: str
     rich_output: bool
+    pipe_format: str
+    hook_dispatch: str
+    hook_timeout: float
 
     @classmethod
     def load(cls) -> Settings:
         toml = _load_toml()
         storage = toml.get("storage", {})
         display = toml.get("display", {})
+        hooks = toml.get("hooks", {})
         return cls(
             storage_backend=os.environ.get(
                 "TASK_STORAGE_BACKEND",
@@ -69,6 +86,20 @@ class Settings:
                 str(display.get("rich_output", "true")),
             ).lower()
             == "true",
+            pipe_format=os.environ.get(
+                "TASK_PIPE_FORMAT",
+                display.get("pipe_format", "tsv"),
+            ),
+            hook_dispatch=os.environ.get(
+                "TASK_HOOK_DISPATCH",
+                hooks.get("dispatch", "sync"),
+            ),
+            hook_timeout=_float(
+                os.environ.get(
+                    "TASK_HOOK_TIMEOUT",
+                    hooks.get("timeout", 5.0),
+                )
+            ),
         )
 
     def validate(self) -> list[str]:
@@ -80,4 +111,15 @@ class Settings:
             errors.append(
                 f"default_priority must be one of {valid_priorities}, got '{self.default_priority}'"
             )
+        if self.pipe_format not in PIPE_FORMATS:
+            errors.append(
+                f"pipe_format must be one of {set(PIPE_FORMATS)}, got '{self.pipe_format}'"
+            )
+        if self.hook_dispatch not in HOOK_DISPATCH_MODES:
+            errors.append(
+                f"hooks.dispatch must be one of {set(HOOK_DISPATCH_MODES)}, "
+                f"got '{self.hook_dispatch}'"
+            )
+        if not self.hook_timeout > 0:  # also catches NaN from an unparsable value
+            errors.append("hooks.timeout must be a positive number of seconds")
         return errors
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from enum import Enum
-from typing import Any, Protocol, TypeAlias, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, runtime_checkable
+
+if TYPE_CHECKING:
+    from task_manager.utils.filters import Predicate
 
 
 class Priority(str, Enum):
@@ -30,7 +33,8 @@ class HookEvent(str, Enum):
 
 
 TaskData: TypeAlias = dict[str, Any]
-HookHandler: TypeAlias = Callable[[HookEvent, TaskData], None]
+# Handlers get a read-only view of the payload (tags as a tuple).
+HookHandler: TypeAlias = Callable[[HookEvent, Mapping[str, Any]], None]
 
 
 @runtime_checkable
@@ -39,6 +43,20 @@ class StorageBackend(Protocol):
 
     All methods are synchronous. The CLI is synchronous and adding async
     here would infect the entire call stack without benefit.
+
+    list() sort keys are those in utils.filters.SORT_KEYS, optionally prefixed
+    with '-' to reverse. Backends written before sort/limit/offset existed are
+    still accepted: task_manager.storage.list_tasks() applies them in Python.
+
+    list(where=...) takes a utils.filters.Predicate, AND-ed with the keyword
+    filters. SQL backends can render it with Predicate.to_sql(); others call
+    it on each row. list_tasks() applies it in Python for backends without it.
+
+    update() with expected_updated_at is a compare-and-swap: it applies the
+    patch only if the stored updated_at still equals it, atomically, and
+    raises UpdateConflict otherwise. The patch then always moves updated_at
+    (the backend stamps it if the patch doesn't). Backends without the
+    parameter are emulated, non-atomically, by task_manager.storage.update_task().
     """
 
     @property
@@ -54,17 +72,84 @@ class StorageBackend(Protocol):
         tags: list[str] | None = None,
         project: str | None = None,
         context: str | None = None,
+        sort_by: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        where: Predicate | None = None,
     ) -> list[TaskData]: ...
 
     def create(self, data: TaskData) -> TaskData: ...
 
-    def update(self, task_id: str, patch: TaskData) -> TaskData: ...
+    def update(
+        self, task_id: str, patch: TaskData, *, expected_updated_at: str | None = None
+    ) -> TaskData: ...
 
     def delete(self, task_id: str) -> bool: ...
 
     def search(self, query: str) -> list[TaskData]: ...
 
 
+@runtime_checkable
+class BatchStorageBackend(StorageBackend, Protocol):
+    """Optional bulk-write extension of StorageBackend.
+
+    Each call is one load/save (JSON) or one transaction (SQLite). Backends
+    without it still work: task_manager.storage.create_many() and friends fall
+    back to looping over the single-item methods.
+
+    create_many() replaces any task whose ID already exists, so re-importing
+    an export, or retrying an import that stopped part-way, is idempotent.
+    """
+
+    def create_many(self, items: Iterable[TaskData]) -> list[TaskData]: ...
+
+    def update_many(self, patches: Mapping[str, TaskData]) -> list[TaskData]: ...
+
+    def delete_many(self, task_ids: Iterable[str]) -> int: ...
+
+
+@runtime_checkable
+class PrefixLookupBackend(StorageBackend, Protocol):
+    """Optional extension: indexed ID prefix lookup.
+
+    Returns up to `limit` IDs starting with `prefix`, in ID order. Without it,
+    task_manager.storage.resolve_prefix() falls back to scanning list().
+    """
+
+    def resolve_prefix(self, prefix: str, limit: int = 10) -> list[str]: ...
+
+
+@runtime_checkable
+class ScanBackend(StorageBackend, Protocol):
+    """Optional extension: read every task in chunks, without OFFSET.
+
+    scan() yields lists of at most `chunk_size` tasks in (created_at, id)
+    order, each page seeking past the previous one's last key, so a full pass
+    is linear. Without it, task_manager.storage.scan_tasks() chunks one list().
+    """
+
+    def scan(self, chunk_size: int = 1000) -> Iterator[list[TaskData]]: ...
+
+
+@runtime_checkable
+class TagEditBackend(StorageBackend, Protocol):
+    """Optional extension: add and remove tags in one atomic write.
+
+    The result's tags are (current | add) - remove, sorted; updated_at is set
+    to `updated_at` (now, if None). Without it, task_manager.storage.edit_tags()
+    falls back to a compare-and-swap read-modify-write loop.
+    """
+
+    def update_tags(
+        self,
+        task_id: str,
+        *,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        updated_at: str | None = None,
+    ) -> TaskData: ...
+
+
 @runtime_checkable
 class Plugin(Protocol):
     """Protocol for task manager plugins."""
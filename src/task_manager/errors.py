@@ -38,6 +38,12 @@ class BackendNotFound(StorageError):
     exit_code = 4
 
 
+class WriteConflict(StorageError):
+    """The store changed on disk between reading it and writing it back."""
+
+    exit_code = 5
+
+
 # --- Domain layer ---
 
 
@@ -62,6 +68,21 @@ class AmbiguousTaskId(TaskManagerError):
         super().__init__(f"Prefix {prefix!r} is ambiguous — matches: {', '.join(matches)}")
 
 
+class UpdateConflict(TaskManagerError):
+    """Task changed since it was read: its updated_at no longer matches the expected one."""
+
+    exit_code = 12
+
+    def __init__(self, task_id: str, expected: str, actual: str | None) -> None:
+        self.task_id = task_id
+        self.expected = expected
+        self.actual = actual
+        super().__init__(
+            f"Task {task_id!r} was modified concurrently "
+            f"(expected updated_at {expected!r}, found {actual!r})"
+        )
+
+
 class ValidationRejected(TaskManagerError):
     """Input failed domain validation before reaching storage."""
 
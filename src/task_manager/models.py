@@ -10,6 +10,7 @@ from pydantic import BaseModel, Field, field_validator
 from task_manager.contracts import Priority, Status
 from task_manager.utils.ids import generate_id
 from task_manager.utils.time import utcnow_iso
+from task_manager.utils.trace import span
 
 
 class Task(BaseModel):
@@ -47,7 +48,8 @@ class Task(BaseModel):
 
     def to_storage(self) -> dict[str, Any]:
         """Serialize for storage. due_date as ISO string, enums as values."""
-        data = self.model_dump()
+        with span("model.to_storage"):
+            data = self.model_dump()
         if data["due_date"] is not None:
             data["due_date"] = data["due_date"].isoformat()
         data["status"] = self.status.value
@@ -57,4 +59,5 @@ class Task(BaseModel):
     @classmethod
     def from_storage(cls, data: dict[str, Any]) -> Task:
         """Deserialize from storage dict."""
-        return cls.model_validate(data)
+        with span("model.from_storage"):
+            return cls.model_validate(data)
@@ -1,32 +1,191 @@
 """Hook registry — the event bus between core and plugins.
 
-Synchronous, ordered dispatch. Handlers receive a copy of the payload.
+Ordered dispatch. Handlers receive a read-only snapshot of the payload: a
+MappingProxyType with lists turned into tuples, built once per emit and shared
+by every handler. Emitting an event nobody subscribes to costs a dict lookup.
 Exceptions in handlers are caught and logged — a plugin crash never aborts the user's operation.
+
+Two dispatch modes:
+  - "sync" (default): emit() runs every handler before returning.
+  - "background": emit() copies the payload onto a bounded queue and returns.
+    A daemon thread delivers events in emit order, handlers in registration
+    order, each call bounded by ``timeout`` seconds. A full queue makes emit()
+    wait for room rather than drop events. close() — registered with atexit,
+    and called by the CLI when a command finishes — delivers everything still
+    queued before the process exits.
+
+A handler that overruns its timeout is abandoned, not killed (Python threads
+can't be): it finishes in the background if it can, and later calls to it go
+to a fresh thread so one hung plugin can't stall the rest.
 """
 
 from __future__ import annotations
 
+import atexit
+import queue
 import sys
+import threading
 from collections import defaultdict
-from copy import deepcopy
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
+from task_manager.config import HOOK_DISPATCH_MODES
 from task_manager.contracts import HookEvent, HookHandler, TaskData
+from task_manager.utils import trace
+
+_STOP = None  # queue sentinel
+
+
+def _report(event: HookEvent, exc: BaseException) -> None:
+    print(f"[task-manager] Plugin hook error on {event!r}: {exc}", file=sys.stderr)
+
+
+_ATOMIC = frozenset({str, int, float, bool, type(None)})
+
+
+def _frozen(value: Any) -> Any:
+    if type(value) in _ATOMIC:
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({k: _frozen(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    return value
+
+
+def freeze_payload(payload: TaskData) -> Mapping[str, Any]:
+    """Read-only snapshot of `payload`; later changes to the original don't show through."""
+    return MappingProxyType(
+        {k: v if type(v) in _ATOMIC else _frozen(v) for k, v in payload.items()}
+    )
+
+
+class _HandlerThread:
+    """A daemon thread that runs one handler's calls in order."""
+
+    def __init__(self, handler: HookHandler) -> None:
+        self.handler = handler
+        self._calls: queue.SimpleQueue = queue.SimpleQueue()
+        name = f"hook-{getattr(handler, '__qualname__', 'handler')}"
+        threading.Thread(target=self._run, name=name, daemon=True).start()
+
+    def call(self, event: HookEvent, payload: Mapping[str, Any], timeout: float | None) -> bool:
+        """Run handler(event, payload). False if it didn't finish within `timeout`."""
+        done = threading.Event()
+        self._calls.put((event, payload, done))
+        return done.wait(timeout)
+
+    def retire(self) -> None:
+        self._calls.put(_STOP)  # the thread exits once its current call returns
+
+    def _run(self) -> None:
+        while (call := self._calls.get()) is not _STOP:
+            event, payload, done = call
+            try:
+                self.handler(event, payload)
+            except Exception as exc:  # noqa: BLE001
+                _report(event, exc)
+            finally:
+                done.set()
 
 
 class DefaultHookRegistry:
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        dispatch: str = "sync",
+        timeout: float | None = 5.0,
+        queue_size: int = 256,
+    ) -> None:
+        if dispatch not in HOOK_DISPATCH_MODES:
+            raise ValueError(f"dispatch must be one of {HOOK_DISPATCH_MODES}, got {dispatch!r}")
         self._handlers: dict[HookEvent, list[HookHandler]] = defaultdict(list)
+        self.dispatch = dispatch
+        self.timeout = timeout
+        self._queue_size = queue_size
+        self._queue: queue.Queue | None = None
+        self._dispatcher: threading.Thread | None = None
+        self._runners: dict[HookHandler, _HandlerThread] = {}
+        self._start_lock = threading.Lock()
 
     def on(self, event: HookEvent, handler: HookHandler) -> None:
+        if trace.active():
+            handler = trace.wrap(handler, f"hook {getattr(event, 'value', event)}")
         self._handlers[event].append(handler)
 
+    def has_handlers(self, event: HookEvent) -> bool:
+        return bool(self._handlers.get(event))
+
     def emit(self, event: HookEvent, payload: TaskData) -> None:
-        payload_copy = deepcopy(payload)
-        for handler in self._handlers[event]:
+        handlers = self._handlers.get(event)
+        if not handlers:
+            return
+        frozen = freeze_payload(payload)
+        if self.dispatch == "background":
+            self._start().put((event, frozen))
+            return
+        for handler in handlers:
             try:
-                handler(event, payload_copy)
+                handler(event, frozen)
             except Exception as exc:  # noqa: BLE001
-                print(
-                    f"[task-manager] Plugin hook error on {event!r}: {exc}",
-                    file=sys.stderr,
+                _report(event, exc)
+
+    def flush(self) -> None:
+        """Block until every event emitted so far has been delivered (or timed out)."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Deliver queued events and stop the dispatcher. Safe to call twice."""
+        with self._start_lock:
+            dispatcher, self._dispatcher = self._dispatcher, None
+            if dispatcher is None:
+                return
+            assert self._queue is not None
+            self._queue.put(_STOP)
+            atexit.unregister(self.close)
+        dispatcher.join()
+        for runner in self._runners.values():
+            runner.retire()
+        self._runners.clear()
+
+    # -- background dispatch ----------------------------------------------------
+
+    def _start(self) -> queue.Queue:
+        with self._start_lock:
+            if self._dispatcher is None:
+                self._queue = queue.Queue(maxsize=self._queue_size)
+                self._dispatcher = threading.Thread(
+                    target=self._dispatch_loop, args=(self._queue,), name="hooks", daemon=True
                 )
+                self._dispatcher.start()
+                atexit.register(self.close)
+            assert self._queue is not None
+            return self._queue
+
+    def _dispatch_loop(self, events: queue.Queue) -> None:
+        while True:
+            item = events.get()
+            try:
+                if item is _STOP:
+                    return
+                event, payload = item
+                for handler in tuple(self._handlers.get(event, ())):
+                    self._deliver(handler, event, payload)
+            finally:
+                events.task_done()
+
+    def _deliver(self, handler: HookHandler, event: HookEvent, payload: Mapping[str, Any]) -> None:
+        runner = self._runners.get(handler)
+        if runner is None:
+            runner = self._runners[handler] = _HandlerThread(handler)
+        if not runner.call(event, payload, self.timeout):
+            print(
+                f"[task-manager] Plugin hook on {event!r} timed out after {self.timeout}s",
+                file=sys.stderr,
+            )
+            runner.retire()
+            del self._runners[handler]
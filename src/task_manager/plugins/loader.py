@@ -1,20 +1,191 @@
-"""Plugin loader: directory scan + importlib.
+"""Plugin loader: directory scan + entry points + importlib.
 
 Convention:
   - Each .py file in plugins_dir is a potential plugin module.
   - Must have a top-level `plugin` variable implementing the Plugin protocol.
+  - Installed packages can also expose plugins in the "task_manager.plugins"
+    entry-point group, naming either the plugin object ("pkg.mod:plugin") or a
+    module with a top-level `plugin`.
   - The loader calls plugin.register(hooks) for each loaded plugin.
   - Bad plugins log to stderr and are skipped.
+
+Manifest cache: given a manifest_path, the loader records each plugin's name,
+version and the events its register() subscribed to, keyed on the file's path,
+mtime and size (entry points: on the mtimes of the sys.path directories). On
+later runs an unchanged plugin isn't imported: a stand-in handler is registered
+for each recorded event, and the module is imported and registered the first
+time one of them fires. Commands that emit nothing import no plugin code.
+
+Lazy activation assumes register() only subscribes handlers; any other side
+effects it has are deferred to first use. Plugins that fail to load are not
+cached, so the error is reported on every run until fixed.
 """
 
 from __future__ import annotations
 
+import importlib
 import importlib.util
+import json
+import os
 import sys
+import tempfile
+import threading
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
+
+from task_manager.contracts import HookEvent, HookHandler, Plugin, TaskData
+from task_manager.plugins.hooks import DefaultHookRegistry, _report
+from task_manager.utils import trace
+
+ENTRY_POINT_GROUP = "task_manager.plugins"
+
+_MANIFEST_VERSION = 1
+
+
+class _Recorder:
+    """HookRegistry stand-in that records what register() subscribes."""
+
+    def __init__(self) -> None:
+        self.handlers: dict[HookEvent, list[HookHandler]] = {}
+
+    def on(self, event: HookEvent, handler: HookHandler) -> None:
+        self.handlers.setdefault(HookEvent(event), []).append(handler)
+
+    def emit(self, event: HookEvent, payload: TaskData) -> None:
+        pass  # nothing is listening while plugins register
+
+
+class _LazyPlugin:
+    """A cached plugin, imported and registered the first time one of its events fires."""
+
+    def __init__(self, label: str, load: Callable[[], Plugin], *, silent: bool) -> None:
+        self._label = label
+        self._load = load
+        self._silent = silent
+        self._handlers: dict[HookEvent, list[HookHandler]] | None = None
+        self._lock = threading.Lock()
+
+    def _activate(self) -> dict[HookEvent, list[HookHandler]]:
+        with self._lock:
+            if self._handlers is None:
+                try:
+                    with trace.span("plugins.activate", plugin=self._label):
+                        self._handlers = _record(self._load())
+                except Exception as exc:  # noqa: BLE001
+                    _report_load_failure(self._label, exc, self._silent)
+                    self._handlers = {}
+            return self._handlers
+
+    def stand_in(self, event: HookEvent) -> HookHandler:
+        def handler(event: HookEvent, payload: Any) -> None:
+            for real in self._activate().get(event, ()):
+                try:
+                    real(event, payload)
+                except Exception as exc:  # noqa: BLE001
+                    _report(event, exc)
+
+        return handler
+
+
+def _report_load_failure(label: str, exc: Exception, silent: bool) -> None:
+    if not silent:
+        print(f"[task-manager] Plugin load failed [{label}]: {exc}", file=sys.stderr)
+
+
+def _check_plugin(plugin: object) -> Plugin:
+    if plugin is None:
+        raise ImportError("Module has no top-level 'plugin' variable")
+    if not isinstance(plugin, Plugin):
+        raise ImportError(
+            "'plugin' variable does not implement Plugin protocol "
+            "(missing: name, version, or register)"
+        )
+    return plugin
+
 
-from task_manager.contracts import Plugin
-from task_manager.plugins.hooks import DefaultHookRegistry
+def _record(plugin: Plugin) -> dict[HookEvent, list[HookHandler]]:
+    recorder = _Recorder()
+    plugin.register(recorder)  # type: ignore[arg-type]
+    return recorder.handlers
+
+
+def _load_file(plugin_file: Path) -> Plugin:
+    module_name = f"task_manager_plugin_{plugin_file.stem}"
+    spec = importlib.util.spec_from_file_location(module_name, plugin_file)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not create module spec for {plugin_file}")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return _check_plugin(getattr(module, "plugin", None))
+
+
+def _load_entry_point(value: str) -> Plugin:
+    """Resolve "pkg.mod:attr" (or "pkg.mod") without importing importlib.metadata."""
+    module_name, _, attr = value.partition(":")
+    target: Any = importlib.import_module(module_name.strip())
+    for part in filter(None, attr.strip().split(".")):
+        target = getattr(target, part)
+    if not attr:
+        target = getattr(target, "plugin", None)
+    return _check_plugin(target)
+
+
+def _file_sig(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _site_sig() -> list[list[Any]]:
+    """Installing or removing a distribution touches its sys.path directory."""
+    cwd = os.getcwd()
+    sig = []
+    for entry in sys.path:
+        if not entry or os.path.abspath(entry) == cwd:
+            continue
+        try:
+            sig.append([entry, os.stat(entry).st_mtime_ns])
+        except OSError:
+            continue
+    return sig
+
+
+def _scan_entry_points() -> list[list[str]]:
+    """[name, value] pairs; importlib.metadata is only imported when the cache misses."""
+    from importlib.metadata import entry_points
+
+    return [[ep.name, ep.value] for ep in entry_points(group=ENTRY_POINT_GROUP)]
+
+
+def _read_manifest(path: Path | None) -> dict[str, Any]:
+    if path is None:
+        return {}
+    try:
+        manifest = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(manifest, dict) or manifest.get("version") != _MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _write_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    # A cache: failing to write it only means importing plugins again next run.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
 
 
 def load_plugins(
@@ -22,40 +193,70 @@ def load_plugins(
     hooks: DefaultHookRegistry,
     *,
     silent: bool = False,
+    manifest_path: Path | None = None,
+    entry_points: bool = True,
 ) -> list[str]:
-    """Load all plugins from plugins_dir. Returns list of loaded plugin names."""
-    loaded: list[str] = []
+    """Load all plugins from plugins_dir and entry points. Returns loaded plugin names.
 
-    if not plugins_dir.exists():
-        return loaded
+    With manifest_path, plugins unchanged since the last run are activated lazily.
+    """
+    loaded: list[str] = []
+    cached = _read_manifest(manifest_path)
+    manifest: dict[str, Any] = {"version": _MANIFEST_VERSION, "files": {}, "entry_points": {}}
 
-    for plugin_file in sorted(plugins_dir.glob("*.py")):
-        module_name = f"task_manager_plugin_{plugin_file.stem}"
+    def add(label: str, load: Callable[[], Plugin], entry: dict[str, Any] | None) -> Any:
+        """Register one plugin, lazily if `entry` is a cache hit. Returns its manifest entry."""
+        if entry is not None and manifest_path is not None:
+            lazy = _LazyPlugin(label, load, silent=silent)
+            for event in entry["events"]:
+                hooks.on(HookEvent(event), lazy.stand_in(HookEvent(event)))
+            loaded.append(entry["name"])
+            return entry
         try:
-            spec = importlib.util.spec_from_file_location(module_name, plugin_file)
-            if spec is None or spec.loader is None:
-                raise ImportError(f"Could not create module spec for {plugin_file}")
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-
-            plugin = getattr(module, "plugin", None)
-            if plugin is None:
-                raise ImportError("Module has no top-level 'plugin' variable")
-            if not isinstance(plugin, Plugin):
-                raise ImportError(
-                    "'plugin' variable does not implement Plugin protocol "
-                    "(missing: name, version, or register)"
-                )
-
-            plugin.register(hooks)
-            loaded.append(plugin.name)
+            plugin = load()
+            handlers = _record(plugin)
+        except Exception as exc:  # noqa: BLE001
+            _report_load_failure(label, exc, silent)
+            return None
+        for event, registered in handlers.items():
+            for handler in registered:
+                hooks.on(event, handler)
+        loaded.append(plugin.name)
+        return {
+            "name": plugin.name,
+            "version": plugin.version,
+            "events": [event.value for event in handlers],
+        }
 
+    if plugins_dir.exists():
+        cached_files = cached.get("files", {})
+        for plugin_file in sorted(plugins_dir.glob("*.py")):
+            key = str(plugin_file.resolve())
+            sig = _file_sig(plugin_file)
+            hit = cached_files.get(key)
+            entry = hit["plugin"] if hit is not None and hit["sig"] == sig else None
+            entry = add(str(plugin_file), lambda f=plugin_file: _load_file(f), entry)
+            if entry is not None:
+                manifest["files"][key] = {"sig": sig, "plugin": entry}
+
+    if entry_points:
+        site_sig = _site_sig()
+        cached_eps = cached.get("entry_points", {})
+        fresh = cached_eps.get("sig") == site_sig
+        try:
+            points = cached_eps["points"] if fresh else _scan_entry_points()
         except Exception as exc:  # noqa: BLE001
-            if not silent:
-                print(
-                    f"[task-manager] Plugin load failed [{plugin_file}]: {exc}",
-                    file=sys.stderr,
-                )
+            _report_load_failure(f"entry points {ENTRY_POINT_GROUP}", exc, silent)
+            points = []
+        plugins = cached_eps.get("plugins", {}) if fresh else {}
+        manifest["entry_points"] = {"sig": site_sig, "points": points, "plugins": {}}
+        for name, value in points:
+            entry = add(
+                f"{name} = {value}", lambda v=value: _load_entry_point(v), plugins.get(value)
+            )
+            if entry is not None:
+                manifest["entry_points"]["plugins"][value] = entry
 
+    if manifest_path is not None and manifest != cached:
+        _write_manifest(manifest_path, manifest)
     return loaded
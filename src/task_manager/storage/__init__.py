@@ -2,26 +2,300 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import os
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from task_manager.contracts import StorageBackend
+    from task_manager.contracts import StorageBackend, TaskData
+    from task_manager.utils.filters import Predicate
 
 _REGISTRY: dict[str, type] = {}
 
+# Built-in backends register themselves on import; importing them lazily keeps
+# sqlite3 out of every CLI invocation that doesn't use it.
+_BUILTIN_MODULES: dict[str, str] = {
+    "json": "task_manager.storage.json_backend",
+    "json-journal": "task_manager.storage.json_backend",
+    "sqlite": "task_manager.storage.sqlite_backend",
+}
+
 
 def register_backend(name: str, cls: type) -> None:
     _REGISTRY[name] = cls
 
 
 def get_backend(name: str, **kwargs: object) -> "StorageBackend":
+    if name not in _REGISTRY and name in _BUILTIN_MODULES:
+        import importlib
+
+        importlib.import_module(_BUILTIN_MODULES[name])
     if name not in _REGISTRY:
         from task_manager.errors import BackendNotFound
 
-        available = ", ".join(_REGISTRY) or "(none)"
+        available = ", ".join(available_backends()) or "(none)"
         raise BackendNotFound(f"Unknown storage backend {name!r}. Available: {available}")
-    return _REGISTRY[name](**kwargs)
+    from task_manager.utils import trace
+
+    with trace.span("storage.open", backend=name):
+        backend = _REGISTRY[name](**kwargs)
+    if trace.active():
+        trace.instrument(backend, "storage")
+    return backend
 
 
 def available_backends() -> list[str]:
-    return list(_REGISTRY)
+    return list(dict.fromkeys([*_BUILTIN_MODULES, *_REGISTRY]))
+
+
+# --- Files ---
+
+
+def _read_umask() -> int:
+    """The process umask, from /proc where the kernel reports it (Linux 4.7+).
+
+    os.umask() can only read it by setting it, which changes it for every
+    thread in the meantime, so that fallback runs once, at import.
+    """
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def new_file_mode() -> int:
+    """The mode open() would give a new file: 0o666 less the umask (as at import).
+
+    For temp files (mkstemp creates them 0600) that replace a store file
+    that didn't exist yet.
+    """
+    return 0o666 & ~_UMASK
+
+
+# --- Batch writes: native when the backend has them, looped otherwise ---
+
+
+def create_many(backend: "StorageBackend", items: Iterable["TaskData"]) -> list["TaskData"]:
+    from task_manager.contracts import BatchStorageBackend
+
+    if isinstance(backend, BatchStorageBackend):
+        return backend.create_many(items)
+    return [backend.create(item) for item in items]
+
+
+def update_many(backend: "StorageBackend", patches: Mapping[str, "TaskData"]) -> list["TaskData"]:
+    """Apply patches keyed by task ID. Raises TaskNotFound before writing anything.
+
+    The looped fallback checks existence up front but is not atomic.
+    """
+    from task_manager.contracts import BatchStorageBackend
+
+    if isinstance(backend, BatchStorageBackend):
+        return backend.update_many(patches)
+
+    from task_manager.errors import TaskNotFound
+
+    for task_id in patches:
+        if backend.get(task_id) is None:
+            raise TaskNotFound(task_id)
+    return [backend.update(task_id, patch) for task_id, patch in patches.items()]
+
+
+def delete_many(backend: "StorageBackend", task_ids: Iterable[str]) -> int:
+    """Delete the given IDs. Returns how many existed."""
+    from task_manager.contracts import BatchStorageBackend
+
+    if isinstance(backend, BatchStorageBackend):
+        return backend.delete_many(task_ids)
+    return sum(backend.delete(task_id) for task_id in task_ids)
+
+
+def resolve_prefix(backend: "StorageBackend", prefix: str, limit: int = 10) -> list[str]:
+    """Up to `limit` task IDs starting with `prefix`, indexed when the backend can."""
+    from task_manager.contracts import PrefixLookupBackend
+
+    if isinstance(backend, PrefixLookupBackend):
+        return backend.resolve_prefix(prefix, limit)
+    matches = sorted(t["id"] for t in backend.list() if t["id"].startswith(prefix))
+    return matches[:limit]
+
+
+def prefix_upper_bound(prefix: str) -> str | None:
+    """Smallest string greater than every string starting with `prefix`.
+
+    Lets a prefix match become a range scan: prefix <= id < bound. None means
+    unbounded (prefix is empty or ends in the highest code point).
+    """
+    if not prefix or ord(prefix[-1]) == 0x10FFFF:
+        return None
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+@cache
+def _list_supports_paging(cls: type) -> bool:
+    import inspect
+
+    return "limit" in inspect.signature(cls.list).parameters
+
+
+@cache
+def _list_supports_where(cls: type) -> bool:
+    import inspect
+
+    return "where" in inspect.signature(cls.list).parameters
+
+
+def list_tasks(
+    backend: "StorageBackend",
+    *,
+    sort_by: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+    where: "Predicate | None" = None,
+    **filters: Any,
+) -> list["TaskData"]:
+    """list() with `where`, sorting and paging pushed down when the backend supports them."""
+    if where is not None and not _list_supports_where(type(backend)):
+        from task_manager.utils.filters import sort_and_page
+
+        rows = where.select(backend.list(**filters))
+        return sort_and_page(rows, sort_by=sort_by, limit=limit, offset=offset)
+    if where is not None:
+        filters["where"] = where
+    if _list_supports_paging(type(backend)):
+        return backend.list(**filters, sort_by=sort_by, limit=limit, offset=offset)
+
+    from task_manager.utils.filters import sort_and_page
+
+    return sort_and_page(backend.list(**filters), sort_by=sort_by, limit=limit, offset=offset)
+
+
+def scan_tasks(backend: "StorageBackend", chunk_size: int = 1000) -> Iterator[list["TaskData"]]:
+    """Every task, oldest first, in lists of at most `chunk_size`.
+
+    Paged by key when the backend can; otherwise one list(), which the JSON
+    backends hold in memory anyway.
+    """
+    from task_manager.contracts import ScanBackend
+
+    if isinstance(backend, ScanBackend):
+        yield from backend.scan(chunk_size)
+        return
+
+    from itertools import islice
+
+    rows = iter(list_tasks(backend, sort_by="created_at"))
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+# --- Optimistic concurrency ---
+
+
+@cache
+def _update_supports_cas(cls: type) -> bool:
+    import inspect
+
+    return "expected_updated_at" in inspect.signature(cls.update).parameters
+
+
+def update_task(
+    backend: "StorageBackend",
+    task_id: str,
+    patch: "TaskData",
+    *,
+    expected_updated_at: str | None = None,
+) -> "TaskData":
+    """update(), compare-and-swap on updated_at when `expected_updated_at` is given.
+
+    Backends whose update() predates the parameter get a get-compare-update
+    emulation, which narrows the race but cannot close it.
+    """
+    if expected_updated_at is None or _update_supports_cas(type(backend)):
+        if expected_updated_at is None:
+            return backend.update(task_id, patch)
+        return backend.update(task_id, patch, expected_updated_at=expected_updated_at)
+
+    from task_manager.errors import TaskNotFound, UpdateConflict
+    from task_manager.utils.time import utcnow_iso
+
+    current = backend.get(task_id)
+    if current is None:
+        raise TaskNotFound(task_id)
+    if current.get("updated_at") != expected_updated_at:
+        raise UpdateConflict(task_id, expected_updated_at, current.get("updated_at"))
+    return backend.update(task_id, {"updated_at": utcnow_iso(), **patch})
+
+
+def update_with_retry(
+    backend: "StorageBackend",
+    task_id: str,
+    change: Callable[["TaskData"], "TaskData"],
+    *,
+    attempts: int = 5,
+) -> "TaskData":
+    """Read-modify-write one task without lost updates.
+
+    change(current) returns the patch to apply; it is re-run on fresh data each
+    time a concurrent writer gets in first. Raises UpdateConflict after
+    `attempts` tries, TaskNotFound if the task is gone.
+    """
+    import random
+    import time
+
+    from task_manager.errors import TaskNotFound, UpdateConflict
+
+    for attempt in range(1, attempts + 1):
+        current = backend.get(task_id)
+        if current is None:
+            raise TaskNotFound(task_id)
+        try:
+            return update_task(
+                backend, task_id, change(current), expected_updated_at=current.get("updated_at")
+            )
+        except UpdateConflict:
+            if attempt == attempts:
+                raise
+            time.sleep(random.uniform(0, 0.005 * attempt))  # de-synchronize the contenders
+    raise AssertionError("unreachable")
+
+
+def merge_tags(tags: Iterable[str], add: Iterable[str], remove: Iterable[str]) -> list[str]:
+    """(tags | add) - remove, sorted: the tag edit every backend implements."""
+    return sorted((set(tags) | set(add)) - set(remove))
+
+
+def edit_tags(
+    backend: "StorageBackend",
+    task_id: str,
+    *,
+    add: Iterable[str] = (),
+    remove: Iterable[str] = (),
+) -> "TaskData":
+    """Add and remove tags on one task, atomically when the backend can."""
+    from task_manager.contracts import TagEditBackend
+
+    if isinstance(backend, TagEditBackend):
+        return backend.update_tags(task_id, add=add, remove=remove)
+
+    from task_manager.utils.time import utcnow_iso
+
+    add, remove = set(add), set(remove)
+    return update_with_retry(
+        backend,
+        task_id,
+        lambda current: {
+            "tags": merge_tags(current.get("tags", []), add, remove),
+            "updated_at": utcnow_iso(),
+        },
+    )
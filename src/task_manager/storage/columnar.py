@@ -0,0 +1,339 @@
+"""Read-only columnar snapshot of a JSON task store, scanned through mmap.
+
+JsonBackend writes one of these next to tasks.json (as tasks.columns) once the
+store is large enough, and answers get/list/search from it while tasks.json is
+unchanged, so a read command parses only the rows it returns instead of the
+whole file.
+
+File layout (little-endian, sections 8-byte aligned):
+
+    header    magic, source mtime_ns, size and inode, row count
+    sections  (offset, length) table, then:
+              status, priority    one byte per row (enum position, 255 = missing)
+              id_order            u32 row numbers sorted by ID
+              per string column   u64 offsets (rows + 1) and a byte heap
+
+Rows keep tasks.json order. The "record" heap is the compact JSON of every
+task joined into one array, so it can be parsed whole or one row at a time.
+"""
+
+from __future__ import annotations
+
+import heapq
+import json
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from task_manager.contracts import Priority, Status
+from task_manager.utils.filters import PRIORITY_RANK, STATUS_RANK, parse_sort
+
+from . import new_file_mode
+
+_MAGIC = b"TMCOLS01"
+_HEADER = struct.Struct("<8sqqQQ")
+_SECTION = struct.Struct("<QQ")
+
+_STRING_COLUMNS = (
+    "id",
+    "record",
+    "project",
+    "context",
+    "tags",
+    "created_at",
+    "updated_at",
+    "due_date",
+    "text",
+)
+_SECTION_COUNT = 3 + 2 * len(_STRING_COLUMNS)
+
+_MISSING = 255
+_NULL = b"\x00"  # None in optional string columns; "" stays b""
+_TAG_SEP = b"\x1f"
+_STATUS_CODES = {s.value: i for i, s in enumerate(Status)}
+_PRIORITY_CODES = {p.value: i for i, p in enumerate(Priority)}
+_STATUS_RANK = {code: STATUS_RANK[value] for value, code in _STATUS_CODES.items()}
+_PRIORITY_RANK = {code: PRIORITY_RANK[value] for value, code in _PRIORITY_CODES.items()}
+
+
+def _optional(value: str | None) -> bytes:
+    return _NULL if value is None else value.encode()
+
+
+def _search_text(task: dict[str, Any]) -> bytes:
+    # Same fields and case rules as JsonBackend.search; NUL keeps matches inside one field.
+    parts = [
+        task.get("title", "").lower(),
+        task.get("description", "").lower(),
+        *task.get("tags", []),
+    ]
+    return "\0".join(parts).encode() + _NULL
+
+
+class ColumnarSnapshot:
+    """An open snapshot. Valid only for the tasks.json signature it was built from."""
+
+    def __init__(self, mm: mmap.mmap, rows: int, sections: list[tuple[int, int]], sig: tuple):
+        self.source_sig = sig
+        self._mm = mm
+        self._rows = rows
+        self._view = memoryview(mm)
+        (s_off, s_len), (p_off, p_len), (o_off, o_len) = sections[:3]
+        self._status = mm[s_off : s_off + s_len]
+        self._priority = mm[p_off : p_off + p_len]
+        self._id_order = self._view[o_off : o_off + o_len].cast("I")
+        self._offsets: dict[str, memoryview] = {}
+        self._heap: dict[str, tuple[int, int]] = {}
+        for i, name in enumerate(_STRING_COLUMNS):
+            (off, length), (heap_off, heap_len) = sections[3 + 2 * i : 5 + 2 * i]
+            self._offsets[name] = self._view[off : off + length].cast("Q")
+            self._heap[name] = (heap_off, heap_off + heap_len)
+
+    # -- building and opening -------------------------------------------------
+
+    @staticmethod
+    def build(path: Path, tasks: Iterable[dict[str, Any]], source_sig: tuple) -> bool:
+        """Write a snapshot of `tasks` to `path`. False if the rows don't fit the layout."""
+        from task_manager.utils.serialize import dumps
+
+        status = bytearray()
+        priority = bytearray()
+        columns: dict[str, list[bytes]] = {name: [] for name in _STRING_COLUMNS}
+        try:
+            for task in tasks:
+                status.append(_STATUS_CODES[task["status"]] if "status" in task else _MISSING)
+                priority.append(
+                    _PRIORITY_CODES[task["priority"]] if "priority" in task else _MISSING
+                )
+                task_tags = task.get("tags", [])
+                if any("\x1f" in tag for tag in task_tags):
+                    return False
+                columns["id"].append(task["id"].encode())
+                columns["record"].append(dumps(task).encode())
+                columns["project"].append(_optional(task.get("project")))
+                columns["context"].append(_optional(task.get("context")))
+                encoded_tags = _TAG_SEP.join(tag.encode() for tag in task_tags)
+                columns["tags"].append(_TAG_SEP + encoded_tags + _TAG_SEP)
+                columns["created_at"].append(task.get("created_at", "").encode())
+                columns["updated_at"].append(task.get("updated_at", "").encode())
+                columns["due_date"].append(_optional(task.get("due_date")))
+                columns["text"].append(_search_text(task))
+        except (KeyError, TypeError, AttributeError):
+            return False
+
+        ids = columns["id"]
+        id_order = array("I", sorted(range(len(ids)), key=ids.__getitem__))
+        sections = [bytes(status), bytes(priority), id_order.tobytes()]
+        for name in _STRING_COLUMNS:
+            sections.extend(_pack(columns[name], joined_array=name == "record"))
+
+        header = _HEADER.pack(_MAGIC, *source_sig, len(ids))
+        table_size = _SECTION.size * _SECTION_COUNT
+        pos = _align(len(header) + table_size)
+        table = bytearray()
+        for section in sections:
+            table += _SECTION.pack(pos, len(section))
+            pos = _align(pos + len(section))
+
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            os.chmod(tmp, new_file_mode())  # mkstemp creates 0600
+            with os.fdopen(fd, "wb") as f:
+                f.write(header)
+                f.write(table)
+                for section in sections:
+                    f.write(b"\0" * (_align(f.tell()) - f.tell()))
+                    f.write(section)
+            os.replace(tmp, path)
+        except OSError:
+            # A cache, not the store: failing to write it (or to replace a copy
+            # another process has mapped, on Windows) only costs speed.
+            Path(tmp).unlink(missing_ok=True)
+            return False
+        return True
+
+    @classmethod
+    def open(cls, path: Path, source_sig: tuple) -> ColumnarSnapshot | None:
+        """Map the snapshot at `path` if it exists and was built from `source_sig`."""
+        try:
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        try:
+            magic, *sig, rows = _HEADER.unpack_from(mm, 0)
+            if magic != _MAGIC or tuple(sig) != tuple(source_sig):
+                raise ValueError("stale snapshot")
+            sections = [
+                _SECTION.unpack_from(mm, _HEADER.size + i * _SECTION.size)
+                for i in range(_SECTION_COUNT)
+            ]
+            if any(off + length > len(mm) for off, length in sections):
+                raise ValueError("truncated snapshot")
+            return cls(mm, rows, sections, tuple(source_sig))
+        except (struct.error, ValueError, TypeError):
+            mm.close()
+            return None
+
+    def close(self) -> None:
+        self._id_order.release()
+        for view in self._offsets.values():
+            view.release()
+        self._view.release()
+        self._mm.close()
+
+    def __len__(self) -> int:
+        return self._rows
+
+    # -- reads ------------------------------------------------------------------
+
+    def _value(self, column: str, row: int) -> bytes:
+        offsets = self._offsets[column]
+        base = self._heap[column][0]
+        return self._mm[base + offsets[row] : base + offsets[row + 1]]
+
+    def records(self, rows: list[int]) -> list[dict[str, Any]]:
+        """Parse the given rows. Large selections parse the whole record array at once."""
+        start, end = self._heap["record"]
+        if len(rows) > self._rows // 2:
+            everything = json.loads(self._mm[start:end])
+            return [everything[row] for row in rows]
+        offsets = self._offsets["record"]
+        # Each record is followed by a one-byte separator (',' or the closing ']').
+        return [json.loads(self._mm[start + offsets[r] : start + offsets[r + 1] - 1]) for r in rows]
+
+    def _id_position(self, key: bytes) -> int:
+        return bisect_left(
+            range(self._rows), key, key=lambda i: self._value("id", self._id_order[i])
+        )
+
+    def get(self, task_id: str) -> dict[str, Any] | None:
+        key = task_id.encode()
+        pos = self._id_position(key)
+        if pos < self._rows and self._value("id", self._id_order[pos]) == key:
+            return self.records([self._id_order[pos]])[0]
+        return None
+
+    def ids_with_prefix(self, prefix: str, limit: int) -> list[str]:
+        key = prefix.encode()
+        matches: list[str] = []
+        pos = self._id_position(key)
+        while pos < self._rows and len(matches) < limit:
+            task_id = self._value("id", self._id_order[pos])
+            if not task_id.startswith(key):
+                break
+            matches.append(task_id.decode())
+            pos += 1
+        return matches
+
+    def select(
+        self,
+        *,
+        status: list[str] | None = None,
+        priority: list[str] | None = None,
+        tags: list[str] | None = None,
+        project: str | None = None,
+        context: str | None = None,
+    ) -> list[int]:
+        """Row numbers matching the filters, with the semantics of apply_filters."""
+        rows: Iterable[int] = range(self._rows)
+        if status:
+            codes = {_STATUS_CODES[s] for s in status if s in _STATUS_CODES}
+            column = self._status
+            rows = [r for r in rows if column[r] in codes]
+        if priority:
+            codes = {_PRIORITY_CODES[p] for p in priority if p in _PRIORITY_CODES}
+            column = self._priority
+            rows = [r for r in rows if column[r] in codes]
+        if tags:
+            needles = [_TAG_SEP + tag.encode() + _TAG_SEP for tag in set(tags)]
+            rows = [r for r in rows if all(n in self._value("tags", r) for n in needles)]
+        if project is not None:
+            target = project.encode()
+            rows = [r for r in rows if self._value("project", r) == target]
+        if context is not None:
+            target = context.encode()
+            rows = [r for r in rows if self._value("context", r) == target]
+        return list(rows)
+
+    def order(
+        self, rows: list[int], *, sort_by: str | None, limit: int | None, offset: int
+    ) -> list[int]:
+        """sort_and_page over row numbers, reading sort keys from the columns."""
+        stop = None if limit is None else offset + limit
+        if sort_by is None:
+            return rows[offset:stop]
+
+        key, descending = parse_sort(sort_by)
+        value = self._value
+        if key == "priority":
+            column = self._priority
+            keyfunc = lambda r: (_PRIORITY_RANK.get(column[r], 99), value("id", r))  # noqa: E731
+        elif key == "status":
+            column = self._status
+            keyfunc = lambda r: (_STATUS_RANK.get(column[r], 99), value("id", r))  # noqa: E731
+        elif key == "due_date":
+
+            def keyfunc(r: int) -> tuple:
+                due = value("due_date", r)
+                return (due == _NULL, b"" if due == _NULL else due, value("id", r))
+
+        else:
+            keyfunc = lambda r: (value(key, r), value("id", r))  # noqa: E731
+
+        if limit is None:
+            ordered = sorted(rows, key=keyfunc, reverse=descending)
+        elif descending:
+            ordered = heapq.nlargest(offset + limit, rows, key=keyfunc)
+        else:
+            ordered = heapq.nsmallest(offset + limit, rows, key=keyfunc)
+        return ordered[offset:]
+
+    def search(self, query: str) -> list[int] | None:
+        """Rows whose title, description or tags contain `query`. None if unsupported."""
+        if "\0" in query:
+            return None
+        needle = query.lower().encode()
+        offsets = self._offsets["text"]
+        start, end = self._heap["text"]
+        rows: list[int] = []
+        pos = start
+        while True:
+            hit = self._mm.find(needle, pos, end)
+            if hit < 0:
+                break
+            row = bisect_right(offsets, hit - start) - 1
+            if row >= self._rows:
+                break
+            row_end = start + offsets[row + 1]
+            if hit + len(needle) <= row_end:
+                rows.append(row)
+                pos = row_end
+            else:
+                pos = hit + 1
+        return rows
+
+
+def _align(pos: int) -> int:
+    return (pos + 7) & ~7
+
+
+def _pack(values: list[bytes], *, joined_array: bool) -> tuple[bytes, bytes]:
+    """Offsets and heap for one string column."""
+    if joined_array:
+        heap = b"[" + b",".join(values) + b"]"
+        pos, step = 1, 1
+    else:
+        heap = b"".join(values)
+        pos, step = 0, 0
+    offsets = array("Q", [pos])
+    for value in values:
+        pos += len(value) + step
+        offsets.append(pos)
+    return offsets.tobytes(), heap
@@ -3,50 +3,323 @@
 Data layout: single file, tasks stored as a dict keyed by ID.
   { "tasks": { "<id>": { ...task fields... }, ... } }
 
-Write strategy: write to .tmp, then replace. Atomic on POSIX, safe on Windows.
+Write strategy: every read-modify-write runs under an advisory lock on
+tasks.lock. The new contents go to a uniquely named temp file, are fsynced,
+then replace tasks.json. Atomic on POSIX, safe on Windows. A writer that
+finds tasks.json changed since it loaded it (its mtime, size or inode moved:
+someone bypassed the lock) raises WriteConflict, after retrying against the
+fresh contents a few times.
+
+Once a store holds ``columnar_min_tasks`` tasks, the first read that parses it
+also writes tasks.columns, a memory-mapped columnar snapshot (see
+storage/columnar.py). Later reads — in any process — answer get/list/search
+from it without parsing tasks.json until the file changes again. Writes never
+build it: their save would make it stale at once.
+
+Parsed stores are also cached per process, keyed on the path plus the file's
+mtime, size and inode (see cache_info). A cached store is shared by every
+JsonBackend on that path and is never mutated: writers copy the task dict,
+replace rows rather than editing them, and install the result on save. Rows
+handed to callers are copies.
+
+JournaledJsonBackend ("json-journal") keeps the same snapshot file but appends
+each mutation to tasks.journal (JSON Lines) and only rewrites the snapshot when
+the journal grows past a fraction of the snapshot size.
 """
 
 from __future__ import annotations
 
 import json
+import os
+import tempfile
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, NamedTuple, TypeVar
+
+from task_manager.errors import (
+    StorageCorrupt,
+    StorageUnavailable,
+    TaskNotFound,
+    UpdateConflict,
+    WriteConflict,
+)
+from task_manager.utils.filters import Predicate, apply_filters, sort_and_page
+from task_manager.utils.locking import file_lock
+from task_manager.utils.time import utcnow_iso
+
+from . import merge_tags, new_file_mode, register_backend
+from .columnar import ColumnarSnapshot
+
+T = TypeVar("T")
+
+# Load-modify-save attempts before a WriteConflict is passed to the caller.
+_WRITE_ATTEMPTS = 3
+_UNCHECKED = object()
+
+
+class StoreCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    stores: int
+
+
+class _ParsedStoreCache:
+    """Parsed tasks.json contents by path, valid while the file signature matches."""
+
+    def __init__(self, maxsize: int = 8) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Path, tuple[object, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def peek(self, path: Path, sig: object) -> dict[str, Any] | None:
+        entry = self._entries.get(path)
+        return entry[1] if entry is not None and entry[0] == sig else None
+
+    def get(self, path: Path, sig: object) -> dict[str, Any] | None:
+        with self._lock:
+            data = self.peek(path, sig)
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(path)
+            return data
+
+    def put(self, path: Path, sig: object, data: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[path] = (sig, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, path: Path) -> None:
+        with self._lock:
+            self._entries.pop(path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_parsed_stores = _ParsedStoreCache()
+
+
+def cache_info() -> StoreCacheInfo:
+    """Hit/miss counters of the in-process parsed-store cache."""
+    return StoreCacheInfo(_parsed_stores.hits, _parsed_stores.misses, len(_parsed_stores._entries))
+
+
+def cache_clear() -> None:
+    """Drop every cached store and reset the counters."""
+    _parsed_stores.clear()
+
+
+def _fsync_dir(path: Path) -> None:
+    """Persist a rename in `path`. Directories can't be opened for this on Windows."""
+    if os.name != "posix":
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
 
-from task_manager.errors import StorageCorrupt, StorageUnavailable, TaskNotFound
-from task_manager.utils.filters import apply_filters
 
-from . import register_backend
+def _cas_patch(patch: dict[str, Any], expected_updated_at: str | None) -> dict[str, Any]:
+    """A compare-and-swap write must move updated_at, or the next one can't see it."""
+    if expected_updated_at is None or "updated_at" in patch:
+        return patch
+    return {**patch, "updated_at": utcnow_iso()}
+
+
+def _check_expected(task_id: str, row: dict[str, Any], expected_updated_at: str | None) -> None:
+    if expected_updated_at is not None and row.get("updated_at") != expected_updated_at:
+        raise UpdateConflict(task_id, expected_updated_at, row.get("updated_at"))
+
+
+def _copy_row(row: dict[str, Any]) -> dict[str, Any]:
+    """A copy safe to hand out: rows are flat apart from the tags list."""
+    copy = dict(row)
+    if "tags" in copy:
+        copy["tags"] = list(copy["tags"])
+    return copy
 
 
 class JsonBackend:
     name: str = "json"
+    # Whether parsed stores go through the shared per-process cache.
+    _share_parsed: bool = True
 
-    def __init__(self, *, data_dir: Path) -> None:
+    def __init__(
+        self,
+        *,
+        data_dir: Path,
+        columnar_min_tasks: int | None = 5000,
+        lock_timeout: float = 10.0,
+    ) -> None:
         self._path = Path(data_dir) / "tasks.json"
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self._path.with_suffix(".lock")
+        self._lock_timeout = lock_timeout
+        self._lock_held = threading.local()
+        self._id_index: tuple[object, list[str]] | None = None
+        # None disables the columnar snapshot.
+        self._columnar_min_tasks = columnar_min_tasks
+        self._columnar_path = self._path.with_suffix(".columns")
+        self._columnar: ColumnarSnapshot | None = None
 
-    def _load(self) -> dict[str, Any]:
-        if not self._path.exists():
+    @staticmethod
+    def _stat_sig(path: Path) -> tuple[int, int, int] | None:
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def _store_sig(self) -> object:
+        """Cheap fingerprint of the on-disk store; changes whenever its contents can."""
+        return self._stat_sig(self._path)
+
+    def _load(self, *, snapshot: bool = True) -> dict[str, Any]:
+        """The parsed store. May be shared: read it, never mutate it (see _load_for_update).
+
+        snapshot=False skips writing the columnar snapshot (write paths).
+        """
+        sig = self._stat_sig(self._path)
+        if sig is None:
             return {"tasks": {}}
+        if self._share_parsed and (cached := _parsed_stores.get(self._path, sig)) is not None:
+            return cached
         try:
             text = self._path.read_text(encoding="utf-8")
-            return json.loads(text)
+            data = json.loads(text)
         except json.JSONDecodeError as exc:
             raise StorageCorrupt(f"tasks.json is not valid JSON: {exc}") from exc
         except OSError as exc:
             raise StorageUnavailable(f"Cannot read tasks.json: {exc}") from exc
+        if (
+            snapshot
+            and self._columnar_min_tasks is not None
+            and len(data["tasks"]) >= self._columnar_min_tasks
+            and self._open_columnar(sig) is None
+        ):
+            ColumnarSnapshot.build(self._columnar_path, data["tasks"].values(), sig)
+        if self._share_parsed:
+            _parsed_stores.put(self._path, sig, data)
+        return data
+
+    def _load_for_update(self) -> dict[str, Any]:
+        """A private copy of the store's task dict to modify and pass to _save.
+
+        Rows inside are still shared, so replace them instead of updating in place.
+        """
+        data = self._load(snapshot=False)
+        return {**data, "tasks": dict(data["tasks"])}
+
+    def _open_columnar(self, sig: object) -> ColumnarSnapshot | None:
+        if self._columnar is not None:
+            if self._columnar.source_sig == sig:
+                return self._columnar
+            self._columnar.close()
+        self._columnar = ColumnarSnapshot.open(self._columnar_path, sig)
+        return self._columnar
 
-    def _save(self, data: dict[str, Any]) -> None:
-        tmp = self._path.with_suffix(".tmp")
+    def _read_columnar(self) -> ColumnarSnapshot | None:
+        """The columnar snapshot of tasks.json as it is now, if one has been written.
+
+        None when the parsed store is already cached in memory, which is faster still.
+        """
+        if self._columnar_min_tasks is None:
+            return None
+        sig = self._stat_sig(self._path)
+        if sig is None or _parsed_stores.peek(self._path, sig) is not None:
+            return None
+        return self._open_columnar(sig)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclusive lock on the store across processes. Re-entrant within a thread."""
+        if getattr(self._lock_held, "value", False):
+            yield
+            return
+        lock = file_lock(self._lock_path, timeout=self._lock_timeout)
+        try:
+            lock.__enter__()
+        except TimeoutError as exc:
+            raise StorageUnavailable(f"tasks.json is locked by another process: {exc}") from exc
+        except OSError as exc:
+            raise StorageUnavailable(f"Cannot lock tasks.json: {exc}") from exc
+        self._lock_held.value = True
+        try:
+            yield
+        finally:
+            self._lock_held.value = False
+            lock.__exit__(None, None, None)
+
+    def _write(self, mutate: Callable[[dict[str, Any]], tuple[T, bool]]) -> T:
+        """Apply mutate(tasks) to a private copy of the store and save it if it says so.
+
+        mutate returns (result, changed). Runs under the lock; retried on a
+        fresh load if tasks.json changes underneath us anyway.
+        """
+        for attempt in range(_WRITE_ATTEMPTS):
+            with self._locked():
+                base = self._stat_sig(self._path)
+                data = self._load_for_update()
+                result, changed = mutate(data["tasks"])
+                if not changed:
+                    return result
+                try:
+                    self._save(data, base=base)
+                except WriteConflict:
+                    if attempt + 1 == _WRITE_ATTEMPTS:
+                        raise
+                    continue
+                return result
+        raise AssertionError("unreachable")
+
+    def _save(self, data: dict[str, Any], *, base: object = _UNCHECKED) -> None:
+        """Write `data` as tasks.json. With `base`, refuse if the file's signature moved."""
+        fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix="tasks.", suffix=".tmp")
+        tmp = Path(tmp_name)
         try:
-            tmp.write_text(json.dumps(data, indent=2, default=str), encoding="utf-8")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(json.dumps(data, indent=2, default=str))
+                f.flush()
+                os.fsync(f.fileno())
+            if base is not _UNCHECKED and self._stat_sig(self._path) != base:
+                tmp.unlink()
+                raise WriteConflict("tasks.json was modified by another writer")
+            try:
+                # mkstemp creates 0600; keep whatever mode the store already has.
+                mode = self._path.stat().st_mode & 0o7777
+            except FileNotFoundError:
+                mode = new_file_mode()
+            os.chmod(tmp, mode)
+            # replace() keeps the inode and mtime, so this is the signature
+            # tasks.json will have — without racing another writer's replace.
+            sig = self._stat_sig(tmp)
             tmp.replace(self._path)
+            _fsync_dir(self._path.parent)
         except OSError as exc:
+            tmp.unlink(missing_ok=True)
+            _parsed_stores.discard(self._path)
             raise StorageUnavailable(f"Cannot write tasks.json: {exc}") from exc
+        if self._share_parsed:
+            _parsed_stores.put(self._path, sig, data)
 
     def get(self, task_id: str) -> dict[str, Any] | None:
-        data = self._load()
-        return data["tasks"].get(task_id)
+        if (columnar := self._read_columnar()) is not None:
+            return columnar.get(task_id)
+        row = self._load()["tasks"].get(task_id)
+        return _copy_row(row) if row is not None else None
 
     def list(
         self,
@@ -56,46 +329,143 @@ class JsonBackend:
         tags: list[str] | None = None,
         project: str | None = None,
         context: str | None = None,
+        sort_by: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        where: Predicate | None = None,
     ) -> list[dict[str, Any]]:
+        if (columnar := self._read_columnar()) is not None:
+            rows = columnar.select(
+                status=status, priority=priority, tags=tags, project=project, context=context
+            )
+            if where is None:
+                return columnar.records(
+                    columnar.order(rows, sort_by=sort_by, limit=limit, offset=offset)
+                )
+            matched = where.select(columnar.records(rows))
+            return sort_and_page(matched, sort_by=sort_by, limit=limit, offset=offset)
         data = self._load()
         tasks = list(data["tasks"].values())
-        return apply_filters(
+        filtered = apply_filters(
             tasks,
             status=status,
             priority=priority,
             tags=tags,
             project=project,
             context=context,
+            where=where,
         )
+        page = sort_and_page(filtered, sort_by=sort_by, limit=limit, offset=offset)
+        return [_copy_row(t) for t in page]
 
     def create(self, task_data: dict[str, Any]) -> dict[str, Any]:
-        data = self._load()
-        task_id = task_data["id"]
-        data["tasks"][task_id] = task_data
-        self._save(data)
-        return task_data
+        def mutate(tasks: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+            tasks[task_data["id"]] = _copy_row(task_data)
+            return task_data, True
 
-    def update(self, task_id: str, patch: dict[str, Any]) -> dict[str, Any]:
-        data = self._load()
-        if task_id not in data["tasks"]:
-            raise TaskNotFound(task_id)
-        data["tasks"][task_id].update(patch)
-        self._save(data)
-        return data["tasks"][task_id]
+        return self._write(mutate)
+
+    def update(
+        self, task_id: str, patch: dict[str, Any], *, expected_updated_at: str | None = None
+    ) -> dict[str, Any]:
+        patch = _cas_patch(patch, expected_updated_at)
+
+        def mutate(tasks: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+            if task_id not in tasks:
+                raise TaskNotFound(task_id)
+            _check_expected(task_id, tasks[task_id], expected_updated_at)
+            tasks[task_id] = {**tasks[task_id], **patch}
+            return _copy_row(tasks[task_id]), True
+
+        return self._write(mutate)
+
+    def update_tags(
+        self,
+        task_id: str,
+        *,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        updated_at: str | None = None,
+    ) -> dict[str, Any]:
+        add, remove = set(add), set(remove)
+        stamp = updated_at or utcnow_iso()
+
+        def mutate(tasks: dict[str, Any]) -> tuple[dict[str, Any], bool]:
+            if task_id not in tasks:
+                raise TaskNotFound(task_id)
+            row = tasks[task_id]
+            tasks[task_id] = {
+                **row,
+                "tags": merge_tags(row.get("tags", []), add, remove),
+                "updated_at": stamp,
+            }
+            return _copy_row(tasks[task_id]), True
+
+        return self._write(mutate)
 
     def delete(self, task_id: str) -> bool:
-        data = self._load()
-        if task_id not in data["tasks"]:
-            return False
-        del data["tasks"][task_id]
-        self._save(data)
-        return True
+        def mutate(tasks: dict[str, Any]) -> tuple[bool, bool]:
+            found = tasks.pop(task_id, None) is not None
+            return found, found
+
+        return self._write(mutate)
+
+    def create_many(self, items: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        created = list(items)
+
+        def mutate(tasks: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
+            for task_data in created:
+                tasks[task_data["id"]] = _copy_row(task_data)
+            return created, True
+
+        return self._write(mutate)
+
+    def update_many(self, patches: Mapping[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        def mutate(tasks: dict[str, Any]) -> tuple[list[dict[str, Any]], bool]:
+            for task_id in patches:
+                if task_id not in tasks:
+                    raise TaskNotFound(task_id)
+            updated = []
+            for task_id, patch in patches.items():
+                tasks[task_id] = {**tasks[task_id], **patch}
+                updated.append(_copy_row(tasks[task_id]))
+            return updated, True
+
+        return self._write(mutate)
+
+    def delete_many(self, task_ids: Iterable[str]) -> int:
+        ids = list(task_ids)
+
+        def mutate(tasks: dict[str, Any]) -> tuple[int, bool]:
+            deleted = sum(tasks.pop(task_id, None) is not None for task_id in ids)
+            return deleted, deleted > 0
+
+        return self._write(mutate)
+
+    def resolve_prefix(self, prefix: str, limit: int = 10) -> list[str]:
+        if (columnar := self._read_columnar()) is not None:
+            return columnar.ids_with_prefix(prefix, limit)
+        # Sorted ID list, rebuilt only when the store changes on disk.
+        sig = self._store_sig()
+        if self._id_index is None or self._id_index[0] != sig:
+            self._id_index = (sig, sorted(self._load()["tasks"]))
+        ids = self._id_index[1]
+
+        matches: list[str] = []
+        i = bisect_left(ids, prefix)
+        while i < len(ids) and len(matches) < limit and ids[i].startswith(prefix):
+            matches.append(ids[i])
+            i += 1
+        return matches
 
     def search(self, query: str) -> list[dict[str, Any]]:
+        columnar = self._read_columnar()
+        if columnar is not None and (rows := columnar.search(query)) is not None:
+            return columnar.records(rows)
         data = self._load()
         q = query.lower()
         return [
-            t
+            _copy_row(t)
             for t in data["tasks"].values()
             if q in t.get("title", "").lower()
             or q in t.get("description", "").lower()
@@ -103,4 +473,245 @@ class JsonBackend:
         ]
 
 
+class JournaledJsonBackend(JsonBackend):
+    """JSON backend with an append-only mutation journal.
+
+    Mutations and compaction hold the same tasks.lock as JsonBackend writers,
+    so concurrent appends never interleave and compaction never drops one.
+
+    Records are full-state, so replaying a journal over a snapshot that already
+    contains it (after a crash, or a read, between the two replaces) is harmless:
+      {"op": "put", "task": { ...task fields... }}
+      {"op": "del", "id": "<id>"}
+
+    Compaction triggers once the journal exceeds ``compact_ratio`` times the
+    snapshot size (but never below ``min_compact_bytes``), which keeps the
+    amortized cost of a write constant as the store grows.
+    """
+
+    name: str = "json-journal"
+    # _state is replayed and mutated in place; it must stay private to this instance.
+    _share_parsed: bool = False
+
+    def __init__(
+        self,
+        *,
+        data_dir: Path,
+        compact_ratio: float = 0.5,
+        min_compact_bytes: int = 1 << 20,
+    ) -> None:
+        # The journal holds writes tasks.json doesn't, so a snapshot of it would be stale.
+        super().__init__(data_dir=data_dir, columnar_min_tasks=None)
+        self._journal_path = self._path.with_suffix(".journal")
+        self._compact_ratio = compact_ratio
+        self._min_compact_bytes = min_compact_bytes
+        # Replayed state, valid while the snapshot is unchanged on disk.
+        self._state: dict[str, Any] | None = None
+        self._snapshot_sig: tuple[int, int, int] | None = None
+        self._journal_ino: int | None = None
+        self._journal_offset = 0
+
+    def _store_sig(self) -> object:
+        return (self._stat_sig(self._path), self._stat_sig(self._journal_path))
+
+    def _load(self, *, snapshot: bool = True) -> dict[str, Any]:
+        # Readers don't take the lock, so a compaction can replace both files
+        # mid-load. The journal is read through one handle, and the load starts
+        # over if tasks.json was replaced meanwhile; otherwise the handle holds
+        # either this snapshot's journal or the one folded into it, and replaying
+        # that one again is harmless.
+        while True:
+            sig = self._stat_sig(self._path)
+            try:
+                journal = open(self._journal_path, "rb")
+            except FileNotFoundError:
+                journal = None
+            except OSError as exc:
+                raise StorageUnavailable(f"Cannot read tasks.journal: {exc}") from exc
+            try:
+                st = os.fstat(journal.fileno()) if journal is not None else None
+                journal_ino, journal_size = (st.st_ino, st.st_size) if st else (None, 0)
+                if (
+                    self._state is None
+                    or sig != self._snapshot_sig
+                    or journal_ino != self._journal_ino
+                    or journal_size < self._journal_offset
+                ):
+                    self._state = super()._load()
+                    self._snapshot_sig = sig
+                    self._journal_ino = journal_ino
+                    self._journal_offset = 0
+                if journal is not None and journal_size > self._journal_offset:
+                    self._replay(self._state, journal)
+            except OSError as exc:
+                raise StorageUnavailable(f"Cannot read tasks.journal: {exc}") from exc
+            finally:
+                if journal is not None:
+                    journal.close()
+            if self._stat_sig(self._path) == sig:
+                return self._state
+            self._state = None
+
+    def _replay(self, data: dict[str, Any], journal: BinaryIO) -> None:
+        """Apply journal records past the last replayed offset."""
+        journal.seek(self._journal_offset)
+        chunk = journal.read()
+
+        # A trailing line without newline is a torn append — leave it for later.
+        end = chunk.rfind(b"\n") + 1
+        tasks = data["tasks"]
+        for line in chunk[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise StorageCorrupt(f"tasks.journal has an invalid record: {exc}") from exc
+            if record["op"] == "put":
+                tasks[record["task"]["id"]] = record["task"]
+            elif record["op"] == "del":
+                tasks.pop(record["id"], None)
+            else:
+                raise StorageCorrupt(f"tasks.journal has unknown op {record['op']!r}")
+        self._journal_offset += end
+
+    def _append(self, records: list[dict[str, Any]]) -> None:
+        payload = "".join(
+            json.dumps(r, separators=(",", ":"), default=str) + "\n" for r in records
+        ).encode("utf-8")
+        try:
+            with open(self._journal_path, "ab") as f:
+                f.write(payload)
+                journal_size = f.tell()
+                journal_ino = os.fstat(f.fileno()).st_ino
+        except OSError as exc:
+            raise StorageUnavailable(f"Cannot write tasks.journal: {exc}") from exc
+
+        if (
+            self._state is not None
+            and journal_ino == self._journal_ino
+            and self._journal_offset + len(payload) == journal_size
+        ):
+            # Nobody else appended since our last replay; our records are applied.
+            self._journal_offset = journal_size
+
+        sig = self._snapshot_sig if self._state is not None else self._stat_sig(self._path)
+        snapshot_size = sig[1] if sig else 0
+        if journal_size > max(self._min_compact_bytes, snapshot_size * self._compact_ratio):
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into tasks.json and start a new, empty journal.
+
+        The journal is replaced rather than truncated, so a reader holding
+        offsets into the old one sees a new inode instead of reusing them.
+        """
+        with self._locked():
+            data = self._load()
+            self._save(data)
+            fd, tmp_name = tempfile.mkstemp(dir=self._path.parent, prefix="tasks.", suffix=".tmp")
+            tmp = Path(tmp_name)
+            try:
+                os.close(fd)
+                try:
+                    mode = self._journal_path.stat().st_mode & 0o7777
+                except FileNotFoundError:
+                    mode = new_file_mode()
+                os.chmod(tmp, mode)
+                journal_ino = tmp.stat().st_ino
+                tmp.replace(self._journal_path)
+                _fsync_dir(self._path.parent)
+            except OSError as exc:
+                tmp.unlink(missing_ok=True)
+                raise StorageUnavailable(f"Cannot replace tasks.journal: {exc}") from exc
+            self._snapshot_sig = self._stat_sig(self._path)
+            self._journal_ino = journal_ino
+            self._journal_offset = 0
+
+    def create(self, task_data: dict[str, Any]) -> dict[str, Any]:
+        with self._locked():
+            # Appending needs no prior state; only keep the in-memory copy warm if we have one.
+            if self._state is not None:
+                self._load()["tasks"][task_data["id"]] = _copy_row(task_data)
+            self._append([{"op": "put", "task": task_data}])
+            return task_data
+
+    def update(
+        self, task_id: str, patch: dict[str, Any], *, expected_updated_at: str | None = None
+    ) -> dict[str, Any]:
+        patch = _cas_patch(patch, expected_updated_at)
+        with self._locked():
+            tasks = self._load()["tasks"]
+            if task_id not in tasks:
+                raise TaskNotFound(task_id)
+            _check_expected(task_id, tasks[task_id], expected_updated_at)
+            merged = _copy_row({**tasks[task_id], **patch})
+            tasks[task_id] = merged
+            self._append([{"op": "put", "task": merged}])
+            return _copy_row(merged)
+
+    def update_tags(
+        self,
+        task_id: str,
+        *,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        updated_at: str | None = None,
+    ) -> dict[str, Any]:
+        with self._locked():
+            tasks = self._load()["tasks"]
+            if task_id not in tasks:
+                raise TaskNotFound(task_id)
+            row = tasks[task_id]
+            tags = merge_tags(row.get("tags", []), add, remove)
+            return self.update(task_id, {"tags": tags, "updated_at": updated_at or utcnow_iso()})
+
+    def delete(self, task_id: str) -> bool:
+        with self._locked():
+            tasks = self._load()["tasks"]
+            if task_id not in tasks:
+                return False
+            del tasks[task_id]
+            self._append([{"op": "del", "id": task_id}])
+            return True
+
+    def create_many(self, items: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        with self._locked():
+            created = list(items)
+            if not created:
+                return created
+            if self._state is not None:
+                tasks = self._load()["tasks"]
+                for task_data in created:
+                    tasks[task_data["id"]] = _copy_row(task_data)
+            self._append([{"op": "put", "task": t} for t in created])
+            return created
+
+    def update_many(self, patches: Mapping[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        with self._locked():
+            tasks = self._load()["tasks"]
+            for task_id in patches:
+                if task_id not in tasks:
+                    raise TaskNotFound(task_id)
+            updated = []
+            for task_id, patch in patches.items():
+                tasks[task_id] = _copy_row({**tasks[task_id], **patch})
+                updated.append(tasks[task_id])
+            self._append([{"op": "put", "task": t} for t in updated])
+            return [_copy_row(t) for t in updated]
+
+    def delete_many(self, task_ids: Iterable[str]) -> int:
+        with self._locked():
+            tasks = self._load()["tasks"]
+            records = [
+                {"op": "del", "id": task_id}
+                for task_id in task_ids
+                if tasks.pop(task_id, None) is not None
+            ]
+            if records:
+                self._append(records)
+            return len(records)
+
+
 register_backend("json", JsonBackend)
+register_backend("json-journal", JournaledJsonBackend)
@@ -1,62 +1,267 @@
 """SQLite storage backend.
 
 Schema: tasks table with columns matching Task model fields.
-Tags stored as JSON text column (sqlite has no array type).
-Thread safety: each call opens a new connection with WAL mode.
+Tags stored as JSON text column (sqlite has no array type), mirrored into
+task_tags(task_id, tag) so tag filters are indexed lookups.
+Search: FTS5 index over title/description/tags, kept in sync by triggers and
+keyed on the tasks rowid. Falls back to LIKE when FTS5 isn't compiled in.
+Schema: versioned migrations in sqlite_migrations; opening a current database
+costs one PRAGMA user_version read, no DDL.
+Connections: one long-lived connection per thread, opened lazily and tuned
+once (WAL, synchronous=NORMAL, mmap, page cache). Compiled statements are
+reused through sqlite3's statement cache. Call close() (or use the backend
+as a context manager) to release them.
+Updates: one UPDATE ... RETURNING * that sets only the patched columns; tag
+edits (update_tags) compute the new array in SQL, so neither reads first.
+Older SQLite builds (no RETURNING before 3.35, no upsert before 3.24, JSON1
+not compiled in) get equivalent statements that read back in the same
+transaction instead.
 """
 
 from __future__ import annotations
 
 import json
+import re
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from functools import cache
 from pathlib import Path
 from typing import Any
 
-from task_manager.errors import StorageUnavailable, TaskNotFound
-
-from . import register_backend
-
-_SCHEMA = """
-CREATE TABLE IF NOT EXISTS tasks (
-    id          TEXT PRIMARY KEY,
-    title       TEXT NOT NULL,
-    description TEXT NOT NULL DEFAULT '',
-    status      TEXT NOT NULL DEFAULT 'open',
-    priority    TEXT NOT NULL DEFAULT 'medium',
-    tags        TEXT NOT NULL DEFAULT '[]',
-    project     TEXT,
-    context     TEXT,
-    due_date    TEXT,
-    created_at  TEXT NOT NULL,
-    updated_at  TEXT NOT NULL
-);
-CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
-CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
-CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project);
-"""
+from task_manager.errors import StorageError, StorageUnavailable, TaskNotFound, UpdateConflict
+from task_manager.utils.filters import PRIORITY_RANK, STATUS_RANK, Predicate, parse_sort
+from task_manager.utils.time import utcnow_iso
+
+from . import merge_tags, prefix_upper_bound, register_backend
+from . import sqlite_migrations as migrations
+
+
+def _rank_case(column: str, ranks: dict[str, int]) -> str:
+    whens = " ".join(f"WHEN '{value}' THEN {rank}" for value, rank in ranks.items())
+    return f"CASE {column} {whens} ELSE 99 END"
+
+
+# SQL twin of utils.filters.SORT_KEYS: sort key -> ORDER BY terms (id is appended).
+_ORDER_TERMS: dict[str, tuple[str, ...]] = {
+    "created_at": ("created_at",),
+    "updated_at": ("updated_at",),
+    "priority": (_rank_case("priority", PRIORITY_RANK),),
+    "status": (_rank_case("status", STATUS_RANK),),
+    "due_date": ("due_date IS NULL", "due_date"),
+}
+
+# bm25 column weights: title, description, tags.
+_FTS_WEIGHTS = (10.0, 1.0, 5.0)
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",  # WAL keeps this durable across app crashes
+    "PRAGMA foreign_keys=ON",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-16000",  # KiB
+    "PRAGMA mmap_size=268435456",
+)
+
+_STATEMENT_CACHE_SIZE = 256
+
+# Stay well under SQLITE_MAX_VARIABLE_NUMBER on old builds (999).
+_IN_CHUNK = 500
+
+_SUPPORTS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+_SUPPORTS_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+
+
+@cache
+def _supports_json1() -> bool:
+    """json_each() is built in from 3.38; before that JSON1 is a compile option."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("SELECT value FROM json_each('[]')")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+_INSERT = """INSERT INTO tasks
+   (id, title, description, status, priority, tags,
+    project, context, due_date, created_at, updated_at)
+   VALUES
+   (:id, :title, :description, :status, :priority, :tags,
+    :project, :context, :due_date, :created_at, :updated_at)"""
+
+# create_many() replaces tasks whose ID already exists. An upsert rather than
+# INSERT OR REPLACE: the row keeps its rowid, so the FTS update trigger fires.
+_UPSERT = (
+    _INSERT
+    + """
+   ON CONFLICT(id) DO UPDATE SET
+   title=excluded.title, description=excluded.description, status=excluded.status,
+   priority=excluded.priority, tags=excluded.tags, project=excluded.project,
+   context=excluded.context, due_date=excluded.due_date,
+   created_at=excluded.created_at, updated_at=excluded.updated_at"""
+)
+
+_UPDATE_ALL = """UPDATE tasks SET
+   title=:title, description=:description, status=:status,
+   priority=:priority, tags=:tags, project=:project, context=:context,
+   due_date=:due_date, created_at=:created_at, updated_at=:updated_at
+   WHERE id=:id"""
+
+_UPDATE = """UPDATE tasks SET
+   title=:title, description=:description, status=:status,
+   priority=:priority, tags=:tags, project=:project,
+   context=:context, due_date=:due_date, updated_at=:updated_at
+   WHERE id=:id"""
+
+# Columns a patch may set; id and created_at are fixed at creation.
+_UPDATABLE = (
+    "title",
+    "description",
+    "status",
+    "priority",
+    "tags",
+    "project",
+    "context",
+    "due_date",
+    "updated_at",
+)
+
+# New tags computed in SQL from the stored JSON array: (tags | add) - remove, sorted.
+_UPDATE_TAGS = """UPDATE tasks SET
+   tags=(SELECT json_group_array(value) FROM (
+       SELECT value FROM json_each(tasks.tags)
+       UNION SELECT value FROM json_each(:add)
+       EXCEPT SELECT value FROM json_each(:remove)
+       ORDER BY value)),
+   updated_at=:updated_at
+   WHERE id=:id
+   RETURNING *"""
+
+
+@cache
+def _partial_update(columns: tuple[str, ...], guarded: bool, returning: bool = True) -> str:
+    """UPDATE ... SET only `columns` [RETURNING *], optionally guarded on updated_at."""
+    assignments = ", ".join(f"{column}=:{column}" for column in columns)
+    sql = f"UPDATE tasks SET {assignments} WHERE id=:id"
+    if guarded:
+        sql += " AND updated_at=:expected_updated_at"
+    return sql + " RETURNING *" if returning else sql
 
 
 class SqliteBackend:
     name: str = "sqlite"
 
-    def __init__(self, *, data_dir: Path) -> None:
+    def __init__(self, *, data_dir: Path, auto_migrate: bool = True) -> None:
         self._db_path = Path(data_dir) / "tasks.db"
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_schema()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self._fts: bool | None = None  # resolved on first search
+        if auto_migrate:
+            self.migrate()
+
+    def __enter__(self) -> SqliteBackend:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _connect(self) -> sqlite3.Connection:
+        """Return this thread's connection, opening and tuning it on first use.
+
+        Use as ``with self._connect() as conn:`` for a transaction — the
+        connection context manager commits or rolls back, it does not close.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
         try:
-            conn = sqlite3.connect(str(self._db_path))
+            # check_same_thread=False only so close() can run from any thread;
+            # each connection is still used by the thread that opened it.
+            conn = sqlite3.connect(
+                str(self._db_path),
+                cached_statements=_STATEMENT_CACHE_SIZE,
+                check_same_thread=False,
+            )
             conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA journal_mode=WAL")
-            conn.execute("PRAGMA foreign_keys=ON")
-            return conn
+            for pragma in _PRAGMAS:
+                conn.execute(pragma)
         except sqlite3.Error as exc:
             raise StorageUnavailable(f"Cannot open SQLite DB: {exc}") from exc
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close every connection opened by this backend. Safe to call twice."""
+        with self._lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+    def schema_version(self) -> int:
+        return migrations.schema_version(self._connect())
 
-    def _init_schema(self) -> None:
+    def pending_migrations(self) -> list[migrations.Migration]:
+        return migrations.pending(self._connect())
+
+    def migrate(self) -> list[migrations.Migration]:
+        """Bring the schema up to date. Returns the migrations applied."""
+        conn = self._connect()
+        try:
+            applied = migrations.migrate(conn)
+            self._fts = migrations.ensure_fts(conn)
+        except sqlite3.Error as exc:
+            raise StorageUnavailable(f"SQLite schema migration failed: {exc}") from exc
+        return applied
+
+    def vacuum(self) -> bool:
+        """VACUUM the database, then rebuild the rowid-keyed FTS index.
+
+        Returns whether there was a search index to rebuild.
+        """
+        conn = self._connect()
+        try:
+            conn.execute("VACUUM")
+            return self.rebuild_search_index()
+        except sqlite3.Error as exc:
+            raise StorageUnavailable(f"Cannot vacuum tasks.db: {exc}") from exc
+
+    def rebuild_search_index(self) -> bool:
+        """Rebuild tasks_fts from the tasks table. False if there is no index."""
+        self._fts = None
+        if not self._has_fts():
+            return False
         with self._connect() as conn:
-            conn.executescript(_SCHEMA)
+            conn.execute(migrations.REBUILD_FTS_SQL)
+        return True
+
+    def _has_fts(self) -> bool:
+        if self._fts is None:
+            with self._connect() as conn:
+                self._fts = migrations.has_fts(conn)
+        return self._fts
+
+    def _insert_tags(
+        self, conn: sqlite3.Connection, tagged: Iterable[tuple[str, list[str]]]
+    ) -> None:
+        conn.executemany(
+            "INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)",
+            ((task_id, tag) for task_id, tags in tagged for tag in tags),
+        )
+
+    def _replace_tags(
+        self, conn: sqlite3.Connection, tagged: Iterable[tuple[str, list[str]]]
+    ) -> None:
+        tagged = list(tagged)
+        conn.executemany("DELETE FROM task_tags WHERE task_id = ?", ((t[0],) for t in tagged))
+        self._insert_tags(conn, tagged)
 
     def _row_to_dict(self, row: sqlite3.Row) -> dict[str, Any]:
         d = dict(row)
@@ -79,9 +284,13 @@ class SqliteBackend:
         tags: list[str] | None = None,
         project: str | None = None,
         context: str | None = None,
+        sort_by: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+        where: Predicate | None = None,
     ) -> list[dict[str, Any]]:
         where_clauses: list[str] = []
-        params: list[str] = []
+        params: list[Any] = []
 
         if status:
             placeholders = ",".join("?" * len(status))
@@ -101,67 +310,259 @@ class SqliteBackend:
             where_clauses.append("context = ?")
             params.append(context)
 
+        if tags:
+            # Tasks carrying every requested tag: indexed lookup, grouped per task.
+            tag_set = sorted(set(tags))
+            placeholders = ",".join("?" * len(tag_set))
+            where_clauses.append(
+                f"""id IN (SELECT task_id FROM task_tags WHERE tag IN ({placeholders})
+                           GROUP BY task_id HAVING COUNT(*) = ?)"""
+            )
+            params.extend(tag_set)
+            params.append(len(tag_set))
+
+        if where is not None:
+            clause, clause_params = where.to_sql()
+            where_clauses.append(clause)
+            params.extend(clause_params)
+
+        key, descending = parse_sort(sort_by) if sort_by else ("created_at", False)
+        direction = " DESC" if descending else " ASC"
+        order = ", ".join(term + direction for term in (*_ORDER_TERMS[key], "id"))
+
         sql = "SELECT * FROM tasks"
         if where_clauses:
             sql += " WHERE " + " AND ".join(where_clauses)
-        sql += " ORDER BY created_at ASC"
+        sql += " ORDER BY " + order
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend((-1 if limit is None else limit, offset))
 
         with self._connect() as conn:
             rows = conn.execute(sql, params).fetchall()
-            results = [self._row_to_dict(r) for r in rows]
-
-        # Tags filter in Python — SQLite JSON1 extension not guaranteed
-        if tags:
-            tag_set = set(tags)
-            results = [r for r in results if tag_set.issubset(set(r["tags"]))]
-
-        return results
+        return [self._row_to_dict(r) for r in rows]
 
     def create(self, data: dict[str, Any]) -> dict[str, Any]:
         params = self._dict_to_params(data)
         with self._connect() as conn:
-            conn.execute(
-                """INSERT INTO tasks
-                   (id, title, description, status, priority, tags,
-                    project, context, due_date, created_at, updated_at)
-                   VALUES
-                   (:id, :title, :description, :status, :priority, :tags,
-                    :project, :context, :due_date, :created_at, :updated_at)""",
-                params,
-            )
+            conn.execute(_INSERT, params)
+            self._insert_tags(conn, [(data["id"], data.get("tags", []))])
         return data
 
-    def update(self, task_id: str, patch: dict[str, Any]) -> dict[str, Any]:
-        existing = self.get(task_id)
-        if existing is None:
-            raise TaskNotFound(task_id)
-        merged = {**existing, **patch}
-        params = self._dict_to_params(merged)
+    def update(
+        self, task_id: str, patch: dict[str, Any], *, expected_updated_at: str | None = None
+    ) -> dict[str, Any]:
+        if expected_updated_at is not None and "updated_at" not in patch:
+            patch = {**patch, "updated_at": utcnow_iso()}
+        columns = tuple(column for column in _UPDATABLE if column in patch)
+        if not columns:
+            current = self.get(task_id)
+            if current is None:
+                raise TaskNotFound(task_id)
+            _check_expected(task_id, current.get("updated_at"), expected_updated_at)
+            return current
+
+        # One statement: SET only the patched columns and read the row back.
+        params = {column: patch[column] for column in columns}
+        if "tags" in params:
+            params["tags"] = json.dumps(params["tags"])
         params["id"] = task_id
+        if expected_updated_at is not None:
+            params["expected_updated_at"] = expected_updated_at
+        sql = _partial_update(columns, expected_updated_at is not None, _SUPPORTS_RETURNING)
         with self._connect() as conn:
-            conn.execute(
-                """UPDATE tasks SET
-                   title=:title, description=:description, status=:status,
-                   priority=:priority, tags=:tags, project=:project,
-                   context=:context, due_date=:due_date, updated_at=:updated_at
-                   WHERE id=:id""",
-                params,
-            )
-        return merged
+            if _SUPPORTS_RETURNING:
+                rows = conn.execute(sql, params).fetchall()
+            elif conn.execute(sql, params).rowcount:
+                # Same transaction as the UPDATE, so this reads our own write.
+                rows = conn.execute("SELECT * FROM tasks WHERE id = ?", (task_id,)).fetchall()
+            else:
+                rows = []
+            if not rows:
+                # Missing, or (guarded) changed underneath us; the failure path can
+                # afford a second query to tell which.
+                found = conn.execute(
+                    "SELECT updated_at FROM tasks WHERE id = ?", (task_id,)
+                ).fetchone()
+                if found is None:
+                    raise TaskNotFound(task_id)
+                raise UpdateConflict(task_id, expected_updated_at, found[0])
+            if "tags" in patch:
+                self._replace_tags(conn, [(task_id, patch["tags"])])
+        return self._row_to_dict(rows[0])
+
+    def update_tags(
+        self,
+        task_id: str,
+        *,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+        updated_at: str | None = None,
+    ) -> dict[str, Any]:
+        add, remove = sorted(set(add)), sorted(set(remove))
+        params = {
+            "id": task_id,
+            "add": json.dumps(add),
+            "remove": json.dumps(remove),
+            "updated_at": updated_at or utcnow_iso(),
+        }
+        with self._connect() as conn:
+            if _SUPPORTS_RETURNING and _supports_json1():
+                rows = conn.execute(_UPDATE_TAGS, params).fetchall()
+            else:
+                rows = self._update_tags_by_reading(conn, params, add, remove)
+            if not rows:
+                raise TaskNotFound(task_id)
+            if remove:
+                placeholders = ",".join("?" * len(remove))
+                conn.execute(
+                    f"DELETE FROM task_tags WHERE task_id = ? AND tag IN ({placeholders})",
+                    (task_id, *remove),
+                )
+            self._insert_tags(conn, [(task_id, [tag for tag in add if tag not in remove])])
+        return self._row_to_dict(rows[0])
+
+    def _update_tags_by_reading(
+        self, conn: sqlite3.Connection, params: dict[str, Any], add: list[str], remove: list[str]
+    ) -> list[sqlite3.Row]:
+        """update_tags() for SQLite without RETURNING or JSON1: read, merge, write, read."""
+        conn.execute("BEGIN IMMEDIATE")  # hold the write lock across the read
+        found = conn.execute("SELECT tags FROM tasks WHERE id = ?", (params["id"],)).fetchone()
+        if found is None:
+            return []
+        tags = merge_tags(json.loads(found[0]), add, remove)
+        conn.execute(
+            "UPDATE tasks SET tags = ?, updated_at = ? WHERE id = ?",
+            (json.dumps(tags), params["updated_at"], params["id"]),
+        )
+        return conn.execute("SELECT * FROM tasks WHERE id = ?", (params["id"],)).fetchall()
 
     def delete(self, task_id: str) -> bool:
         with self._connect() as conn:
             cursor = conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
             return cursor.rowcount > 0
 
+    def resolve_prefix(self, prefix: str, limit: int = 10) -> list[str]:
+        # Range scan on the primary key instead of LIKE, which can't use it.
+        upper = prefix_upper_bound(prefix)
+        sql = "SELECT id FROM tasks WHERE id >= ?"
+        params: list[Any] = [prefix]
+        if upper is not None:
+            sql += " AND id < ?"
+            params.append(upper)
+        sql += " ORDER BY id LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute(sql, params)]
+
+    def scan(self, chunk_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
+        # Keyset paging on idx_tasks_created: created_at >= ? is an index range,
+        # the OR only skips the ties already seen. No read transaction is held
+        # between pages.
+        sql = "SELECT * FROM tasks ORDER BY created_at, id LIMIT ?"
+        params: tuple[Any, ...] = (chunk_size,)
+        while True:
+            with self._connect() as conn:
+                rows = conn.execute(sql, params).fetchall()
+            if rows:
+                yield [self._row_to_dict(r) for r in rows]
+            if len(rows) < chunk_size:
+                return
+            last = rows[-1]
+            sql = (
+                "SELECT * FROM tasks WHERE created_at >= ? AND (created_at > ? OR id > ?)"
+                " ORDER BY created_at, id LIMIT ?"
+            )
+            params = (last["created_at"], last["created_at"], last["id"], chunk_size)
+
+    def create_many(self, items: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        created = list(items)
+        with self._connect() as conn:
+            try:
+                if _SUPPORTS_UPSERT:
+                    conn.executemany(_UPSERT, (self._dict_to_params(d) for d in created))
+                else:
+                    params = [self._dict_to_params(d) for d in created]
+                    conn.executemany(_UPDATE_ALL, params)
+                    conn.executemany(_INSERT.replace("INSERT", "INSERT OR IGNORE", 1), params)
+            except sqlite3.IntegrityError as exc:
+                raise StorageError(f"Cannot store tasks: {exc}") from exc
+            self._replace_tags(conn, ((d["id"], d.get("tags", [])) for d in created))
+        return created
+
+    def update_many(self, patches: Mapping[str, dict[str, Any]]) -> list[dict[str, Any]]:
+        ids = list(patches)
+        with self._connect() as conn:
+            existing: dict[str, dict[str, Any]] = {}
+            for start in range(0, len(ids), _IN_CHUNK):
+                chunk = ids[start : start + _IN_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT * FROM tasks WHERE id IN ({placeholders})", chunk)
+                existing.update((r["id"], self._row_to_dict(r)) for r in rows)
+            for task_id in ids:
+                if task_id not in existing:
+                    raise TaskNotFound(task_id)
+
+            merged = [{**existing[task_id], **patches[task_id]} for task_id in ids]
+            conn.executemany(_UPDATE, (self._dict_to_params(m) for m in merged))
+            self._replace_tags(
+                conn, ((m["id"], m["tags"]) for m in merged if "tags" in patches[m["id"]])
+            )
+        return merged
+
+    def delete_many(self, task_ids: Iterable[str]) -> int:
+        with self._connect() as conn:
+            cursor = conn.executemany(
+                "DELETE FROM tasks WHERE id = ?", ((task_id,) for task_id in task_ids)
+            )
+            return cursor.rowcount
+
     def search(self, query: str) -> list[dict[str, Any]]:
-        q = f"%{query}%"
+        """Ranked full-text search. Words match as prefixes; "quoted text" as a phrase."""
+        match = _fts_query(query) if self._has_fts() else None
         with self._connect() as conn:
-            rows = conn.execute(
-                "SELECT * FROM tasks WHERE title LIKE ? OR description LIKE ?",
-                (q, q),
-            ).fetchall()
+            if match:
+                weights = ", ".join(str(w) for w in _FTS_WEIGHTS)
+                rows = conn.execute(
+                    f"""SELECT tasks.* FROM tasks_fts
+                        JOIN tasks ON tasks.rowid = tasks_fts.rowid
+                        WHERE tasks_fts MATCH ?
+                        ORDER BY bm25(tasks_fts, {weights})""",
+                    (match,),
+                ).fetchall()
+            else:
+                # Tags through task_tags, not the JSON text, so '"' or ',' don't match everything.
+                q = "%" + re.sub(r"([\\%_])", r"\\\1", query) + "%"
+                rows = conn.execute(
+                    r"""SELECT * FROM tasks
+                        WHERE title LIKE ? ESCAPE '\' OR description LIKE ? ESCAPE '\'
+                           OR id IN (SELECT task_id FROM task_tags WHERE tag LIKE ? ESCAPE '\')""",
+                    (q, q, q),
+                ).fetchall()
         return [self._row_to_dict(r) for r in rows]
 
 
+def _check_expected(task_id: str, actual: str | None, expected: str | None) -> None:
+    if expected is not None and actual != expected:
+        raise UpdateConflict(task_id, expected, actual)
+
+
+def _fts_query(query: str) -> str | None:
+    """Translate user input into an FTS5 MATCH expression.
+
+    'auth "login page"' -> '"auth"* "login page"' — every bare word is a prefix
+    term, quoted text is a phrase, all terms AND-ed. Everything is quoted, so
+    FTS5 operators and punctuation in user input can't cause syntax errors.
+    None if the input has no terms.
+    """
+    terms: list[str] = []
+    for i, part in enumerate(query.split('"')):
+        if i % 2:  # inside quotes
+            if part.strip():
+                terms.append('"' + part.strip() + '"')
+        else:
+            terms.extend('"' + word + '"*' for word in part.split())
+    return " ".join(terms) or None
+
+
 register_backend("sqlite", SqliteBackend)
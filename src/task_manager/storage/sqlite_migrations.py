@@ -0,0 +1,228 @@
+"""Versioned schema migrations for the SQLite backend.
+
+The schema version lives in PRAGMA user_version. Each migration runs in its
+own IMMEDIATE transaction together with the version bump, so a failed step
+leaves the database at the previous version. Steps use IF NOT EXISTS so
+databases created before versioning (user_version = 0) upgrade cleanly.
+
+Adding a schema change: append a Migration with the next version number.
+Never edit or reorder a released step.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from functools import cache
+
+from task_manager.errors import StorageUnavailable
+
+_TASKS_SQL = """
+CREATE TABLE IF NOT EXISTS tasks (
+    id          TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    status      TEXT NOT NULL DEFAULT 'open',
+    priority    TEXT NOT NULL DEFAULT 'medium',
+    tags        TEXT NOT NULL DEFAULT '[]',
+    project     TEXT,
+    context     TEXT,
+    due_date    TEXT,
+    created_at  TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
+CREATE INDEX IF NOT EXISTS idx_tasks_project ON tasks(project);
+"""
+
+# One row per (task, tag); tasks.tags stays the source for reads.
+_TAGS_SQL = """
+CREATE TABLE IF NOT EXISTS task_tags (
+    task_id TEXT NOT NULL REFERENCES tasks(id) ON DELETE CASCADE,
+    tag     TEXT NOT NULL,
+    PRIMARY KEY (task_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_task_tags_tag ON task_tags(tag, task_id);
+"""
+
+# External-content FTS5 table: the text lives in tasks, the index in tasks_fts.
+# Tag JSON ('["a","b"]') tokenizes to its tag words under unicode61.
+# Keyed on the implicit rowid, which VACUUM may renumber: SqliteBackend.vacuum()
+# (`task db vacuum`) rebuilds it afterwards with REBUILD_FTS_SQL.
+_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+    title, description, tags,
+    content='tasks', content_rowid='rowid',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS tasks_fts_ai AFTER INSERT ON tasks BEGIN
+    INSERT INTO tasks_fts(rowid, title, description, tags)
+    VALUES (new.rowid, new.title, new.description, new.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_ad AFTER DELETE ON tasks BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description, tags)
+    VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+END;
+CREATE TRIGGER IF NOT EXISTS tasks_fts_au AFTER UPDATE OF title, description, tags ON tasks
+BEGIN
+    INSERT INTO tasks_fts(tasks_fts, rowid, title, description, tags)
+    VALUES ('delete', old.rowid, old.title, old.description, old.tags);
+    INSERT INTO tasks_fts(rowid, title, description, tags)
+    VALUES (new.rowid, new.title, new.description, new.tags);
+END;
+INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild');
+"""
+REBUILD_FTS_SQL = "INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')"
+
+
+# Match the ORDER BY terms SqliteBackend.list generates, so LIMITed sorted
+# listings walk an index instead of sorting every row. The priority
+# expression must stay identical to the backend's for the planner to use it.
+_SORT_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_updated ON tasks(updated_at, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_due ON tasks(due_date IS NULL, due_date, id);
+CREATE INDEX IF NOT EXISTS idx_tasks_priority_rank ON tasks(
+    (CASE priority WHEN 'urgent' THEN 0 WHEN 'high' THEN 1
+                   WHEN 'medium' THEN 2 WHEN 'low' THEN 3 ELSE 99 END),
+    id
+);
+"""
+
+# Range and equality terms from `task list --query` on the remaining columns.
+_QUERY_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS idx_tasks_due_date ON tasks(due_date);
+CREATE INDEX IF NOT EXISTS idx_tasks_context ON tasks(context);
+"""
+
+
+def _statements(script: str) -> Iterator[str]:
+    """Split a script into statements (trigger bodies contain semicolons)."""
+    buf = ""
+    for piece in script.split(";"):
+        buf += piece + ";"
+        if sqlite3.complete_statement(buf):
+            if buf.strip(" \n;"):
+                yield buf.strip()
+            buf = ""
+
+
+def _run_sql(script: str) -> Callable[[sqlite3.Connection], None]:
+    def apply(conn: sqlite3.Connection) -> None:
+        for statement in _statements(script):
+            conn.execute(statement)
+
+    return apply
+
+
+def _create_task_tags(conn: sqlite3.Connection) -> None:
+    _run_sql(_TAGS_SQL)(conn)
+    rows = conn.execute("SELECT id, tags FROM tasks")
+    conn.executemany(
+        "INSERT OR IGNORE INTO task_tags (task_id, tag) VALUES (?, ?)",
+        ((task_id, tag) for task_id, tags in rows for tag in json.loads(tags)),
+    )
+
+
+def _create_fts(conn: sqlite3.Connection) -> None:
+    try:
+        _run_sql(_FTS_SQL)(conn)
+    except sqlite3.OperationalError as exc:
+        # SQLite built without FTS5: search falls back to LIKE.
+        if "fts5" not in str(exc):
+            raise
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    description: str
+    apply: Callable[[sqlite3.Connection], None]
+
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "tasks table and column indexes", _run_sql(_TASKS_SQL)),
+    Migration(2, "task_tags table for indexed tag filters", _create_task_tags),
+    Migration(3, "FTS5 full-text index (skipped without FTS5)", _create_fts),
+    Migration(4, "indexes for sorted, paginated listing", _run_sql(_SORT_INDEX_SQL)),
+    Migration(5, "indexes for query filters on due_date and context", _run_sql(_QUERY_INDEX_SQL)),
+)
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def pending(conn: sqlite3.Connection) -> list[Migration]:
+    version = schema_version(conn)
+    if version > LATEST_VERSION:
+        raise StorageUnavailable(
+            f"tasks.db schema version {version} is newer than this task-manager "
+            f"supports ({LATEST_VERSION}); upgrade task-manager"
+        )
+    return [m for m in MIGRATIONS if m.version > version]
+
+
+def has_fts(conn: sqlite3.Connection) -> bool:
+    row = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'")
+    return row.fetchone() is not None
+
+
+@cache
+def fts5_available() -> bool:
+    """Whether this SQLite build has FTS5. Probed once, on a :memory: database."""
+    conn = sqlite3.connect(":memory:")
+    try:
+        conn.execute("CREATE VIRTUAL TABLE probe USING fts5(body)")
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+    return True
+
+
+def ensure_fts(conn: sqlite3.Connection) -> bool:
+    """Create the FTS index if migration 3 skipped it and FTS5 is available now.
+
+    Migration 3 is recorded even on a SQLite without FTS5, so a later SQLite
+    with FTS5 would otherwise never get the index. Returns whether it exists.
+    Only takes the write lock when it is going to create the index.
+    """
+    if has_fts(conn):
+        return True
+    if not fts5_available() or schema_version(conn) < 3:
+        return False  # nothing to build with, or migration 3 itself will create it
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if not has_fts(conn):
+            _create_fts(conn)
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+    return has_fts(conn)
+
+
+def migrate(conn: sqlite3.Connection) -> list[Migration]:
+    """Apply pending migrations in order. Returns the ones applied."""
+    applied: list[Migration] = []
+    for migration in pending(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-check under the write lock: another process may have migrated.
+            if schema_version(conn) >= migration.version:
+                conn.rollback()
+                continue
+            migration.apply(conn)
+            conn.execute(f"PRAGMA user_version = {migration.version}")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+        applied.append(migration)
+    return applied
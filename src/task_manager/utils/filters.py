@@ -1,38 +1,357 @@
-"""Task filtering predicates — shared between storage backends."""
+"""Task filtering predicates and sort orders — shared between storage backends.
+
+Predicates are small immutable trees (In, HasTags, Untagged, Compare, And, Or, Not) that
+combine with &, | and ~. They evaluate in two ways:
+
+  - pred.compile() generates one Python lambda for the whole tree, cheap
+    checks first, no per-row sets; pred.select(rows) generates the whole list
+    comprehension, so a filter is one pass with no per-row function call.
+    Generated code is cached (LRU, 256 predicates), so equal predicates built
+    on later calls reuse it.
+  - pred.to_sql() renders a WHERE fragment over the SQLite schema, with NULLs
+    handled so NOT behaves as it does in Python (a missing value never matches
+    a comparison, so NOT of that comparison does).
+
+apply_filters() and the backends' list(where=...) are built on them.
+"""
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import count, islice
 from typing import Any
 
+from task_manager.contracts import Priority, Status
 
-def apply_filters(
+# Position in the "natural" order of each enum: most urgent / most active first.
+PRIORITY_RANK = {p.value: i for i, p in enumerate(reversed(Priority))}
+STATUS_RANK = {s.value: i for i, s in enumerate(Status)}
+
+# sort key -> (row key function, descending by default). Every key ends in the
+# ID so orderings are total and pages never overlap.
+SORT_KEYS: dict[str, tuple[Callable[[dict[str, Any]], Any], bool]] = {
+    "created_at": (lambda t: (t.get("created_at", ""), t["id"]), False),
+    "updated_at": (lambda t: (t.get("updated_at", ""), t["id"]), True),
+    "priority": (lambda t: (PRIORITY_RANK.get(t.get("priority"), 99), t["id"]), False),
+    "status": (lambda t: (STATUS_RANK.get(t.get("status"), 99), t["id"]), False),
+    "due_date": (lambda t: (t.get("due_date") is None, t.get("due_date") or "", t["id"]), False),
+}
+
+
+def parse_sort(sort_by: str) -> tuple[str, bool]:
+    """'-due_date' -> ('due_date', descending). A leading '-' flips the natural order.
+
+    Natural orders: priority urgent first, status open first, due_date soonest
+    first (undated last), updated_at newest first, created_at oldest first.
+    """
+    key = sort_by.lstrip("-")
+    if key not in SORT_KEYS:
+        raise ValueError(f"Unknown sort key {key!r}. Choose from: {', '.join(SORT_KEYS)}")
+    return key, SORT_KEYS[key][1] ^ sort_by.startswith("-")
+
+
+def sort_and_page(
     tasks: list[dict[str, Any]],
+    *,
+    sort_by: str | None = None,
+    limit: int | None = None,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Order and slice filtered tasks. A limit uses a bounded heap, not a full sort."""
+    if sort_by is None:
+        stop = None if limit is None else offset + limit
+        return list(islice(tasks, offset, stop))
+
+    key, descending = parse_sort(sort_by)
+    keyfunc = SORT_KEYS[key][0]
+    if limit is None:
+        ordered = sorted(tasks, key=keyfunc, reverse=descending)
+    elif descending:
+        ordered = heapq.nlargest(offset + limit, tasks, key=keyfunc)
+    else:
+        ordered = heapq.nsmallest(offset + limit, tasks, key=keyfunc)
+    return ordered[offset:]
+
+
+# Fields each node may test; they are also the SQL column names.
+MATCH_FIELDS = ("status", "priority", "project", "context", "due_date")
+RANGE_FIELDS = ("due_date", "created_at", "updated_at")
+_NULLABLE = frozenset({"project", "context", "due_date"})
+_OPERATORS = ("<", "<=", ">", ">=")
+
+Row = dict[str, Any]
+
+
+class Predicate:
+    """Base of the predicate tree. Subclasses are frozen, hashable dataclasses."""
+
+    __slots__ = ()
+
+    # Rough per-row cost, used to order And/Or children cheapest first.
+    cost: int = 1
+
+    def __and__(self, other: Predicate) -> Predicate:
+        return And((self, other))
+
+    def __or__(self, other: Predicate) -> Predicate:
+        return Or((self, other))
+
+    def __invert__(self) -> Predicate:
+        return Not(self)
+
+    def compile(self) -> Callable[[Row], bool]:
+        return _compile(self)
+
+    def __call__(self, row: Row) -> bool:
+        return _compile(self)(row)
+
+    def select(self, rows: Iterable[Row]) -> list[Row]:
+        """The rows that match, in order: one pass, no per-row function call."""
+        return _compile_select(self)(rows)
+
+    def to_sql(self) -> tuple[str, list[Any]]:
+        """WHERE fragment and its parameters, over the tasks table."""
+        params: list[Any] = []
+        return self._sql(params), params
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        raise NotImplementedError
+
+    def _sql(self, params: list[Any]) -> str:
+        raise NotImplementedError
+
+
+def _const(ns: dict[str, Any], names: count, value: Any) -> str:
+    name = f"_c{next(names)}"
+    ns[name] = value
+    return name
+
+
+@dataclass(frozen=True, slots=True)
+class In(Predicate):
+    """field is one of values (None matches a missing value)."""
+
+    field: str
+    values: tuple[str | None, ...]
+
+    def __post_init__(self) -> None:
+        if self.field not in MATCH_FIELDS:
+            raise ValueError(f"Cannot match on {self.field!r}. Choose from: {MATCH_FIELDS}")
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        if not self.values:
+            return "False"
+        if len(self.values) == 1:
+            (value,) = self.values
+            if value is None:
+                return f"t.get({self.field!r}) is None"
+            return f"t.get({self.field!r}) == {_const(ns, names, value)}"
+        return f"t.get({self.field!r}) in {_const(ns, names, frozenset(self.values))}"
+
+    def _sql(self, params: list[Any]) -> str:
+        present = [v for v in self.values if v is not None]
+        terms = []
+        if present:
+            params.extend(present)
+            term = f"{self.field} IN ({','.join('?' * len(present))})"
+            if self.field in _NULLABLE:
+                term = f"({self.field} IS NOT NULL AND {term})"
+            terms.append(term)
+        if None in self.values:
+            terms.append(f"{self.field} IS NULL")
+        return "(" + " OR ".join(terms) + ")" if terms else "0"
+
+
+@dataclass(frozen=True, slots=True)
+class HasTags(Predicate):
+    """The task carries every one of tags."""
+
+    tags: tuple[str, ...]
+    cost = 3
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        if not self.tags:
+            return "True"
+        held = f"_t{next(names)}"
+        checks = [f"{_const(ns, names, self.tags[0])} in ({held} := t.get('tags') or ())"]
+        checks += [f"{_const(ns, names, tag)} in {held}" for tag in self.tags[1:]]
+        return "(" + " and ".join(checks) + ")"
+
+    def _sql(self, params: list[Any]) -> str:
+        tags = sorted(set(self.tags))
+        if not tags:
+            return "1"
+        params.extend(tags)
+        params.append(len(tags))
+        return (
+            f"id IN (SELECT task_id FROM task_tags WHERE tag IN ({','.join('?' * len(tags))})"
+            " GROUP BY task_id HAVING COUNT(*) = ?)"
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Untagged(Predicate):
+    """The task carries no tags."""
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        return "(not t.get('tags'))"
+
+    def _sql(self, params: list[Any]) -> str:
+        return "NOT EXISTS (SELECT 1 FROM task_tags WHERE task_tags.task_id = tasks.id)"
+
+
+@dataclass(frozen=True, slots=True)
+class Compare(Predicate):
+    """field <op> value on ISO strings. A missing value never matches."""
+
+    field: str
+    op: str
+    value: str
+    cost = 2
+
+    def __post_init__(self) -> None:
+        if self.field not in RANGE_FIELDS:
+            raise ValueError(f"Cannot compare {self.field!r}. Choose from: {RANGE_FIELDS}")
+        if self.op not in _OPERATORS:
+            raise ValueError(f"Unknown operator {self.op!r}. Choose from: {_OPERATORS}")
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        value = f"_v{next(names)}"
+        bound = _const(ns, names, self.value)
+        return f"(({value} := t.get({self.field!r})) is not None and {value} {self.op} {bound})"
+
+    def _sql(self, params: list[Any]) -> str:
+        params.append(self.value)
+        if self.field in _NULLABLE:
+            return f"({self.field} IS NOT NULL AND {self.field} {self.op} ?)"
+        return f"{self.field} {self.op} ?"
+
+
+def _by_cost(children: tuple[Predicate, ...]) -> list[Predicate]:
+    return sorted(children, key=lambda child: child.cost)  # stable: ties keep their order
+
+
+@dataclass(frozen=True, slots=True)
+class And(Predicate):
+    children: tuple[Predicate, ...]
+
+    @property
+    def cost(self) -> int:  # type: ignore[override]
+        return sum(child.cost for child in self.children)
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        if not self.children:
+            return "True"
+        return "(" + " and ".join(c._py(ns, names) for c in _by_cost(self.children)) + ")"
+
+    def _sql(self, params: list[Any]) -> str:
+        if not self.children:
+            return "1"
+        return "(" + " AND ".join(c._sql(params) for c in _by_cost(self.children)) + ")"
+
+
+@dataclass(frozen=True, slots=True)
+class Or(Predicate):
+    children: tuple[Predicate, ...]
+
+    @property
+    def cost(self) -> int:  # type: ignore[override]
+        return sum(child.cost for child in self.children)
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        if not self.children:
+            return "False"
+        return "(" + " or ".join(c._py(ns, names) for c in _by_cost(self.children)) + ")"
+
+    def _sql(self, params: list[Any]) -> str:
+        if not self.children:
+            return "0"
+        return "(" + " OR ".join(c._sql(params) for c in _by_cost(self.children)) + ")"
+
+
+@dataclass(frozen=True, slots=True)
+class Not(Predicate):
+    child: Predicate
+
+    @property
+    def cost(self) -> int:  # type: ignore[override]
+        return self.child.cost
+
+    def _py(self, ns: dict[str, Any], names: count) -> str:
+        return f"(not {self.child._py(ns, names)})"
+
+    def _sql(self, params: list[Any]) -> str:
+        return f"(NOT {self.child._sql(params)})"
+
+
+# Generated code per predicate, bounded: query dates (today, -7d) and API
+# callers keep producing new predicates in long-running processes.
+_COMPILED_CACHE_SIZE = 256
+
+
+def _generate(template: str, predicate: Predicate) -> Any:
+    ns: dict[str, Any] = {}
+    # Constants are bound through `ns`, never spliced into the source.
+    return eval(template.format(predicate._py(ns, count())), ns)  # noqa: S307
+
+
+@lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _compile(predicate: Predicate) -> Callable[[Row], bool]:
+    return _generate("lambda t: {}", predicate)
+
+
+@lru_cache(maxsize=_COMPILED_CACHE_SIZE)
+def _compile_select(predicate: Predicate) -> Callable[[Iterable[Row]], list[Row]]:
+    return _generate("lambda rows: [t for t in rows if {}]", predicate)
+
+
+def filter_predicate(
     *,
     status: list[str] | None = None,
     priority: list[str] | None = None,
     tags: list[str] | None = None,
     project: str | None = None,
     context: str | None = None,
-) -> list[dict[str, Any]]:
-    """Filter a list of task dicts by the given criteria. All filters are AND-combined."""
-    result = tasks
-
+) -> Predicate | None:
+    """The list() keyword filters as one predicate. None when nothing filters."""
+    parts: list[Predicate] = []
     if status:
-        status_set = set(status)
-        result = [t for t in result if t.get("status") in status_set]
-
+        parts.append(In("status", tuple(sorted(set(status)))))
     if priority:
-        priority_set = set(priority)
-        result = [t for t in result if t.get("priority") in priority_set]
-
+        parts.append(In("priority", tuple(sorted(set(priority)))))
+    if project is not None:
+        parts.append(In("project", (project,)))
+    if context is not None:
+        parts.append(In("context", (context,)))
     if tags:
-        tag_set = set(tags)
-        result = [t for t in result if tag_set.issubset(set(t.get("tags", [])))]
+        parts.append(HasTags(tuple(sorted(set(tags)))))
+    if not parts:
+        return None
+    return parts[0] if len(parts) == 1 else And(tuple(parts))
 
-    if project is not None:
-        result = [t for t in result if t.get("project") == project]
 
-    if context is not None:
-        result = [t for t in result if t.get("context") == context]
+def apply_filters(
+    tasks: list[dict[str, Any]],
+    *,
+    status: list[str] | None = None,
+    priority: list[str] | None = None,
+    tags: list[str] | None = None,
+    project: str | None = None,
+    context: str | None = None,
+    where: Predicate | None = None,
+) -> list[dict[str, Any]]:
+    """Filter a list of task dicts by the given criteria. All filters are AND-combined.
 
-    return result
+    One pass over `tasks`, whatever the number of criteria.
+    """
+    predicate = filter_predicate(
+        status=status, priority=priority, tags=tags, project=project, context=context
+    )
+    if where is not None:
+        predicate = where if predicate is None else And((predicate, where))
+    if predicate is None:
+        return tasks
+    return predicate.select(tasks)
@@ -0,0 +1,293 @@
+"""Query expressions for `task list --query`, parsed into utils.filters predicates.
+
+    due<today and priority>=high and not tag:blocked
+    (status:open,in_progress or project=none) created>=-7d
+
+Terms are FIELD OP VALUE. Terms side by side are AND-ed; `and`, `or`, `not`
+and parentheses combine them (not binds tightest, then and, then or).
+
+    status, priority   `:` or `=` (one of a comma list), `!=`; priority also
+                       < <= > >=, where greater means more urgent
+    project, context   `:` `=` `!=`; unquoted `none` means unset
+    tag, tags          `:` `=` (has every listed tag), `!=` (lacks them);
+                       `tag:none` means no tags
+    due                any operator; `due:none` means no due date
+    created, updated   any operator, by calendar day (UTC)
+
+Dates are YYYY-MM-DD, today, tomorrow, yesterday, or an offset from today
+such as -7d, +2w. Today is the local date for due, the UTC date for created
+and updated. Values with spaces or operator characters can be quoted.
+
+The result is an ordinary Predicate: backends evaluate it in Python or, for
+SQLite, as parameterized SQL.
+"""
+
+from __future__ import annotations
+
+import re
+from datetime import date, datetime, timedelta, timezone
+
+from task_manager.contracts import Priority, Status
+from task_manager.utils.filters import (
+    PRIORITY_RANK,
+    And,
+    Compare,
+    HasTags,
+    In,
+    Not,
+    Or,
+    Predicate,
+    Untagged,
+)
+
+_TOKEN = re.compile(
+    r"""\s*(?:
+        (?P<paren>[()])
+      | (?P<op><=|>=|!=|<|>|=|:)
+      | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<word>[^\s()<>=!:"']+)
+    )""",
+    re.VERBOSE,
+)
+_KEYWORDS = frozenset({"and", "or", "not"})
+_OFFSET = re.compile(r"([+-]\d+)([dw])")
+
+_FIELDS = {
+    "status": "status",
+    "priority": "priority",
+    "project": "project",
+    "context": "context",
+    "tag": "tags",
+    "tags": "tags",
+    "due": "due_date",
+    "created": "created_at",
+    "updated": "updated_at",
+}
+_CHOICES = {
+    "status": tuple(s.value for s in Status),
+    "priority": tuple(p.value for p in Priority),
+}
+_ORDERING = frozenset({"<", "<=", ">", ">="})
+
+
+class _Token:
+    __slots__ = ("kind", "text", "pos")
+
+    def __init__(self, kind: str, text: str, pos: int) -> None:
+        self.kind = kind
+        self.text = text
+        self.pos = pos
+
+
+def _tokenize(text: str) -> list[_Token]:
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN.match(text, pos)
+        if match is None or match.end() == pos:
+            if not text[pos:].strip():
+                break
+            raise ValueError(f"Unexpected {text[pos]!r} at position {pos + 1}")
+        kind = match.lastgroup
+        if kind is not None:
+            value, start = match.group(kind), match.start(kind)
+            if kind == "word" and value.lower() in _KEYWORDS:
+                kind, value = "keyword", value.lower()
+            tokens.append(_Token(kind, value, start))
+        pos = match.end()
+    return tokens
+
+
+class _Parser:
+    def __init__(self, text: str, today: date, utc_today: date) -> None:
+        self.tokens = _tokenize(text)
+        self.index = 0
+        self.today = today
+        self.utc_today = utc_today
+
+    def peek(self) -> _Token | None:
+        return self.tokens[self.index] if self.index < len(self.tokens) else None
+
+    def take(self) -> _Token:
+        token = self.peek()
+        if token is None:
+            raise ValueError("Unexpected end of query")
+        self.index += 1
+        return token
+
+    def accept(self, kind: str, text: str) -> bool:
+        token = self.peek()
+        if token is not None and token.kind == kind and token.text == text:
+            self.index += 1
+            return True
+        return False
+
+    def parse(self) -> Predicate:
+        if not self.tokens:
+            raise ValueError("Empty query")
+        predicate = self.disjunction()
+        token = self.peek()
+        if token is not None:
+            raise ValueError(f"Unexpected {token.text!r} at position {token.pos + 1}")
+        return predicate
+
+    def disjunction(self) -> Predicate:
+        parts = [self.conjunction()]
+        while self.accept("keyword", "or"):
+            parts.append(self.conjunction())
+        return parts[0] if len(parts) == 1 else Or(tuple(parts))
+
+    def conjunction(self) -> Predicate:
+        parts = [self.unary()]
+        while True:
+            if self.accept("keyword", "and"):
+                parts.append(self.unary())
+                continue
+            token = self.peek()
+            if token is None or token.text in (")", "or"):
+                break
+            parts.append(self.unary())  # juxtaposed terms are AND-ed
+        return parts[0] if len(parts) == 1 else And(tuple(parts))
+
+    def unary(self) -> Predicate:
+        if self.accept("keyword", "not"):
+            return Not(self.unary())
+        if self.accept("paren", "("):
+            predicate = self.disjunction()
+            if not self.accept("paren", ")"):
+                token = self.peek()
+                where = f"position {token.pos + 1}" if token else "end of query"
+                raise ValueError(f"Expected ')' at {where}")
+            return predicate
+        return self.term()
+
+    def term(self) -> Predicate:
+        token = self.take()
+        if token.kind != "word":
+            raise ValueError(f"Expected a field name at position {token.pos + 1}")
+        field = _FIELDS.get(token.text.lower())
+        if field is None:
+            raise ValueError(
+                f"Unknown field {token.text!r} at position {token.pos + 1}. "
+                f"Choose from: {', '.join(sorted(_FIELDS))}"
+            )
+        op = self.take()
+        if op.kind != "op":
+            raise ValueError(f"Expected an operator after {token.text!r}")
+        value = self.take()
+        if value.kind not in ("word", "string"):
+            raise ValueError(f"Expected a value at position {value.pos + 1}")
+        # Timestamps are stored in UTC, so their "today" is the UTC date.
+        today = self.utc_today if field in ("created_at", "updated_at") else self.today
+        try:
+            return _term(field, "=" if op.text == ":" else op.text, value, today)
+        except ValueError as exc:
+            raise ValueError(f"{exc} (at position {token.pos + 1})") from None
+
+
+def _unquote(token: _Token) -> str:
+    if token.kind == "string":
+        return re.sub(r"\\(.)", r"\1", token.text[1:-1])
+    return token.text
+
+
+def _values(field: str, token: _Token) -> tuple[str | None, ...]:
+    if token.kind == "string":
+        raw = [_unquote(token)]
+    else:
+        raw = [v for v in token.text.split(",") if v]
+    values: list[str | None] = []
+    for value in raw:
+        if field in _CHOICES:
+            value = value.lower()
+            if value not in _CHOICES[field]:
+                raise ValueError(f"Unknown {field} {value!r}. Choose from: {_CHOICES[field]}")
+        elif token.kind == "word" and value.lower() == "none":
+            values.append(None)
+            continue
+        values.append(value)
+    if not values:
+        raise ValueError(f"Missing value for {field}")
+    return tuple(values)
+
+
+def _date(token: _Token, today: date) -> date:
+    text = _unquote(token).lower()
+    named = {"today": 0, "tomorrow": 1, "yesterday": -1}
+    if text in named:
+        return today + timedelta(days=named[text])
+    if offset := _OFFSET.fullmatch(text):
+        amount, unit = int(offset.group(1)), offset.group(2)
+        return today + timedelta(days=amount * (7 if unit == "w" else 1))
+    try:
+        return date.fromisoformat(text)
+    except ValueError:
+        raise ValueError(
+            f"Cannot parse date {text!r}: use YYYY-MM-DD, today, tomorrow, "
+            "yesterday or an offset like -7d"
+        ) from None
+
+
+def _term(field: str, op: str, token: _Token, today: date) -> Predicate:
+    if field in ("created_at", "updated_at", "due_date"):
+        if field == "due_date" and token.kind == "word" and token.text.lower() == "none":
+            if op not in ("=", "!="):
+                raise ValueError("due=none only supports = and !=")
+            missing = In("due_date", (None,))
+            return missing if op == "=" else Not(missing)
+        return _date_term(field, op, _date(token, today))
+
+    values = _values(field, token)
+    if field == "tags":
+        if op not in ("=", "!="):
+            raise ValueError(f"tag does not support {op!r}")
+        if None in values:
+            if len(values) > 1:
+                raise ValueError("tag:none cannot be combined with other tags")
+            match: Predicate = Untagged()
+        else:
+            match = HasTags(values)  # type: ignore[arg-type]
+        return match if op == "=" else Not(match)
+    if op in _ORDERING:
+        if field != "priority":
+            raise ValueError(f"{field} does not support {op!r}")
+        if len(values) != 1:
+            raise ValueError(f"priority{op} takes a single priority")
+        rank = PRIORITY_RANK[values[0]]
+        # Lower rank is more urgent; "priority>=high" means high or more urgent.
+        keep = {
+            "<": lambda r: r > rank,
+            "<=": lambda r: r >= rank,
+            ">": lambda r: r < rank,
+            ">=": lambda r: r <= rank,
+        }[op]
+        return In(field, tuple(p for p, r in PRIORITY_RANK.items() if keep(r)))
+    match = In(field, values)
+    return match if op == "=" else Not(match)
+
+
+def _date_term(field: str, op: str, day: date) -> Predicate:
+    start = day.isoformat()
+    if field == "due_date":
+        if op in ("=", "!="):
+            match = In("due_date", (start,))
+            return match if op == "=" else Not(match)
+        return Compare(field, op, start)
+    # Timestamps: a date means that whole day.
+    end = (day + timedelta(days=1)).isoformat()
+    bounds = {"<": ("<", start), ">=": (">=", start), "<=": ("<", end), ">": (">=", end)}
+    if op in bounds:
+        return Compare(field, *bounds[op])
+    within = And((Compare(field, ">=", start), Compare(field, "<", end)))
+    return within if op == "=" else Not(within)
+
+
+def parse_query(text: str, *, today: date | None = None) -> Predicate:
+    """Parse a query expression. Raises ValueError with the position on bad input.
+
+    `today` anchors relative dates for every field; by default due uses the
+    local date and created/updated the UTC date.
+    """
+    if today is not None:
+        return _Parser(text, today, today).parse()
+    return _Parser(text, date.today(), datetime.now(timezone.utc).date()).parse()
@@ -0,0 +1,137 @@
+"""Streaming readers/writers for task interchange formats (JSON Lines, CSV).
+
+Everything here works on storage dicts and generators, one row at a time, so
+memory use stays flat regardless of file size. Validation is the caller's job.
+
+JSON is encoded with orjson when it is installed (`pip install
+cli-task-manager[fast]`) and with the stdlib encoder otherwise; both produce
+compact, non-ASCII-preserving output.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from itertools import islice
+from pathlib import Path
+from typing import IO, Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
+FORMATS = ("jsonl", "csv")
+
+CSV_FIELDS = (
+    "id",
+    "title",
+    "description",
+    "status",
+    "priority",
+    "tags",
+    "project",
+    "context",
+    "due_date",
+    "created_at",
+    "updated_at",
+)
+
+
+_json_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def dumps(obj: Any) -> str:
+    """Compact JSON text for one storage row (or any JSON-able value)."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str).decode()
+    return _json_encoder.encode(obj)
+
+
+def detect_format(path: str) -> str | None:
+    """Guess the format from a file suffix. None if unknown (or stdin)."""
+    suffix = Path(path).suffix.lower()
+    if suffix in (".jsonl", ".ndjson"):
+        return "jsonl"
+    if suffix == ".csv":
+        return "csv"
+    return None
+
+
+def open_stream(path: str, mode: str = "r") -> AbstractContextManager[IO[str]]:
+    """Open `path` as text for reading or writing; '-' is stdin/stdout, left open on exit.
+
+    Newline translation is off because the csv module does its own.
+    """
+    if path == "-":
+        return nullcontext(sys.stdin if mode == "r" else sys.stdout)
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+def iter_jsonl(stream: IO[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (line_number, record) for each non-blank line."""
+    for lineno, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"line {lineno}: invalid JSON: {exc}") from exc
+        if not isinstance(record, dict):
+            raise ValueError(f"line {lineno}: expected a JSON object")
+        yield lineno, record
+
+
+def iter_csv(stream: IO[str]) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Yield (line_number, record) for each CSV row.
+
+    Empty cells are dropped so model defaults apply. Tags stay a comma-separated
+    string — Task normalizes that.
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, {k: v for k, v in row.items() if k and v not in ("", None)}
+
+
+def jsonl_writer(stream: IO[str]) -> Callable[[Iterable[dict[str, Any]]], int]:
+    """Return a function that appends rows as JSON Lines and returns the count."""
+
+    def write(rows: Iterable[dict[str, Any]]) -> int:
+        count = 0
+        for row in rows:
+            stream.write(dumps(row) + "\n")
+            count += 1
+        return count
+
+    return write
+
+
+def csv_writer(stream: IO[str]) -> Callable[[Iterable[dict[str, Any]]], int]:
+    """Write the CSV header now; return a function that appends rows."""
+    writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction="ignore")
+    writer.writeheader()
+
+    def write(rows: Iterable[dict[str, Any]]) -> int:
+        count = 0
+        for row in rows:
+            cells = {k: ("" if v is None else v) for k, v in row.items()}
+            cells["tags"] = ",".join(row.get("tags", []))
+            writer.writerow(cells)
+            count += 1
+        return count
+
+    return write
+
+
+READERS = {"jsonl": iter_jsonl, "csv": iter_csv}
+WRITERS = {"jsonl": jsonl_writer, "csv": csv_writer}
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Split an iterable into lists of at most `size` items."""
+    it = iter(iterable)
+    while chunk := list(islice(it, size)):
+        yield chunk
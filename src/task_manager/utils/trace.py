@@ -0,0 +1,151 @@
+"""Span timing for `task` invocations (--trace / TASK_TRACE).
+
+Tracing is off unless enable() is called; span() then costs one global lookup
+and returns a shared no-op context manager, so spans can sit on hot-ish paths.
+When on, each span records its name, start, duration, thread and arguments;
+the CLI reports them at exit as a per-span summary on stderr or as a Chrome
+trace-event file (open it in chrome://tracing or https://ui.perfetto.dev).
+
+    with span("storage.open", backend="sqlite"):
+        ...
+
+    @traced("render.list")
+    def print_task_list(...): ...
+
+instrument(obj, "storage") wraps an object's public methods in spans on that
+instance only, leaving its class (and signature introspection on it) untouched.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import os
+import threading
+import time
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Any, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_NOOP = nullcontext()
+
+_tracer: Tracer | None = None
+
+
+class Tracer:
+    """Collects finished spans. Thread-safe."""
+
+    def __init__(self) -> None:
+        self.origin = time.perf_counter_ns()
+        self.spans: list[tuple[str, int, int, int, dict[str, Any]]] = []
+        self._lock = threading.Lock()
+
+    def record(self, name: str, start: int, end: int, args: dict[str, Any]) -> None:
+        with self._lock:
+            self.spans.append((name, start, end, threading.get_ident(), args))
+
+    def summary(self) -> str:
+        """Per-name calls, total, mean and max, slowest total first."""
+        totals: dict[str, list[int]] = {}
+        for name, start, end, _, _ in self.spans:
+            totals.setdefault(name, []).append(end - start)
+        width = max((len(name) for name in totals), default=4)
+        lines = [f"{'span':<{width}}  {'calls':>6}  {'total ms':>9}  {'mean ms':>8}  {'max ms':>8}"]
+        for name, durations in sorted(totals.items(), key=lambda item: -sum(item[1])):
+            total = sum(durations) / 1e6
+            lines.append(
+                f"{name:<{width}}  {len(durations):>6}  {total:>9.2f}  "
+                f"{total / len(durations):>8.3f}  {max(durations) / 1e6:>8.3f}"
+            )
+        return "\n".join(lines)
+
+    def chrome_events(self) -> list[dict[str, Any]]:
+        """Complete ("X") events in the Chrome trace-event format, in microseconds."""
+        pid = os.getpid()
+        return [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": {key: str(value) for key, value in args.items()},
+            }
+            for name, start, end, tid, args in self.spans
+        ]
+
+    def write_chrome(self, path: Path) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": self.chrome_events(), "displayTimeUnit": "ms"}, f)
+
+
+class _Span:
+    __slots__ = ("_tracer", "_name", "_args", "_start")
+
+    def __init__(self, tracer: Tracer, name: str, args: dict[str, Any]) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._args = args
+        self._start = 0
+
+    def __enter__(self) -> _Span:
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._tracer.record(self._name, self._start, time.perf_counter_ns(), self._args)
+
+
+def enable() -> Tracer:
+    """Start collecting spans (a fresh Tracer). Returns it."""
+    global _tracer
+    _tracer = Tracer()
+    return _tracer
+
+
+def disable() -> Tracer | None:
+    """Stop collecting. Returns the tracer that was active, if any."""
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def active() -> Tracer | None:
+    return _tracer
+
+
+def span(name: str, **args: Any) -> AbstractContextManager[Any]:
+    tracer = _tracer
+    if tracer is None:
+        return _NOOP
+    return _Span(tracer, name, args)
+
+
+def wrap(func: F, name: str) -> F:
+    """`func` timed as `name` on every call (while tracing is on)."""
+
+    @functools.wraps(func)
+    def timed(*args: Any, **kwargs: Any) -> Any:
+        with span(name):
+            return func(*args, **kwargs)
+
+    return timed  # type: ignore[return-value]
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator form of wrap()."""
+    return lambda func: wrap(func, name)
+
+
+def instrument(obj: object, prefix: str) -> None:
+    """Time every public method of `obj` as "<prefix>.<method>", on this instance only."""
+    for attr in dir(type(obj)):
+        if attr.startswith("_") or not callable(getattr(type(obj), attr, None)):
+            continue
+        if isinstance(getattr(type(obj), attr), type):
+            continue
+        setattr(obj, attr, wrap(getattr(obj, attr), f"{prefix}.{attr}"))
@@ -0,0 +1,55 @@
+"""Read-only task views for display. No pydantic on this path.
+
+Rows coming back from storage were validated by Task when they were written,
+so rendering them only needs attribute access and the few type coercions the
+output layer relies on (enums, due date). TaskView does exactly that with
+__slots__, several times faster than Task.model_validate — and faster than
+Task.model_construct, which is Python-level in pydantic v2. Never use it for
+user input or imported data; those go through Task.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Any
+
+from task_manager.contracts import Priority, Status
+
+# Enum lookups by value without the Enum.__call__ overhead.
+_STATUS = {s.value: s for s in Status}
+_PRIORITY = {p.value: p for p in Priority}
+
+
+class TaskView:
+    """Attribute view over a trusted storage row, shaped like Task."""
+
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "tags",
+        "project",
+        "context",
+        "due_date",
+        "created_at",
+        "updated_at",
+    )
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.id: str = data["id"]
+        self.title: str = data["title"]
+        self.description: str = data.get("description", "")
+        self.status: Status = _STATUS[data.get("status", "open")]
+        self.priority: Priority = _PRIORITY[data.get("priority", "medium")]
+        self.tags: list[str] = data.get("tags", [])
+        self.project: str | None = data.get("project")
+        self.context: str | None = data.get("context")
+        due_date = data.get("due_date")
+        self.due_date: date | None = date.fromisoformat(due_date) if due_date else None
+        self.created_at: str = data.get("created_at", "")
+        self.updated_at: str = data.get("updated_at", "")
+
+    def __repr__(self) -> str:
+        return f"TaskView(id={self.id!r}, title={self.title!r})"
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
 
 from task_manager.models import Task
-from task_manager.storage.json_backend import JsonBackend
+from task_manager.storage.json_backend import JournaledJsonBackend, JsonBackend
 from task_manager.storage.sqlite_backend import SqliteBackend
 
 
@@ -25,8 +26,14 @@ def json_backend(tmp_data_dir: Path) -> JsonBackend:
 
 
 @pytest.fixture()
-def sqlite_backend(tmp_data_dir: Path) -> SqliteBackend:
-    return SqliteBackend(data_dir=tmp_data_dir)
+def journal_backend(tmp_data_dir: Path) -> JournaledJsonBackend:
+    return JournaledJsonBackend(data_dir=tmp_data_dir)
+
+
+@pytest.fixture()
+def sqlite_backend(tmp_data_dir: Path) -> Iterator[SqliteBackend]:
+    with SqliteBackend(data_dir=tmp_data_dir) as backend:
+        yield backend
 
 
 @pytest.fixture()
@@ -0,0 +1,46 @@
+"""Tests for the db CLI commands."""
+
+from typer.testing import CliRunner
+
+from task_manager.cli.app import app
+from task_manager.storage.sqlite_backend import SqliteBackend
+
+runner = CliRunner()
+
+
+def test_status_up_to_date(tmp_path):
+    SqliteBackend(data_dir=tmp_path).close()
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--storage", "sqlite", "--no-plugins", "db", "status"]
+    )
+    assert result.exit_code == 0
+    assert "Up to date" in result.output
+
+
+def test_migrate_applies_pending(tmp_path):
+    with SqliteBackend(data_dir=tmp_path, auto_migrate=False):
+        pass
+    args = ["--data-dir", str(tmp_path), "--storage", "sqlite", "--no-plugins", "db"]
+
+    result = runner.invoke(app, [*args, "status"])
+    assert "pending" in result.output
+
+    result = runner.invoke(app, [*args, "migrate"])
+    assert result.exit_code == 0
+    assert "Applied" in result.output
+    assert "Up to date" in runner.invoke(app, [*args, "status"]).output
+
+
+def test_json_backend_has_no_schema(tmp_path):
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "db", "status"])
+    assert result.exit_code == 0
+    assert "no schema" in result.output
+
+
+def test_vacuum(tmp_path):
+    SqliteBackend(data_dir=tmp_path).close()
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--storage", "sqlite", "--no-plugins", "db", "vacuum"]
+    )
+    assert result.exit_code == 0
+    assert "rebuilt the search index" in result.output
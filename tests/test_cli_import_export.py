@@ -0,0 +1,160 @@
+"""Tests for the import and export CLI commands."""
+
+import csv
+import json
+
+from typer.testing import CliRunner
+
+from task_manager.cli.app import app
+from task_manager.storage.json_backend import JsonBackend
+from task_manager.storage.sqlite_backend import SqliteBackend
+
+runner = CliRunner()
+
+
+def _invoke(tmp_path, *args):
+    return runner.invoke(app, ["--data-dir", str(tmp_path / "data"), "--no-plugins", *args])
+
+
+def test_import_jsonl(tmp_path):
+    src = tmp_path / "in.jsonl"
+    src.write_text(
+        '{"title": "First", "priority": "high", "tags": ["a"]}\n'
+        "\n"
+        '{"id": "01KEEPTHISID0000000000000", "title": "Second", "due_date": "2025-01-02"}\n'
+    )
+    result = _invoke(tmp_path, "import", str(src), "--chunk-size", "1")
+    assert result.exit_code == 0, result.output
+    assert "Imported 2 tasks" in result.output
+
+    tasks = {t["title"]: t for t in JsonBackend(data_dir=tmp_path / "data").list()}
+    assert tasks["First"]["priority"] == "high"
+    assert tasks["Second"]["id"] == "01KEEPTHISID0000000000000"
+    assert tasks["Second"]["due_date"] == "2025-01-02"
+
+
+def test_import_csv(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text('title,tags,project,due_date\nCSV task,"x,Y",+home,\n')
+    result = _invoke(tmp_path, "import", str(src))
+    assert result.exit_code == 0, result.output
+
+    [task] = JsonBackend(data_dir=tmp_path / "data").list()
+    assert task["tags"] == ["x", "y"]
+    assert task["project"] == "home"
+    assert task["due_date"] is None
+
+
+def test_import_invalid_row_stops(tmp_path):
+    src = tmp_path / "in.jsonl"
+    src.write_text('{"title": "ok"}\n{"title": ""}\n')
+    result = _invoke(tmp_path, "import", str(src))
+    assert result.exit_code == 20
+    assert "line 2" in result.output
+
+
+def test_import_skip_invalid(tmp_path):
+    src = tmp_path / "in.jsonl"
+    src.write_text('{"title": "ok"}\n{"status": "bogus", "title": "x"}\n')
+    result = _invoke(tmp_path, "import", str(src), "--skip-invalid")
+    assert result.exit_code == 0
+    assert "skipped 1" in result.output
+    assert len(JsonBackend(data_dir=tmp_path / "data").list()) == 1
+
+
+def test_import_unknown_format(tmp_path):
+    src = tmp_path / "in.txt"
+    src.write_text("")
+    result = _invoke(tmp_path, "import", str(src))
+    assert result.exit_code != 0
+
+
+def test_import_missing_file(tmp_path):
+    result = _invoke(tmp_path, "import", str(tmp_path / "missing.jsonl"))
+    assert result.exit_code == 1
+    assert "Cannot read" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_import_malformed_csv(tmp_path):
+    src = tmp_path / "in.csv"
+    src.write_text("title\n" + "x" * (csv.field_size_limit() + 1) + "\n")
+    result = _invoke(tmp_path, "import", str(src))
+    assert result.exit_code == 20
+    assert "field larger than field limit" in result.output
+
+
+def test_export_roundtrip(tmp_path):
+    _invoke(tmp_path, "add", "One", "--tags", "a,b", "--project", "p")
+    _invoke(tmp_path, "add", "Two")
+
+    out = tmp_path / "out.csv"
+    result = _invoke(tmp_path, "export", str(out))
+    assert result.exit_code == 0
+    assert "Exported 2 tasks" in result.output
+
+    other = tmp_path / "other"
+    result = runner.invoke(app, ["--data-dir", str(other), "--no-plugins", "import", str(out)])
+    assert result.exit_code == 0, result.output
+    original = {t["id"]: t for t in JsonBackend(data_dir=tmp_path / "data").list()}
+    copied = {t["id"]: t for t in JsonBackend(data_dir=other).list()}
+    assert copied == original
+
+
+def test_export_jsonl_to_stdout(tmp_path):
+    _invoke(tmp_path, "add", "One")
+    result = _invoke(tmp_path, "export", "--format", "jsonl")
+    assert result.exit_code == 0
+    lines = [line for line in result.stdout.splitlines() if line.startswith("{")]
+    assert json.loads(lines[0])["title"] == "One"
+
+
+def test_export_unwritable_path(tmp_path):
+    _invoke(tmp_path, "add", "One")
+    result = _invoke(tmp_path, "export", str(tmp_path / "missing" / "out.jsonl"))
+    assert result.exit_code == 1
+    assert "Cannot write" in result.output
+    assert result.exception is None or isinstance(result.exception, SystemExit)
+
+
+def test_sqlite_reimport_replaces_existing(tmp_path):
+    src = tmp_path / "in.jsonl"
+    src.write_text(
+        '{"id": "01KEEPTHISID0000000000000", "title": "First", "tags": ["a"]}\n'
+        '{"id": "01KEEPTHISID0000000000001", "title": "Second"}\n'
+    )
+    result = _invoke(tmp_path, "--storage", "sqlite", "import", str(src))
+    assert result.exit_code == 0, result.output
+    src.write_text('{"id": "01KEEPTHISID0000000000000", "title": "Renamed", "tags": ["b"]}\n')
+    result = _invoke(tmp_path, "--storage", "sqlite", "import", str(src))
+    assert result.exit_code == 0, result.output
+    assert "Imported 1 tasks" in result.output
+
+    with SqliteBackend(data_dir=tmp_path / "data") as backend:
+        tasks = {t["title"]: t for t in backend.list()}
+        assert sorted(tasks) == ["Renamed", "Second"]
+        assert tasks["Renamed"]["tags"] == ["b"]
+        assert [t["title"] for t in backend.list(tags=["b"])] == ["Renamed"]
+        assert [t["title"] for t in backend.search("renamed")] == ["Renamed"]
+
+
+def test_export_pages_through_store(tmp_path):
+    for title in ("One", "Two", "Three"):
+        _invoke(tmp_path, "--storage", "sqlite", "add", title)
+    out = tmp_path / "out.jsonl"
+    result = _invoke(tmp_path, "--storage", "sqlite", "export", str(out), "--chunk-size", "2")
+    assert result.exit_code == 0
+    assert "Exported 3 tasks" in result.output
+    titles = [json.loads(line)["title"] for line in out.read_text().splitlines()]
+    assert titles == ["One", "Two", "Three"]
+
+
+def test_dumps_matches_without_orjson(monkeypatch):
+    from task_manager.utils import serialize
+
+    row = {"id": "01X", "title": "café", "tags": ["a"], "due_date": None}
+    fast = serialize.dumps(row)
+    monkeypatch.setattr(serialize, "orjson", None)
+    assert (
+        serialize.dumps(row) == fast == '{"id":"01X","title":"café","tags":["a"],"due_date":null}'
+    )
@@ -1,5 +1,6 @@
 """Tests for the list CLI command."""
 
+import pytest
 from typer.testing import CliRunner
 
 from task_manager.cli.app import app
@@ -30,3 +31,131 @@ def test_list_filter_status(tmp_path):
     )
     assert result.exit_code == 0
     assert "No tasks found" in result.output
+
+
+def _titles(output):
+    return [word for word in output.split() if word.startswith("Task")]
+
+
+def test_list_sort_limit_page(tmp_path):
+    for title, priority in [("TaskA", "low"), ("TaskB", "urgent"), ("TaskC", "high")]:
+        runner.invoke(
+            app,
+            ["--data-dir", str(tmp_path), "--no-plugins", "add", title, "--priority", priority],
+        )
+    base = ["--data-dir", str(tmp_path), "--no-plugins", "list", "--sort", "priority"]
+
+    result = runner.invoke(app, base)
+    assert _titles(result.output) == ["TaskB", "TaskC", "TaskA"]
+
+    result = runner.invoke(app, [*base, "--limit", "2"])
+    assert _titles(result.output) == ["TaskB", "TaskC"]
+
+    result = runner.invoke(app, [*base, "--limit", "2", "--page", "2"])
+    assert _titles(result.output) == ["TaskA"]
+
+
+def test_list_bad_sort_key(tmp_path):
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--no-plugins", "list", "--sort", "title"]
+    )
+    assert result.exit_code == 2
+
+
+def test_list_piped_is_tsv(tmp_path):
+    runner.invoke(
+        app,
+        ["--data-dir", str(tmp_path), "--no-plugins", "add", "Tab\there", "--tags", "a,b"],
+    )
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "list"])
+    assert result.exit_code == 0
+    fields = result.stdout.rstrip("\n").split("\t")
+    assert fields[1:5] == ["Tab\\there", "open", "medium", "a,b"]
+    assert len(fields) == 7
+
+
+def test_list_piped_jsonl(tmp_path):
+    import json
+
+    runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "add", "Task 1"])
+    result = runner.invoke(
+        app,
+        ["--data-dir", str(tmp_path), "--no-plugins", "list"],
+        env={"TASK_PIPE_FORMAT": "jsonl"},
+    )
+    assert result.exit_code == 0
+    (row,) = [json.loads(line) for line in result.stdout.splitlines()]
+    assert row["title"] == "Task 1"
+
+
+def test_list_empty_piped_keeps_stdout_clean(tmp_path):
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "list"])
+    assert result.stdout == ""
+    assert "No tasks found" in result.stderr
+
+
+def test_stream_table_repeats_header():
+    from io import StringIO
+
+    from rich.console import Console
+
+    from task_manager.cli.output import stream_task_table
+
+    buf = StringIO()
+    target = Console(file=buf, width=120, color_system=None)
+    rows = [{"id": f"{i:026d}", "title": f"[b]Row {i}[/b]\x1b[2J"} for i in range(5)]
+    count = stream_task_table(rows, target=target, header_every=2)
+    lines = buf.getvalue().splitlines()
+    assert count == 5
+    assert sum(line.startswith("ID") for line in lines) == 3
+    assert "[b]Row 0[/b]" in buf.getvalue()  # titles are escaped, not styled
+    assert "\x1b" not in buf.getvalue()
+    assert all(len(line) == 120 for line in lines if line)
+
+
+def test_list_format_json(tmp_path):
+    import json
+
+    base = ["--data-dir", str(tmp_path), "--no-plugins"]
+    result = runner.invoke(app, [*base, "--format", "json", "list"])
+    assert json.loads(result.stdout) == []
+
+    runner.invoke(app, [*base, "add", "Task 1"])
+    runner.invoke(app, [*base, "add", "Task 2"])
+    result = runner.invoke(app, [*base, "--format", "json", "list"])
+    assert result.exit_code == 0
+    assert sorted(row["title"] for row in json.loads(result.stdout)) == ["Task 1", "Task 2"]
+
+
+def test_search_format_tsv(tmp_path):
+    base = ["--data-dir", str(tmp_path), "--no-plugins"]
+    runner.invoke(app, [*base, "add", "Find me"])
+    result = runner.invoke(app, [*base, "--format", "tsv", "search", "find"])
+    assert result.exit_code == 0
+    assert result.stdout.split("\t")[1] == "Find me"
+
+
+def test_unknown_format_rejected(tmp_path):
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--format", "xml", "list"])
+    assert result.exit_code == 2
+
+
+@pytest.mark.parametrize("storage", ["json", "sqlite"])
+def test_list_query(tmp_path, storage):
+    base = ["--data-dir", str(tmp_path), "--storage", storage, "--no-plugins"]
+    runner.invoke(app, [*base, "add", "TaskA", "--priority", "urgent", "--tags", "blocked"])
+    runner.invoke(app, [*base, "add", "TaskB", "--priority", "high", "--due", "yesterday"])
+    runner.invoke(app, [*base, "add", "TaskC", "--priority", "low", "--due", "yesterday"])
+    result = runner.invoke(
+        app, [*base, "list", "--query", "due<today and priority>=high and not tag:blocked"]
+    )
+    assert result.exit_code == 0
+    assert _titles(result.output) == ["TaskB"]
+
+
+def test_list_bad_query(tmp_path):
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--no-plugins", "list", "--query", "due<soon"]
+    )
+    assert result.exit_code == 2
+    assert "soon" in result.output
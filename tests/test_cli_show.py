@@ -0,0 +1,45 @@
+"""Tests for ID prefix resolution in the show CLI command."""
+
+from typer.testing import CliRunner
+
+from task_manager.cli.app import app
+from task_manager.storage.json_backend import JsonBackend
+
+runner = CliRunner(env={"COLUMNS": "200"})
+
+
+def _seed(tmp_path, *ids):
+    backend = JsonBackend(data_dir=tmp_path)
+    for task_id in ids:
+        backend.create({"id": task_id, "title": f"Task {task_id}", "tags": []})
+
+
+def test_show_by_prefix(tmp_path):
+    _seed(tmp_path, "01ABC111", "01XYZ222")
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "show", "01abc"])
+    assert result.exit_code == 0
+    assert "Task 01ABC111" in result.output
+
+
+def test_show_ambiguous_prefix(tmp_path):
+    _seed(tmp_path, "01ABC111", "01ABC222")
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "show", "01ABC"])
+    assert result.exit_code == 11
+    assert "01ABC111" in result.output
+
+
+def test_show_unknown_prefix(tmp_path):
+    _seed(tmp_path, "01ABC111")
+    result = runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "show", "01Q"])
+    assert result.exit_code == 10
+
+
+def test_show_format_json(tmp_path):
+    import json
+
+    _seed(tmp_path, "01ABC111")
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--no-plugins", "--format", "json", "show", "01ABC"]
+    )
+    assert result.exit_code == 0
+    assert json.loads(result.stdout) == {"id": "01ABC111", "title": "Task 01ABC111", "tags": []}
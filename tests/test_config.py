@@ -33,3 +33,23 @@ def test_validate_good_priority(monkeypatch, tmp_path):
     settings = Settings.load()
     errors = settings.validate()
     assert errors == []
+
+
+def test_validate_bad_pipe_format(monkeypatch, tmp_path):
+    monkeypatch.setattr("task_manager.config.CONFIG_FILE", tmp_path / "nonexistent.toml")
+    monkeypatch.setenv("TASK_PIPE_FORMAT", "xml")
+    errors = Settings.load().validate()
+    assert len(errors) == 1
+    assert "pipe_format" in errors[0]
+
+
+def test_validate_hook_settings(monkeypatch, tmp_path):
+    monkeypatch.setattr("task_manager.config.CONFIG_FILE", tmp_path / "nonexistent.toml")
+    monkeypatch.setenv("TASK_HOOK_DISPATCH", "background")
+    assert Settings.load().validate() == []
+    monkeypatch.setenv("TASK_HOOK_DISPATCH", "later")
+    monkeypatch.setenv("TASK_HOOK_TIMEOUT", "soon")
+    errors = Settings.load().validate()
+    assert len(errors) == 2
+    assert "hooks.dispatch" in errors[0]
+    assert "hooks.timeout" in errors[1]
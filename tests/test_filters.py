@@ -1,6 +1,19 @@
 """Tests for task filtering predicates."""
 
-from task_manager.utils.filters import apply_filters
+import pytest
+
+from task_manager.utils.filters import (
+    _COMPILED_CACHE_SIZE,
+    And,
+    Compare,
+    HasTags,
+    In,
+    Not,
+    Or,
+    _compile_select,
+    apply_filters,
+    filter_predicate,
+)
 
 TASKS = [
     {"id": "1", "status": "open", "priority": "high", "tags": ["dev", "urgent"], "project": "a"},
@@ -8,6 +21,12 @@ TASKS = [
     {"id": "3", "status": "open", "priority": "medium", "tags": ["dev"], "project": "b"},
     {"id": "4", "status": "cancelled", "priority": "high", "tags": [], "project": None},
 ]
+for _row, _due in zip(TASKS, ["2025-01-10", None, "2025-03-01", "2025-02-01"]):
+    _row["due_date"] = _due
+
+
+def _ids(predicate) -> list[str]:
+    return [t["id"] for t in predicate.select(TASKS)]
 
 
 def test_no_filters_returns_all():
@@ -48,3 +67,65 @@ def test_combined_filters():
     result = apply_filters(TASKS, status=["open"], priority=["high"])
     assert len(result) == 1
     assert result[0]["id"] == "1"
+
+
+def test_where_combines_with_keyword_filters():
+    result = apply_filters(TASKS, status=["open"], where=Compare("due_date", ">", "2025-02-01"))
+    assert [t["id"] for t in result] == ["3"]
+
+
+class TestPredicates:
+    def test_or(self):
+        assert _ids(In("status", ("done",)) | HasTags(("urgent",))) == ["1", "2"]
+
+    def test_not(self):
+        assert _ids(Not(In("status", ("open",)))) == ["2", "4"]
+
+    def test_missing_value_never_compares(self):
+        assert _ids(Compare("due_date", "<", "2025-02-01")) == ["1"]
+        assert _ids(~Compare("due_date", "<", "2025-02-01")) == ["2", "3", "4"]
+
+    def test_range(self):
+        window = Compare("due_date", ">=", "2025-01-10") & Compare("due_date", "<", "2025-03-01")
+        assert _ids(window) == ["1", "4"]
+
+    def test_none_matches_missing(self):
+        assert _ids(In("project", ("b", None))) == ["3", "4"]
+
+    def test_empty_combinators(self):
+        assert _ids(And(())) == ["1", "2", "3", "4"]
+        assert _ids(Or(())) == []
+
+    def test_nested(self):
+        predicate = Or(
+            (And((In("project", ("a",)), ~HasTags(("dev",)))), In("priority", ("medium",)))
+        )
+        assert _ids(predicate) == ["2", "3"]
+
+    def test_compiled_once_per_predicate(self):
+        assert In("status", ("open",)).compile() is In("status", ("open",)).compile()
+
+    def test_compiled_cache_is_bounded(self):
+        for day in range(400):
+            Compare("due_date", "<", f"2025-{day:04d}").select(TASKS)
+        assert _compile_select.cache_info().currsize <= _COMPILED_CACHE_SIZE
+
+    def test_constants_are_not_spliced_into_code(self):
+        rows = [{"status": "x') or True or ('", "tags": []}]
+        assert In("status", ("open",)).select(rows) == []
+
+    def test_unknown_field_rejected(self):
+        with pytest.raises(ValueError):
+            In("title", ("x",))
+        with pytest.raises(ValueError):
+            Compare("due_date", "!=", "2025-01-01")
+
+    def test_filter_predicate_matches_apply_filters(self):
+        kwargs = {"status": ["open"], "tags": ["dev"], "project": "a"}
+        assert filter_predicate(**kwargs).select(TASKS) == apply_filters(TASKS, **kwargs)
+        assert filter_predicate() is None
+
+    def test_to_sql_binds_values(self):
+        sql, params = (In("status", ("open",)) & ~Compare("due_date", "<", "2025-01-01")).to_sql()
+        assert sql == "((status IN (?)) AND (NOT (due_date IS NOT NULL AND due_date < ?)))"
+        assert params == ["open", "2025-01-01"]
@@ -1,5 +1,10 @@
 """Tests for the plugin system."""
 
+import sys
+import threading
+
+import pytest
+
 from task_manager.contracts import HookEvent
 from task_manager.plugins.hooks import DefaultHookRegistry
 from task_manager.plugins.loader import load_plugins
@@ -37,18 +42,39 @@ def test_hook_handler_exception_isolated():
     assert len(received) == 1  # good_handler still ran
 
 
-def test_hook_payload_is_copy():
-    """Handlers receive a copy — mutations don't affect caller."""
+def test_hook_payload_is_read_only():
+    """Handlers get a frozen snapshot: read-only, and unaffected by later caller changes."""
     registry = DefaultHookRegistry()
+    received = []
+    errors = []
 
     def mutating_handler(event, payload):
-        payload["id"] = "mutated"
+        received.append(payload)
+        try:
+            payload["id"] = "mutated"
+        except TypeError as exc:
+            errors.append(exc)
 
     registry.on(HookEvent.TASK_CREATED, mutating_handler)
 
-    original = {"id": "original"}
+    original = {"id": "original", "tags": ["a"]}
     registry.emit(HookEvent.TASK_CREATED, original)
+    original["tags"].append("b")
     assert original["id"] == "original"
+    assert len(errors) == 1
+    assert received[0]["tags"] == ("a",)
+
+
+def test_emit_without_subscribers_does_nothing(monkeypatch):
+    from task_manager.plugins import hooks
+
+    registry = DefaultHookRegistry(dispatch="background")
+    registry.on(HookEvent.TASK_DELETED, lambda event, payload: None)
+    monkeypatch.setattr(hooks, "freeze_payload", lambda payload: pytest.fail("payload built"))
+    registry.emit(HookEvent.TASK_CREATED, {"id": "x"})
+    assert not registry.has_handlers(HookEvent.TASK_CREATED)
+    assert registry.has_handlers(HookEvent.TASK_DELETED)
+    assert registry._dispatcher is None  # no thread started for nothing
 
 
 def test_load_plugins_empty_dir(tmp_path):
@@ -95,3 +121,153 @@ def test_load_bad_plugin_skipped(tmp_path):
     hooks = DefaultHookRegistry()
     loaded = load_plugins(plugins_dir, hooks, silent=True)
     assert loaded == []
+
+
+def test_background_dispatch_returns_before_handlers_run():
+    registry = DefaultHookRegistry(dispatch="background")
+    release = threading.Event()
+    received = []
+
+    def slow_handler(event, payload):
+        release.wait(5)
+        received.append(payload["id"])
+
+    registry.on(HookEvent.TASK_CREATED, slow_handler)
+    registry.emit(HookEvent.TASK_CREATED, {"id": "a"})
+    registry.emit(HookEvent.TASK_CREATED, {"id": "b"})
+    assert received == []
+    release.set()
+    registry.close()
+    assert received == ["a", "b"]  # delivered in emit order, all before close() returned
+
+
+def test_background_dispatch_times_out_hung_handler(capsys):
+    registry = DefaultHookRegistry(dispatch="background", timeout=0.05)
+    hang = threading.Event()
+    received = []
+
+    def hung_handler(event, payload):
+        if payload["id"] == "first":
+            hang.wait(5)
+
+    registry.on(HookEvent.TASK_CREATED, hung_handler)
+    registry.on(HookEvent.TASK_CREATED, lambda event, payload: received.append(payload["id"]))
+    registry.emit(HookEvent.TASK_CREATED, {"id": "first"})
+    registry.emit(HookEvent.TASK_CREATED, {"id": "second"})
+    registry.close()
+    hang.set()
+
+    assert received == ["first", "second"]  # the hang didn't stall the other handler
+    assert "timed out" in capsys.readouterr().err
+
+
+def test_background_dispatch_isolates_exceptions():
+    registry = DefaultHookRegistry(dispatch="background")
+    received = []
+
+    def bad_handler(event, payload):
+        raise RuntimeError("boom")
+
+    registry.on(HookEvent.TASK_CREATED, bad_handler)
+    registry.on(HookEvent.TASK_CREATED, lambda event, payload: received.append(payload))
+    registry.emit(HookEvent.TASK_CREATED, {"id": "test"})
+    registry.flush()
+    assert received == [{"id": "test"}]
+    registry.close()
+    registry.close()  # idempotent
+
+
+def test_unknown_dispatch_mode_rejected():
+    with pytest.raises(ValueError):
+        DefaultHookRegistry(dispatch="carrier-pigeon")
+
+
+_COUNTING_PLUGIN = """
+import os
+
+with open(os.path.join(os.path.dirname(__file__), "imports.log"), "a") as log:
+    log.write("imported\\n")
+
+class Notifier:
+    name = "notifier"
+    version = "1.0"
+
+    def register(self, hooks):
+        hooks.on("task.completed", self.on_complete)
+
+    def on_complete(self, event, payload):
+        RECEIVED.append(payload["id"])
+
+RECEIVED = []
+plugin = Notifier()
+"""
+
+
+def _imports(plugins_dir):
+    log = plugins_dir / "imports.log"
+    return len(log.read_text().splitlines()) if log.exists() else 0
+
+
+@pytest.fixture()
+def cached_plugin_dir(tmp_path):
+    plugins_dir = tmp_path / "plugins"
+    plugins_dir.mkdir()
+    (plugins_dir / "notifier.py").write_text(_COUNTING_PLUGIN)
+    return plugins_dir, tmp_path / "cache" / "plugins.manifest.json"
+
+
+def test_manifest_defers_import_until_event(cached_plugin_dir):
+    plugins_dir, manifest = cached_plugin_dir
+    first = DefaultHookRegistry()
+    assert load_plugins(plugins_dir, first, manifest_path=manifest) == ["notifier"]
+    assert _imports(plugins_dir) == 1
+    assert manifest.exists()
+
+    second = DefaultHookRegistry()
+    assert load_plugins(plugins_dir, second, manifest_path=manifest) == ["notifier"]
+    assert _imports(plugins_dir) == 1  # cache hit: nothing imported
+    assert second.has_handlers(HookEvent.TASK_COMPLETED)
+    assert not second.has_handlers(HookEvent.TASK_CREATED)
+
+    second.emit(HookEvent.TASK_COMPLETED, {"id": "a"})
+    second.emit(HookEvent.TASK_COMPLETED, {"id": "b"})
+    assert _imports(plugins_dir) == 2  # imported once, on the first event
+    assert sys.modules["task_manager_plugin_notifier"].RECEIVED == ["a", "b"]
+
+
+def test_manifest_invalidated_by_edit(cached_plugin_dir):
+    plugins_dir, manifest = cached_plugin_dir
+    load_plugins(plugins_dir, DefaultHookRegistry(), manifest_path=manifest)
+    (plugins_dir / "notifier.py").write_text(_COUNTING_PLUGIN + "\n# edited\n")
+    load_plugins(plugins_dir, DefaultHookRegistry(), manifest_path=manifest)
+    assert _imports(plugins_dir) == 2  # changed size: imported eagerly again
+
+
+def test_corrupt_manifest_ignored(cached_plugin_dir):
+    plugins_dir, manifest = cached_plugin_dir
+    manifest.parent.mkdir()
+    manifest.write_text("{not json")
+    assert load_plugins(plugins_dir, DefaultHookRegistry(), manifest_path=manifest) == ["notifier"]
+
+
+def test_entry_point_plugins(tmp_path, monkeypatch):
+    from task_manager.plugins import loader
+
+    site = tmp_path / "site"  # stands in for site-packages; left untouched between runs
+    site.mkdir()
+    (site / "ep_plugin.py").write_text(_COUNTING_PLUGIN)
+    (site / "imports.log").touch()
+    monkeypatch.setattr(sys, "dont_write_bytecode", True)
+    monkeypatch.syspath_prepend(str(site))
+    monkeypatch.setattr(loader, "_scan_entry_points", lambda: [["notify", "ep_plugin:plugin"]])
+    manifest = tmp_path / "plugins.manifest.json"
+
+    hooks = DefaultHookRegistry()
+    assert load_plugins(tmp_path / "none", hooks, manifest_path=manifest) == ["notifier"]
+    assert _imports(site) == 1
+
+    monkeypatch.setattr(loader, "_scan_entry_points", lambda: pytest.fail("rescanned"))
+    hooks = DefaultHookRegistry()
+    assert load_plugins(tmp_path / "none", hooks, manifest_path=manifest) == ["notifier"]
+    assert hooks.has_handlers(HookEvent.TASK_COMPLETED)
+    assert _imports(site) == 1
@@ -0,0 +1,123 @@
+"""Tests for the `task list --query` expression language."""
+
+from datetime import date, datetime, timezone
+
+import pytest
+
+from task_manager.utils import query
+from task_manager.utils.filters import And, Compare, HasTags, In, Not, Or, Untagged
+from task_manager.utils.query import parse_query
+
+TODAY = date(2025, 1, 10)
+
+
+def _parse(text):
+    return parse_query(text, today=TODAY)
+
+
+def test_example_query():
+    assert _parse("due<today and priority>=high and not tag:blocked") == And(
+        (
+            Compare("due_date", "<", "2025-01-10"),
+            In("priority", ("urgent", "high")),
+            Not(HasTags(("blocked",))),
+        )
+    )
+
+
+def test_precedence_and_juxtaposition():
+    assert _parse("status:open project:a or tag:x") == Or(
+        (And((In("status", ("open",)), In("project", ("a",)))), HasTags(("x",)))
+    )
+    assert _parse("status:open (project:a or tag:x)") == And(
+        (In("status", ("open",)), Or((In("project", ("a",)), HasTags(("x",)))))
+    )
+
+
+def test_values():
+    assert _parse("status=open,in_progress") == In("status", ("open", "in_progress"))
+    assert _parse("project=none") == In("project", (None,))
+    assert _parse('project="none"') == In("project", ("none",))
+    assert _parse("context!=home") == Not(In("context", ("home",)))
+    assert _parse("tags:a,b") == HasTags(("a", "b"))
+    assert _parse("priority<medium") == In("priority", ("low",))
+
+
+def test_dates():
+    assert _parse("due>=-7d") == Compare("due_date", ">=", "2025-01-03")
+    assert _parse("due:tomorrow") == In("due_date", ("2025-01-11",))
+    assert _parse("due:none") == In("due_date", (None,))
+    # Timestamps compare by whole day.
+    assert _parse("created<=2025-01-01") == Compare("created_at", "<", "2025-01-02")
+    assert _parse("updated:yesterday") == And(
+        (Compare("updated_at", ">=", "2025-01-09"), Compare("updated_at", "<", "2025-01-10"))
+    )
+
+
+def test_created_today_is_the_utc_day():
+    predicate = _parse("created:today")
+    rows = [
+        {"id": "before", "created_at": "2025-01-09T23:59:59.999999+00:00"},
+        {"id": "start", "created_at": "2025-01-10T00:00:00+00:00"},
+        {"id": "end", "created_at": "2025-01-10T23:59:59.999999+00:00"},
+        {"id": "after", "created_at": "2025-01-11T00:00:00+00:00"},
+    ]
+    assert [row["id"] for row in predicate.select(rows)] == ["start", "end"]
+
+
+def test_default_today_is_utc_for_timestamps(monkeypatch):
+    # Local date a day ahead of UTC; the UTC date decides created/updated.
+    class Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return datetime(2025, 1, 9, 23, 30, tzinfo=timezone.utc)
+
+    class Calendar(date):
+        @classmethod
+        def today(cls):
+            return date(2025, 1, 10)
+
+    monkeypatch.setattr(query, "datetime", Clock)
+    monkeypatch.setattr(query, "date", Calendar)
+    assert parse_query("created:today") == And(
+        (Compare("created_at", ">=", "2025-01-09"), Compare("created_at", "<", "2025-01-10"))
+    )
+    assert parse_query("due:today") == In("due_date", ("2025-01-10",))
+
+
+def test_evaluates_on_rows():
+    rows = [
+        {"id": "1", "status": "open", "priority": "high", "tags": [], "due_date": "2025-01-01"},
+        {"id": "2", "status": "open", "priority": "high", "tags": ["blocked"], "due_date": None},
+        {"id": "3", "status": "done", "priority": "low", "tags": [], "due_date": "2025-01-01"},
+    ]
+    predicate = _parse("due<today and priority>=high and not tag:blocked")
+    assert [row["id"] for row in predicate.select(rows)] == ["1"]
+
+
+def test_tag_none_means_untagged():
+    rows = [{"id": "1", "tags": []}, {"id": "2", "tags": ["a"]}, {"id": "3"}]
+    assert _parse("tag:none") == Untagged()
+    assert [row["id"] for row in _parse("tag:none").select(rows)] == ["1", "3"]
+    assert [row["id"] for row in _parse("tag!=none").select(rows)] == ["2"]
+    assert _parse('tag:"none"') == HasTags(("none",))
+
+
+@pytest.mark.parametrize(
+    ("text", "message"),
+    [
+        ("", "Empty query"),
+        ("colour:red", "Unknown field 'colour'"),
+        ("status:nope", "Unknown status 'nope'"),
+        ("status<open", "does not support '<'"),
+        ("due<soon", "Cannot parse date 'soon'"),
+        ("(status:open", "Expected ')'"),
+        ("status:open)", "Unexpected ')' at position 12"),
+        ("status", "Unexpected end of query"),
+        ("status!open", "Unexpected '!'"),
+        ("tag:a,none", "cannot be combined"),
+    ],
+)
+def test_errors(text, message):
+    with pytest.raises(ValueError, match=message.replace("(", r"\(").replace(")", r"\)")):
+        _parse(text)
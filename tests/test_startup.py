@@ -0,0 +1,67 @@
+"""Startup benchmark: `task` is run thousands of times from scripts, so cold start matters.
+
+Uses `python -X importtime` in a subprocess. The budget is the best of a few
+runs (to absorb scheduler noise) and can be raised on slow machines with
+TASK_STARTUP_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HEAVY = {"rich", "pydantic", "pydantic_core", "sqlite3"}
+BUDGET_MS = int(os.environ.get("TASK_STARTUP_BUDGET_MS", "150"))
+
+
+def _importtime(*args: str, env: dict | None = None) -> dict[str, int]:
+    """Run python -X importtime; return {module: cumulative microseconds}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(SRC), **(env or {})},
+        check=True,
+    )
+    modules = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def test_app_import_skips_heavy_modules():
+    modules = _importtime("-c", "import task_manager.cli.app")
+    assert {m.split(".")[0] for m in modules} & HEAVY == set()
+
+
+def test_app_import_within_budget():
+    best = min(
+        _importtime("-c", "import task_manager.cli.app")["task_manager.cli.app"] for _ in range(3)
+    )
+    assert best / 1000 < BUDGET_MS, f"import task_manager.cli.app took {best / 1000:.1f} ms"
+
+
+def test_config_command_skips_models_and_sqlite(tmp_path):
+    modules = _importtime(
+        "-m",
+        "task_manager",
+        "--no-plugins",
+        "config",
+        "path",
+        env={"TASK_DATA_DIR": str(tmp_path)},
+    )
+    loaded = {m.split(".")[0] for m in modules}
+    assert "pydantic" not in loaded
+    assert "sqlite3" not in loaded
+    assert "task_manager.models" not in modules
+
+
+def test_list_command_skips_pydantic(tmp_path):
+    modules = _importtime(
+        "-m", "task_manager", "--no-plugins", "list", env={"TASK_DATA_DIR": str(tmp_path)}
+    )
+    assert "pydantic" not in {m.split(".")[0] for m in modules}
@@ -0,0 +1,140 @@
+"""Tests for the JSON backend's memory-mapped columnar snapshot."""
+
+import pytest
+
+from task_manager.models import Task
+from task_manager.storage import create_many
+from task_manager.storage.columnar import ColumnarSnapshot
+from task_manager.storage.json_backend import JsonBackend, cache_clear
+
+
+def _seed(backend: JsonBackend) -> list[dict]:
+    tasks = [
+        Task(
+            title="Write report",
+            priority="high",
+            tags=["work"],
+            project="q3",
+            due_date="2025-03-01",
+        ),
+        Task(title="Buy milk", description="Semi-skimmed", tags=["errands", "shopping"]),
+        Task(title="Call MUM", status="done", priority="low", context="phone"),
+        Task(title="Café plans", status="in_progress", priority="urgent", tags=["café"]),
+        Task(title="Review PR", priority="high", tags=["work", "code"], project="q3"),
+    ]
+    rows = [t.to_storage() for t in tasks]
+    create_many(backend, rows)
+    # A hand-written row without the optional fields the model fills in.
+    backend.create({"id": "00BARE", "title": "bare row"})
+    return rows
+
+
+@pytest.fixture()
+def pair(tmp_data_dir):
+    """(columnar-backed backend, plain backend) over the same store.
+
+    The in-process parse cache is cleared so reads reach the snapshot, as they
+    would in a fresh CLI process.
+    """
+    backend = JsonBackend(data_dir=tmp_data_dir, columnar_min_tasks=0)
+    _seed(backend)
+    cache_clear()
+    backend.list()  # first read parses tasks.json and writes the snapshot
+    assert (tmp_data_dir / "tasks.columns").exists()
+    cache_clear()
+    return backend, JsonBackend(data_dir=tmp_data_dir, columnar_min_tasks=None)
+
+
+def _ids(rows):
+    return [r["id"] for r in rows]
+
+
+class TestColumnarReads:
+    def test_reads_come_from_snapshot(self, pair, monkeypatch):
+        backend, _ = pair
+        monkeypatch.setattr(JsonBackend, "_load", lambda self: pytest.fail("parsed tasks.json"))
+        assert len(backend.list()) == 6
+        assert backend.get("00BARE") == {"id": "00BARE", "title": "bare row"}
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"status": ["open"]},
+            {"status": ["done", "in_progress"]},
+            {"priority": ["high"]},
+            {"tags": ["work"]},
+            {"tags": ["work", "code"]},
+            {"project": "q3"},
+            {"context": "phone"},
+            {"sort_by": "priority"},
+            {"sort_by": "-due_date", "limit": 3},
+            {"sort_by": "status", "limit": 2, "offset": 1},
+            {"sort_by": "created_at", "offset": 4},
+            {"limit": 2, "offset": 2},
+        ],
+    )
+    def test_list_matches_plain_backend(self, pair, kwargs):
+        backend, plain = pair
+        assert backend.list(**kwargs) == plain.list(**kwargs)
+
+    @pytest.mark.parametrize("query", ["", "mum", "MILK", "skimmed", "café", "shop", "nothing"])
+    def test_search_matches_plain_backend(self, pair, query):
+        backend, plain = pair
+        assert _ids(backend.search(query)) == _ids(plain.search(query))
+
+    def test_get_and_prefix(self, pair):
+        backend, plain = pair
+        rows = plain.list()
+        cache_clear()
+        for row in rows:
+            assert backend.get(row["id"]) == row
+        assert backend.get("missing") is None
+        assert backend.resolve_prefix("00B") == ["00BARE"]
+        assert backend.resolve_prefix("0", limit=50) == sorted(r["id"] for r in rows)
+
+
+class TestColumnarInvalidation:
+    def test_write_makes_snapshot_stale(self, pair):
+        backend, _ = pair
+        row = Task(title="Fresh").to_storage()
+        backend.create(row)
+        assert backend.get(row["id"]) == row
+        assert len(backend.list()) == 7
+
+    def test_writes_do_not_build_snapshot(self, tmp_data_dir):
+        backend = JsonBackend(data_dir=tmp_data_dir, columnar_min_tasks=0)
+        _seed(backend)
+        cache_clear()  # a fresh process whose first command is a write
+        backend.create(Task(title="Fresh").to_storage())
+        assert not (tmp_data_dir / "tasks.columns").exists()
+        cache_clear()
+        backend.list()  # the next read builds it
+        assert (tmp_data_dir / "tasks.columns").exists()
+
+    def test_external_change_is_seen(self, pair, tmp_data_dir):
+        backend, plain = pair
+        plain.delete("00BARE")
+        assert backend.get("00BARE") is None
+
+    def test_small_store_writes_no_snapshot(self, tmp_data_dir):
+        backend = JsonBackend(data_dir=tmp_data_dir)
+        _seed(backend)
+        backend.list()
+        assert not (tmp_data_dir / "tasks.columns").exists()
+
+    def test_garbage_snapshot_is_ignored(self, pair, tmp_data_dir):
+        backend, plain = pair
+        (tmp_data_dir / "tasks.columns").write_bytes(b"not a snapshot")
+        reopened = JsonBackend(data_dir=tmp_data_dir, columnar_min_tasks=0)
+        assert reopened.list() == plain.list()
+
+    def test_unsupported_rows_are_not_snapshotted(self, tmp_path):
+        rows = [{"id": "X", "title": "odd", "status": "someday"}]
+        assert not ColumnarSnapshot.build(tmp_path / "tasks.columns", rows, (0, 0, 0))
+        rows = [{"id": "X", "title": "ok"}]
+        assert ColumnarSnapshot.build(tmp_path / "tasks.columns", rows, (0, 0, 0))
+        snapshot = ColumnarSnapshot.open(tmp_path / "tasks.columns", (0, 0, 0))
+        assert snapshot.records([0]) == rows
+        assert snapshot.get("X") == rows[0]
+        snapshot.close()
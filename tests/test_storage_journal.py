@@ -0,0 +1,92 @@
+"""Tests for the journaled JSON storage backend."""
+
+import json
+
+from task_manager.models import Task
+from task_manager.storage.json_backend import JournaledJsonBackend
+
+
+def _make_task(**kwargs) -> dict:
+    return Task(title="Journal task", **kwargs).to_storage()
+
+
+class TestJournalReplay:
+    def test_create_appends_without_snapshot(self, journal_backend, tmp_data_dir):
+        data = _make_task()
+        journal_backend.create(data)
+        assert not (tmp_data_dir / "tasks.json").exists()
+        lines = (tmp_data_dir / "tasks.journal").read_text().splitlines()
+        assert json.loads(lines[0]) == {"op": "put", "task": data}
+
+    def test_replay_in_new_instance(self, journal_backend, tmp_data_dir):
+        keep, gone = _make_task(), _make_task()
+        journal_backend.create(keep)
+        journal_backend.create(gone)
+        journal_backend.update(keep["id"], {"title": "Renamed"})
+        journal_backend.delete(gone["id"])
+
+        reopened = JournaledJsonBackend(data_dir=tmp_data_dir)
+        assert reopened.get(keep["id"])["title"] == "Renamed"
+        assert reopened.get(gone["id"]) is None
+
+    def test_sees_appends_from_other_instance(self, journal_backend, tmp_data_dir):
+        journal_backend.create(_make_task())
+        assert len(journal_backend.list()) == 1
+        JournaledJsonBackend(data_dir=tmp_data_dir).create(_make_task())
+        assert len(journal_backend.list()) == 2
+
+    def test_torn_trailing_record_ignored(self, journal_backend, tmp_data_dir):
+        data = _make_task()
+        journal_backend.create(data)
+        with open(tmp_data_dir / "tasks.journal", "a") as f:
+            f.write('{"op": "put", "task": {"id": "X"')
+        reopened = JournaledJsonBackend(data_dir=tmp_data_dir)
+        assert [t["id"] for t in reopened.list()] == [data["id"]]
+
+
+class TestJournalCompaction:
+    def test_compact_folds_journal_into_snapshot(self, journal_backend, tmp_data_dir):
+        data = _make_task()
+        journal_backend.create(data)
+        journal_backend.compact()
+        assert (tmp_data_dir / "tasks.journal").read_bytes() == b""
+        snapshot = json.loads((tmp_data_dir / "tasks.json").read_text())
+        assert data["id"] in snapshot["tasks"]
+        assert journal_backend.get(data["id"]) == data
+
+    def test_compaction_triggers_on_size(self, tmp_data_dir):
+        backend = JournaledJsonBackend(data_dir=tmp_data_dir, min_compact_bytes=2000)
+        for _ in range(20):
+            backend.create(_make_task())
+        assert (tmp_data_dir / "tasks.json").exists()
+        assert (tmp_data_dir / "tasks.journal").stat().st_size <= 2000
+        assert len(JournaledJsonBackend(data_dir=tmp_data_dir).list()) == 20
+
+    def test_reader_between_snapshot_and_journal_replace(self, tmp_data_dir):
+        writer = JournaledJsonBackend(data_dir=tmp_data_dir)
+        reader = JournaledJsonBackend(data_dir=tmp_data_dir)
+        first = [_make_task() for _ in range(3)]
+        for data in first:
+            writer.create(data)
+        assert len(reader.list()) == 3
+
+        # The reader loads the new snapshot while the old journal is still in place.
+        save = writer._save
+
+        def save_then_read(data, **kwargs):
+            save(data, **kwargs)
+            assert len(reader.list()) == 3
+
+        writer._save = save_then_read
+        writer.compact()
+        writer._save = save
+
+        # Grow the new journal past the offset the reader reached in the old one.
+        later = [_make_task(description="x" * 200) for _ in range(5)]
+        for data in later:
+            writer.create(data)
+        writer.update(first[0]["id"], {"title": "Renamed"})
+
+        expected = JournaledJsonBackend(data_dir=tmp_data_dir).list()
+        assert len(expected) == 8
+        assert reader.list() == expected
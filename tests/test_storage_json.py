@@ -1,8 +1,13 @@
 """Tests for JSON storage backend."""
 
+import os
+
 import pytest
 
+from task_manager import storage
 from task_manager.errors import TaskNotFound
+from task_manager.models import Task
+from task_manager.storage.json_backend import JsonBackend, cache_clear
 
 
 class TestJsonBackendCrud:
@@ -65,3 +70,176 @@ class TestJsonBackendFilters:
         assert len(results) == 1
         results = json_backend.list(tags=["nonexistent"])
         assert len(results) == 0
+
+
+class TestParsedStoreCache:
+    def test_repeated_reads_parse_once(self, json_backend, sample_task_data, monkeypatch):
+        from task_manager.storage import json_backend as module
+
+        json_backend.create(sample_task_data)  # write-through: the store is cached on save
+        before = module.cache_info()
+        monkeypatch.setattr(module.json, "loads", lambda *a, **k: pytest.fail("re-parsed"))
+        for _ in range(3):
+            assert json_backend.get(sample_task_data["id"]) is not None
+        assert json_backend.list()
+        after = module.cache_info()
+        assert after.hits - before.hits == 4
+        assert after.misses == before.misses
+
+    def test_shared_between_instances(self, tmp_data_dir, sample_task_data):
+        from task_manager.storage.json_backend import JsonBackend
+
+        JsonBackend(data_dir=tmp_data_dir).create(sample_task_data)
+        other = JsonBackend(data_dir=tmp_data_dir)
+        assert other.get(sample_task_data["id"])["title"] == sample_task_data["title"]
+
+    def test_external_change_invalidates(self, json_backend, tmp_data_dir, sample_task_data):
+        import json
+
+        json_backend.create(sample_task_data)
+        path = tmp_data_dir / "tasks.json"
+        path.write_text(json.dumps({"tasks": {}}))
+        assert json_backend.get(sample_task_data["id"]) is None
+
+    def test_returned_rows_do_not_alias_cache(self, json_backend, sample_task_data):
+        json_backend.create(sample_task_data)
+        row = json_backend.get(sample_task_data["id"])
+        row["title"] = "mutated"
+        row["tags"].append("mutated")
+        sample_task_data["title"] = "mutated too"
+        fresh = json_backend.get(sample_task_data["id"])
+        assert fresh["title"] != "mutated"
+        assert "mutated" not in fresh["tags"]
+        assert fresh["title"] != "mutated too"
+
+    def test_failed_save_leaves_cache_consistent(self, json_backend, sample_task_data, monkeypatch):
+        from pathlib import Path
+
+        from task_manager.errors import StorageUnavailable
+
+        json_backend.create(sample_task_data)
+
+        def fail(*args, **kwargs):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(Path, "replace", fail)
+        with pytest.raises(StorageUnavailable):
+            json_backend.update(sample_task_data["id"], {"title": "Lost"})
+        monkeypatch.undo()
+        assert json_backend.get(sample_task_data["id"])["title"] == sample_task_data["title"]
+
+
+def _add_tasks(data_dir: str, worker: int, count: int) -> None:
+    from pathlib import Path
+
+    from task_manager.storage.json_backend import JsonBackend
+
+    backend = JsonBackend(data_dir=Path(data_dir))
+    for i in range(count):
+        backend.create({"id": f"W{worker:02d}-{i:03d}", "title": f"worker {worker}"})
+
+
+class TestConcurrentWriters:
+    def test_parallel_processes_lose_no_writes(self, tmp_data_dir):
+        from concurrent.futures import ProcessPoolExecutor
+
+        from task_manager.storage.json_backend import JsonBackend
+
+        with ProcessPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(_add_tasks, str(tmp_data_dir), w, 25) for w in range(4)]
+            for future in futures:
+                future.result()
+        backend = JsonBackend(data_dir=tmp_data_dir)
+        assert len(backend.list()) == 100
+        assert not list(tmp_data_dir.glob("*.tmp"))
+
+    def test_file_holds_only_tasks(self, json_backend, tmp_data_dir, sample_task_data):
+        import json
+
+        json_backend.create(sample_task_data)
+        json_backend.update(sample_task_data["id"], {"title": "Again"})
+        assert list(json.loads((tmp_data_dir / "tasks.json").read_text())) == ["tasks"]
+
+    def test_lock_timeout_raises_unavailable(self, tmp_data_dir, sample_task_data):
+        from task_manager.errors import StorageUnavailable
+        from task_manager.storage.json_backend import JsonBackend
+        from task_manager.utils.locking import file_lock
+
+        backend = JsonBackend(data_dir=tmp_data_dir, lock_timeout=0.05)
+        with file_lock(tmp_data_dir / "tasks.lock"):
+            with pytest.raises(StorageUnavailable, match="locked"):
+                backend.create(sample_task_data)
+
+    def test_unlocked_writer_is_detected_and_retried(
+        self, json_backend, tmp_data_dir, sample_task_data, monkeypatch
+    ):
+        from task_manager.storage.json_backend import JsonBackend
+
+        json_backend.create(sample_task_data)
+        original = JsonBackend._load_for_update
+        calls = []
+
+        def racing_load(self):
+            data = original(self)
+            if not calls:  # someone ignoring the lock writes right after our first read
+                tasks = {**data["tasks"], "ROGUE": {"id": "ROGUE", "title": "rogue"}}
+                JsonBackend(data_dir=tmp_data_dir)._save({"tasks": tasks})
+            calls.append(1)
+            return data
+
+        monkeypatch.setattr(JsonBackend, "_load_for_update", racing_load)
+        json_backend.update(sample_task_data["id"], {"title": "Mine"})
+        assert len(calls) == 2
+        assert json_backend.get("ROGUE") is not None
+        assert json_backend.get(sample_task_data["id"])["title"] == "Mine"
+
+    def test_persistent_conflict_raises(self, json_backend, tmp_data_dir, monkeypatch):
+        from task_manager.errors import WriteConflict
+        from task_manager.storage.json_backend import JsonBackend
+
+        original = JsonBackend._load_for_update
+
+        def always_racing(self):
+            data = original(self)
+            JsonBackend(data_dir=tmp_data_dir)._save({"tasks": {}})
+            return data
+
+        monkeypatch.setattr(JsonBackend, "_load_for_update", always_racing)
+        with pytest.raises(WriteConflict):
+            json_backend.create({"id": "X", "title": "never lands"})
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+class TestFileModes:
+    @pytest.fixture()
+    def umask(self, monkeypatch):
+        old = os.umask(0o027)
+        monkeypatch.setattr(storage, "_UMASK", 0o027)
+        yield 0o027
+        os.umask(old)
+
+    def test_new_store_files_follow_umask(self, tmp_data_dir, umask):
+        backend = JsonBackend(data_dir=tmp_data_dir, columnar_min_tasks=0)
+        backend.create(Task(title="first").to_storage())
+        cache_clear()
+        backend.list()  # writes tasks.columns
+        for name in ("tasks.json", "tasks.columns"):
+            assert (tmp_data_dir / name).stat().st_mode & 0o777 == 0o640
+
+    def test_existing_store_keeps_its_mode(self, tmp_data_dir, umask):
+        backend = JsonBackend(data_dir=tmp_data_dir)
+        backend.create(Task(title="first").to_storage())
+        (tmp_data_dir / "tasks.json").chmod(0o604)
+        backend.create(Task(title="second").to_storage())
+        assert (tmp_data_dir / "tasks.json").stat().st_mode & 0o777 == 0o604
+
+    def test_umask_is_read_without_setting_it(self, monkeypatch):
+        old = os.umask(0o022)
+        os.umask(old)
+        assert storage._read_umask() == old
+
+        def fail(mask):
+            raise AssertionError("os.umask() called")
+
+        monkeypatch.setattr(os, "umask", fail)
+        assert storage.new_file_mode() == 0o666 & ~storage._UMASK
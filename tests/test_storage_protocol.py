@@ -2,17 +2,39 @@
 
 import pytest
 
+from task_manager.contracts import BatchStorageBackend, TagEditBackend
+from task_manager.errors import TaskNotFound, UpdateConflict
 from task_manager.models import Task
-from task_manager.storage.json_backend import JsonBackend
+from task_manager.storage import (
+    create_many,
+    delete_many,
+    edit_tags,
+    list_tasks,
+    resolve_prefix,
+    scan_tasks,
+    sqlite_backend,
+    update_many,
+    update_task,
+    update_with_retry,
+)
+from task_manager.storage.json_backend import JournaledJsonBackend, JsonBackend
 from task_manager.storage.sqlite_backend import SqliteBackend
+from task_manager.utils.filters import Compare, HasTags, In, Untagged
 
 
-@pytest.fixture(params=["json", "sqlite"])
-def backend(request, tmp_path):
+@pytest.fixture(params=["json", "json-journal", "sqlite", "sqlite-compat"])
+def backend(request, tmp_path, monkeypatch):
     data_dir = tmp_path / "data"
     data_dir.mkdir()
     if request.param == "json":
         return JsonBackend(data_dir=data_dir)
+    if request.param == "json-journal":
+        return JournaledJsonBackend(data_dir=data_dir)
+    if request.param == "sqlite-compat":
+        # The statements used on SQLite without RETURNING, upsert or JSON1.
+        monkeypatch.setattr(sqlite_backend, "_SUPPORTS_RETURNING", False)
+        monkeypatch.setattr(sqlite_backend, "_SUPPORTS_UPSERT", False)
+        monkeypatch.setattr(sqlite_backend, "_supports_json1", lambda: False)
     return SqliteBackend(data_dir=data_dir)
 
 
@@ -62,3 +84,377 @@ class TestProtocolCompliance:
         backend.create(data)
         assert len(backend.list(project="myproject")) == 1
         assert len(backend.list(project="other")) == 0
+
+
+class TestBatchWrites:
+    def test_native_batch_support(self, backend):
+        assert isinstance(backend, BatchStorageBackend)
+
+    def test_create_many(self, backend):
+        items = [_make_task() for _ in range(3)]
+        created = backend.create_many(items)
+        assert [t["id"] for t in created] == [t["id"] for t in items]
+        assert len(backend.list()) == 3
+
+    def test_writes_do_not_share_rows_with_callers(self, backend):
+        a, b = _make_task(tags=["x"]), _make_task(tags=["x"])
+        backend.create(a)
+        backend.create_many([b])
+        a["tags"].append("in")  # the caller's dicts, after the write
+        b["title"] = "changed"
+        returned = [
+            backend.update(a["id"], {"priority": "high"}),
+            *backend.update_many({b["id"]: {"priority": "low"}}),
+        ]
+        for row in returned:
+            row["tags"].append("out")
+            row["title"] = "changed"
+        for task_id in (a["id"], b["id"]):
+            stored = backend.get(task_id)
+            assert stored["tags"] == ["x"]
+            assert stored["title"] == "Test task"
+
+    def test_create_many_replaces_existing_ids(self, backend):
+        item = _make_task(tags=["a"])
+        backend.create_many([item])
+        backend.create_many([{**item, "title": "Replaced", "tags": ["b"]}])
+        [stored] = backend.list()
+        assert stored["title"] == "Replaced"
+        assert [t["id"] for t in backend.list(tags=["b"])] == [item["id"]]
+        assert backend.list(tags=["a"]) == []
+
+    def test_create_many_empty(self, backend):
+        assert backend.create_many([]) == []
+        assert backend.list() == []
+
+    def test_update_many(self, backend):
+        a, b = _make_task(), _make_task()
+        backend.create_many([a, b])
+        updated = backend.update_many({a["id"]: {"title": "A"}, b["id"]: {"status": "done"}})
+        assert [u["id"] for u in updated] == [a["id"], b["id"]]
+        assert backend.get(a["id"])["title"] == "A"
+        assert backend.get(b["id"])["status"] == "done"
+
+    def test_update_many_missing_writes_nothing(self, backend):
+        a = _make_task()
+        backend.create(a)
+        with pytest.raises(TaskNotFound):
+            backend.update_many({a["id"]: {"title": "A"}, "missing": {"title": "B"}})
+        assert backend.get(a["id"])["title"] == "Test task"
+
+    def test_delete_many_counts_existing(self, backend):
+        a, b = _make_task(), _make_task()
+        backend.create_many([a, b])
+        assert backend.delete_many([a["id"], "missing", b["id"]]) == 2
+        assert backend.list() == []
+        assert backend.delete_many([]) == 0
+
+
+class _SingleItemBackend:
+    """Third-party style backend with only the base protocol methods."""
+
+    name = "single"
+
+    def __init__(self):
+        self.tasks = {}
+
+    def get(self, task_id):
+        return self.tasks.get(task_id)
+
+    def list(self, **filters):
+        return list(self.tasks.values())
+
+    def create(self, data):
+        self.tasks[data["id"]] = data
+        return data
+
+    def update(self, task_id, patch):
+        if task_id not in self.tasks:
+            raise TaskNotFound(task_id)
+        self.tasks[task_id].update(patch)
+        return self.tasks[task_id]
+
+    def delete(self, task_id):
+        return self.tasks.pop(task_id, None) is not None
+
+    def search(self, query):
+        return []
+
+
+class TestBatchFallback:
+    def test_helpers_loop_over_single_item_methods(self):
+        backend = _SingleItemBackend()
+        assert not isinstance(backend, BatchStorageBackend)
+        a, b = _make_task(), _make_task()
+        assert len(create_many(backend, [a, b])) == 2
+        update_many(backend, {a["id"]: {"title": "A"}})
+        assert backend.get(a["id"])["title"] == "A"
+        assert delete_many(backend, [a["id"], "missing"]) == 1
+
+    def test_update_fallback_checks_all_ids_first(self):
+        backend = _SingleItemBackend()
+        a = _make_task()
+        backend.create(a)
+        with pytest.raises(TaskNotFound):
+            update_many(backend, {a["id"]: {"title": "A"}, "missing": {}})
+        assert backend.get(a["id"])["title"] == "Test task"
+
+    def test_helpers_use_native_methods(self, backend):
+        a = _make_task()
+        create_many(backend, [a])
+        assert delete_many(backend, [a["id"]]) == 1
+
+
+class TestPrefixLookup:
+    def test_resolve_prefix(self, backend):
+        for suffix in ("A1", "A2", "B1"):
+            backend.create({**_make_task(), "id": f"01TEST{suffix}"})
+        assert backend.resolve_prefix("01TESTA") == ["01TESTA1", "01TESTA2"]
+        assert backend.resolve_prefix("01TEST", limit=2) == ["01TESTA1", "01TESTA2"]
+        assert backend.resolve_prefix("01TESTB1") == ["01TESTB1"]
+        assert backend.resolve_prefix("01TESTC") == []
+
+    def test_resolve_prefix_sees_new_writes(self, backend):
+        backend.create({**_make_task(), "id": "01TESTA1"})
+        assert backend.resolve_prefix("01TEST") == ["01TESTA1"]
+        backend.create({**_make_task(), "id": "01TESTA2"})
+        backend.delete("01TESTA1")
+        assert backend.resolve_prefix("01TEST") == ["01TESTA2"]
+
+    def test_fallback_scans_list(self):
+        backend = _SingleItemBackend()
+        backend.create({**_make_task(), "id": "01TESTB"})
+        backend.create({**_make_task(), "id": "01TESTA"})
+        assert resolve_prefix(backend, "01TEST") == ["01TESTA", "01TESTB"]
+
+
+def _seed_for_sorting(backend) -> list[dict]:
+    rows = [
+        _make_task(priority="low", due_date="2025-03-01"),
+        _make_task(priority="urgent"),
+        _make_task(priority="high", due_date="2025-01-01"),
+        _make_task(priority="urgent", due_date="2025-02-01"),
+    ]
+    for i, row in enumerate(rows):
+        row["created_at"] = f"2025-01-0{i + 1}T00:00:00+00:00"
+        row["updated_at"] = f"2025-02-0{4 - i}T00:00:00+00:00"
+    create_many(backend, rows)
+    return rows
+
+
+class TestSortAndPaging:
+    @pytest.mark.parametrize(
+        ("sort_by", "expected"),
+        [
+            (None, [0, 1, 2, 3]),
+            ("created_at", [0, 1, 2, 3]),
+            ("-created_at", [3, 2, 1, 0]),
+            ("updated_at", [0, 1, 2, 3]),
+            ("due_date", [2, 3, 0, 1]),
+            ("-due_date", [1, 0, 3, 2]),
+        ],
+    )
+    def test_sort_orders(self, backend, sort_by, expected):
+        rows = _seed_for_sorting(backend)
+        result = backend.list(sort_by=sort_by)
+        assert [r["id"] for r in result] == [rows[i]["id"] for i in expected]
+
+    def test_priority_most_urgent_first(self, backend):
+        _seed_for_sorting(backend)
+        priorities = [r["priority"] for r in backend.list(sort_by="priority")]
+        assert priorities == ["urgent", "urgent", "high", "low"]
+
+    def test_limit_and_offset(self, backend):
+        rows = _seed_for_sorting(backend)
+        ordered = [r["id"] for r in backend.list(sort_by="due_date")]
+        page = backend.list(sort_by="due_date", limit=2, offset=1)
+        assert [r["id"] for r in page] == ordered[1:3]
+        assert len(backend.list(limit=3)) == 3
+        assert [r["id"] for r in backend.list(offset=3)] == [rows[3]["id"]]
+
+    def test_paging_combines_with_filters(self, backend):
+        _seed_for_sorting(backend)
+        result = backend.list(priority=["urgent"], sort_by="due_date", limit=1)
+        assert [r["due_date"] for r in result] == ["2025-02-01"]
+
+    def test_unknown_sort_key(self, backend):
+        with pytest.raises(ValueError):
+            backend.list(sort_by="title")
+
+    def test_fallback_sorts_in_python(self):
+        backend = _SingleItemBackend()
+        rows = _seed_for_sorting(backend)
+        result = list_tasks(backend, sort_by="-created_at", limit=2)
+        assert [r["id"] for r in result] == [rows[3]["id"], rows[2]["id"]]
+
+
+class TestScan:
+    def test_chunks_in_created_order(self, backend):
+        rows = [_make_task() for _ in range(5)]
+        for i, row in enumerate(rows):
+            # Two pairs share a created_at, one pair across a chunk boundary.
+            row["created_at"] = f"2025-01-0{(i + 1) // 2 + 1}T00:00:00+00:00"
+        create_many(backend, reversed(rows))
+        chunks = list(scan_tasks(backend, chunk_size=2))
+        assert [len(c) for c in chunks] == [2, 2, 1]
+        expected = sorted(rows, key=lambda r: (r["created_at"], r["id"]))
+        assert [r["id"] for c in chunks for r in c] == [r["id"] for r in expected]
+
+    def test_exact_multiple_and_empty(self, backend):
+        assert list(scan_tasks(backend, chunk_size=2)) == []
+        create_many(backend, [_make_task(), _make_task()])
+        assert [len(c) for c in scan_tasks(backend, chunk_size=2)] == [2]
+
+    def test_fallback_chunks_one_list(self):
+        backend = _SingleItemBackend()
+        rows = _seed_for_sorting(backend)
+        chunks = list(scan_tasks(backend, chunk_size=3))
+        assert [[r["id"] for r in c] for c in chunks] == [
+            [r["id"] for r in rows[:3]],
+            [rows[3]["id"]],
+        ]
+
+
+_WHERE_CASES = [
+    In("priority", ("urgent",)) | HasTags(("x",)),
+    ~Compare("due_date", "<", "2025-02-15"),
+    Compare("due_date", ">=", "2025-01-01") & Compare("created_at", ">", "2025-01-01T12:00"),
+    ~In("project", (None,)),
+    ~(HasTags(("x", "y")) | In("status", ("done",))),
+    Untagged(),
+    ~Untagged() & In("priority", ("urgent",)),
+]
+
+
+class TestWherePushdown:
+    @pytest.mark.parametrize("where", _WHERE_CASES, ids=str)
+    def test_backends_agree_with_python(self, backend, where):
+        rows = _seed_for_sorting(backend)
+        rows[0]["tags"] = ["x", "y"]
+        rows[1]["tags"] = ["x"]
+        rows[2]["project"] = "p"
+        for row in rows[:3]:
+            backend.update(row["id"], {"tags": row["tags"], "project": row["project"]})
+        expected = [row["id"] for row in where.select(rows)]
+        assert [r["id"] for r in backend.list(where=where)] == expected
+        assert [r["id"] for r in list_tasks(backend, where=where, limit=1)] == expected[:1]
+
+    def test_where_combines_with_filters(self, backend):
+        _seed_for_sorting(backend)
+        result = backend.list(priority=["urgent"], where=Compare("due_date", ">", "2025-01-01"))
+        assert [r["due_date"] for r in result] == ["2025-02-01"]
+
+    def test_fallback_filters_in_python(self):
+        backend = _SingleItemBackend()
+        rows = _seed_for_sorting(backend)
+        result = list_tasks(backend, where=~In("priority", ("urgent",)), sort_by="-created_at")
+        assert [r["id"] for r in result] == [rows[2]["id"], rows[0]["id"]]
+
+
+class TestOptimisticConcurrency:
+    def test_matching_expected_updated_at_applies(self, backend):
+        data = _make_task()
+        backend.create(data)
+        updated = backend.update(
+            data["id"], {"title": "Swapped"}, expected_updated_at=data["updated_at"]
+        )
+        assert updated["title"] == "Swapped"
+        assert updated["updated_at"] != data["updated_at"]  # stamped by the backend
+        assert backend.get(data["id"])["updated_at"] == updated["updated_at"]
+
+    def test_stale_expected_updated_at_conflicts(self, backend):
+        data = _make_task()
+        backend.create(data)
+        backend.update(data["id"], {"title": "First", "updated_at": "2030-01-01T00:00:00"})
+        with pytest.raises(UpdateConflict) as excinfo:
+            backend.update(data["id"], {"title": "Second"}, expected_updated_at=data["updated_at"])
+        assert excinfo.value.actual == "2030-01-01T00:00:00"
+        assert backend.get(data["id"])["title"] == "First"
+
+    def test_missing_task_is_not_found(self, backend):
+        with pytest.raises(TaskNotFound):
+            backend.update("missing", {"title": "x"}, expected_updated_at="whenever")
+
+    def test_retry_reapplies_change_on_fresh_data(self, backend):
+        data = _make_task(tags=["a"])
+        backend.create(data)
+        calls = []
+
+        def add_b(current):
+            if not calls:  # another writer gets in between our read and our write
+                backend.update(data["id"], {"tags": ["a", "c"], "updated_at": "2030-01-01"})
+            calls.append(current["tags"])
+            return {"tags": sorted({*current["tags"], "b"})}
+
+        result = update_with_retry(backend, data["id"], add_b)
+        assert calls == [["a"], ["a", "c"]]
+        assert result["tags"] == ["a", "b", "c"]
+
+    def test_concurrent_threads_lose_no_updates(self, backend):
+        from concurrent.futures import ThreadPoolExecutor
+
+        data = _make_task()
+        backend.create(data)
+
+        def add_tag(n):
+            update_with_retry(
+                backend,
+                data["id"],
+                lambda current: {"tags": sorted({*current["tags"], f"t{n}"})},
+                attempts=50,
+            )
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(add_tag, range(8)))
+        assert backend.get(data["id"])["tags"] == sorted(f"t{n}" for n in range(8))
+
+
+class TestTagEdits:
+    def test_native_on_builtin_backends(self, backend):
+        assert isinstance(backend, TagEditBackend)
+
+    def test_add_and_remove(self, backend):
+        data = _make_task(tags=["b", "a"])
+        backend.create(data)
+        edited = edit_tags(backend, data["id"], add=["c", "b"], remove=["a", "zzz"])
+        assert edited["tags"] == ["b", "c"]
+        assert edited["updated_at"] != data["updated_at"]
+        assert backend.get(data["id"])["tags"] == ["b", "c"]
+        assert [t["id"] for t in backend.list(tags=["c"])] == [data["id"]]
+        assert backend.list(tags=["a"]) == []
+
+    def test_remove_wins_over_add(self, backend):
+        data = _make_task()
+        backend.create(data)
+        assert edit_tags(backend, data["id"], add=["x"], remove=["x"])["tags"] == []
+
+    def test_missing_task(self, backend):
+        with pytest.raises(TaskNotFound):
+            edit_tags(backend, "missing", add=["x"])
+
+    def test_concurrent_edits_lose_nothing(self, backend):
+        from concurrent.futures import ThreadPoolExecutor
+
+        data = _make_task()
+        backend.create(data)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda n: edit_tags(backend, data["id"], add=[f"t{n}"]), range(8)))
+        assert backend.get(data["id"])["tags"] == sorted(f"t{n}" for n in range(8))
+
+
+class TestOptimisticConcurrencyFallback:
+    def test_update_task_emulates_cas(self):
+        backend = _SingleItemBackend()
+        data = _make_task()
+        backend.create(dict(data))
+        update_task(backend, data["id"], {"title": "A"}, expected_updated_at=data["updated_at"])
+        assert backend.get(data["id"])["title"] == "A"
+        with pytest.raises(UpdateConflict):
+            update_task(backend, data["id"], {"title": "B"}, expected_updated_at=data["updated_at"])
+
+    def test_edit_tags_without_native_support(self):
+        backend = _SingleItemBackend()
+        data = _make_task(tags=["a"])
+        backend.create(dict(data))
+        assert not isinstance(backend, TagEditBackend)
+        assert edit_tags(backend, data["id"], add=["b"], remove=["a"])["tags"] == ["b"]
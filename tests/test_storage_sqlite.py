@@ -1,8 +1,12 @@
 """Tests for SQLite storage backend."""
 
+import threading
+
 import pytest
 
 from task_manager.errors import TaskNotFound
+from task_manager.storage import sqlite_migrations as migrations
+from task_manager.storage.sqlite_backend import SqliteBackend
 
 
 class TestSqliteBackendCrud:
@@ -65,3 +69,294 @@ class TestSqliteBackendFilters:
         assert len(results) == 1
         results = sqlite_backend.list(tags=["nonexistent"])
         assert len(results) == 0
+
+
+class TestSqliteBackendConnection:
+    def test_connection_reused_across_calls(self, sqlite_backend, sample_task_data):
+        conn = sqlite_backend._connect()
+        sqlite_backend.create(sample_task_data)
+        sqlite_backend.update(sample_task_data["id"], {"title": "Updated"})
+        assert sqlite_backend._connect() is conn
+
+    def test_pragmas_applied(self, sqlite_backend):
+        conn = sqlite_backend._connect()
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert conn.execute("PRAGMA foreign_keys").fetchone()[0] == 1
+
+    def test_per_thread_connections(self, sqlite_backend):
+        main_conn = sqlite_backend._connect()
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(sqlite_backend._connect()))
+        thread.start()
+        thread.join()
+        assert seen[0] is not main_conn
+
+    def test_close_then_reuse_reopens(self, sqlite_backend, sample_task_data):
+        sqlite_backend.create(sample_task_data)
+        sqlite_backend.close()
+        sqlite_backend.close()
+        assert sqlite_backend.get(sample_task_data["id"]) is not None
+
+    def test_context_manager_closes(self, tmp_data_dir):
+        with SqliteBackend(data_dir=tmp_data_dir) as backend:
+            backend.list()
+            assert backend._connections
+        assert backend._connections == []
+
+
+def _task(title, description="", tags=()):
+    from task_manager.models import Task
+
+    return Task(title=title, description=description, tags=list(tags)).to_storage()
+
+
+class TestSqliteFullTextSearch:
+    def test_ranks_title_matches_first(self, sqlite_backend):
+        sqlite_backend.create(_task("Misc", description="touches the auth module"))
+        sqlite_backend.create(_task("Fix auth bug"))
+        results = sqlite_backend.search("auth")
+        assert [r["title"] for r in results] == ["Fix auth bug", "Misc"]
+
+    def test_prefix_and_tags(self, sqlite_backend):
+        sqlite_backend.create(_task("Refactor", tags=["backend", "security"]))
+        assert len(sqlite_backend.search("secur")) == 1
+        assert len(sqlite_backend.search("refac back")) == 1
+        assert sqlite_backend.search("refac frontend") == []
+
+    def test_phrase(self, sqlite_backend):
+        sqlite_backend.create(_task("login page redesign"))
+        sqlite_backend.create(_task("page about login"))
+        assert [r["title"] for r in sqlite_backend.search('"login page"')] == [
+            "login page redesign"
+        ]
+
+    def test_operators_in_input_are_literal(self, sqlite_backend):
+        sqlite_backend.create(_task("NOT a problem"))
+        assert len(sqlite_backend.search("NOT (")) == 1
+
+    def test_index_follows_update_and_delete(self, sqlite_backend):
+        data = _task("alpha")
+        sqlite_backend.create(data)
+        sqlite_backend.update(data["id"], {"title": "beta"})
+        assert sqlite_backend.search("alpha") == []
+        assert len(sqlite_backend.search("beta")) == 1
+        sqlite_backend.delete(data["id"])
+        assert sqlite_backend.search("beta") == []
+
+    def test_index_built_for_existing_rows(self, sqlite_backend, tmp_data_dir):
+        sqlite_backend.create(_task("pre-existing row"))
+        with sqlite_backend._connect() as conn:
+            conn.executescript(
+                "DROP TRIGGER tasks_fts_ai; DROP TRIGGER tasks_fts_ad; "
+                "DROP TRIGGER tasks_fts_au; DROP TABLE tasks_fts; PRAGMA user_version = 2;"
+            )
+        with SqliteBackend(data_dir=tmp_data_dir) as reopened:
+            assert reopened._has_fts()
+            assert len(reopened.search("existing")) == 1
+
+    def test_index_created_when_fts5_arrives_later(self, sqlite_backend, tmp_data_dir):
+        # Migration 3 ran on a SQLite without FTS5: recorded, but no index.
+        sqlite_backend.create(_task("pre-existing row"))
+        with sqlite_backend._connect() as conn:
+            conn.executescript(
+                "DROP TRIGGER tasks_fts_ai; DROP TRIGGER tasks_fts_ad; "
+                "DROP TRIGGER tasks_fts_au; DROP TABLE tasks_fts;"
+            )
+        with SqliteBackend(data_dir=tmp_data_dir) as reopened:
+            assert reopened._has_fts()
+            assert len(reopened.search("existing")) == 1
+
+    def test_no_write_lock_without_fts5(self, sqlite_backend, tmp_data_dir, monkeypatch):
+        with sqlite_backend._connect() as conn:
+            conn.executescript(
+                "DROP TRIGGER tasks_fts_ai; DROP TRIGGER tasks_fts_ad; "
+                "DROP TRIGGER tasks_fts_au; DROP TABLE tasks_fts;"
+            )
+        monkeypatch.setattr(migrations, "fts5_available", lambda: False)
+        with SqliteBackend(data_dir=tmp_data_dir, auto_migrate=False) as reopened:
+            statements: list[str] = []
+            reopened._connect().set_trace_callback(statements.append)
+            assert reopened.migrate() == []
+            assert not reopened._has_fts()
+        assert not any(s.startswith(("BEGIN", "CREATE")) for s in statements)
+
+    def test_current_schema_opens_without_writes(self, sqlite_backend, tmp_data_dir):
+        with SqliteBackend(data_dir=tmp_data_dir, auto_migrate=False) as reopened:
+            statements: list[str] = []
+            reopened._connect().set_trace_callback(statements.append)
+            assert reopened.migrate() == []
+            assert reopened._has_fts()
+        assert not any(s.startswith(("BEGIN", "CREATE")) for s in statements)
+
+    def test_like_fallback_without_fts(self, sqlite_backend):
+        sqlite_backend._fts = False
+        sqlite_backend.create(_task("Groceries", tags=["errands"]))
+        assert len(sqlite_backend.search("rocer")) == 1
+        assert len(sqlite_backend.search("errand")) == 1
+
+    @pytest.mark.parametrize("query", ['"', ",", "[", "]", "%", "_"])
+    def test_like_fallback_punctuation_is_literal(self, sqlite_backend, query):
+        sqlite_backend._fts = False
+        sqlite_backend.create(_task("Groceries", tags=["errands", "home"]))
+        assert sqlite_backend.search(query) == []
+
+    def test_vacuum_rebuilds_index(self, sqlite_backend):
+        rows = [_task(f"task {i}") for i in range(20)]
+        sqlite_backend.create_many(rows)
+        for row in rows[:10]:
+            sqlite_backend.delete(row["id"])
+        sqlite_backend.create(_task("needle"))
+        assert sqlite_backend.vacuum()
+        [found] = sqlite_backend.search("needle")
+        assert found["title"] == "needle"
+        assert len(sqlite_backend.search("task")) == 10
+
+
+class TestSqliteTagIndex:
+    def _tags_in_index(self, backend, task_id):
+        with backend._connect() as conn:
+            rows = conn.execute(
+                "SELECT tag FROM task_tags WHERE task_id = ? ORDER BY tag", (task_id,)
+            )
+            return [r[0] for r in rows]
+
+    def test_filter_requires_all_tags(self, sqlite_backend):
+        both = _task("both", tags=["dev", "urgent"])
+        sqlite_backend.create_many([both, _task("one", tags=["dev"]), _task("none")])
+        assert [r["title"] for r in sqlite_backend.list(tags=["dev", "urgent"])] == ["both"]
+        assert len(sqlite_backend.list(tags=["dev"])) == 2
+        assert len(sqlite_backend.list(tags=["dev", "dev"])) == 2
+
+    def test_index_follows_update_and_delete(self, sqlite_backend):
+        data = _task("t", tags=["a", "b"])
+        sqlite_backend.create(data)
+        assert self._tags_in_index(sqlite_backend, data["id"]) == ["a", "b"]
+        sqlite_backend.update(data["id"], {"tags": ["c"]})
+        assert self._tags_in_index(sqlite_backend, data["id"]) == ["c"]
+        sqlite_backend.update_many({data["id"]: {"tags": ["d"]}})
+        assert self._tags_in_index(sqlite_backend, data["id"]) == ["d"]
+        sqlite_backend.delete(data["id"])
+        assert self._tags_in_index(sqlite_backend, data["id"]) == []
+
+    def test_index_follows_tag_edits(self, sqlite_backend):
+        data = _task("t", tags=["a", "b"])
+        sqlite_backend.create(data)
+        edited = sqlite_backend.update_tags(data["id"], add=["c", "a"], remove=["b"])
+        assert edited["tags"] == ["a", "c"]
+        assert self._tags_in_index(sqlite_backend, data["id"]) == ["a", "c"]
+        assert sqlite_backend.get(data["id"])["tags"] == ["a", "c"]
+
+    def test_existing_rows_backfilled(self, sqlite_backend, tmp_data_dir):
+        data = _task("old", tags=["legacy"])
+        sqlite_backend.create(data)
+        with sqlite_backend._connect() as conn:
+            conn.executescript("DROP TABLE task_tags; PRAGMA user_version = 1;")
+        with SqliteBackend(data_dir=tmp_data_dir) as reopened:
+            assert [r["id"] for r in reopened.list(tags=["legacy"])] == [data["id"]]
+
+
+class TestSqlitePartialUpdate:
+    def _trace(self, backend):
+        statements: list[str] = []
+        backend._connect().set_trace_callback(statements.append)
+        return statements
+
+    def test_sets_only_patched_columns_in_one_statement(self, sqlite_backend):
+        data = _task("t", tags=["a"])
+        sqlite_backend.create(data)
+        statements = self._trace(sqlite_backend)
+        updated = sqlite_backend.update(data["id"], {"status": "done", "updated_at": "2030"})
+        writes = [s for s in statements if not s.startswith(("BEGIN", "COMMIT"))]
+        assert len(writes) == 1
+        assert writes[0].startswith("UPDATE tasks SET status='done', updated_at='2030' WHERE")
+        assert updated == {**data, "status": "done", "updated_at": "2030"}
+
+    def test_tag_edit_is_one_update(self, sqlite_backend):
+        data = _task("t", tags=["a"])
+        sqlite_backend.create(data)
+        statements = self._trace(sqlite_backend)
+        sqlite_backend.update_tags(data["id"], add=["b"])
+        assert not any(s.startswith("SELECT") for s in statements)
+
+    def test_empty_patch_returns_row(self, sqlite_backend):
+        data = _task("t")
+        sqlite_backend.create(data)
+        assert sqlite_backend.update(data["id"], {}) == data
+        with pytest.raises(TaskNotFound):
+            sqlite_backend.update("missing", {})
+
+
+class TestSqliteMigrations:
+    def test_new_database_is_current(self, sqlite_backend):
+        from task_manager.storage.sqlite_migrations import LATEST_VERSION
+
+        assert sqlite_backend.schema_version() == LATEST_VERSION
+        assert sqlite_backend.pending_migrations() == []
+        assert sqlite_backend.migrate() == []
+
+    def test_unversioned_database_upgrades(self, tmp_data_dir, sample_task_data):
+        import sqlite3
+
+        from task_manager.storage.sqlite_migrations import _TASKS_SQL, LATEST_VERSION
+
+        conn = sqlite3.connect(tmp_data_dir / "tasks.db")
+        conn.executescript(_TASKS_SQL)
+        conn.execute(
+            "INSERT INTO tasks (id, title, tags, created_at, updated_at) VALUES (?, ?, ?, ?, ?)",
+            ("OLD1", "legacy row", '["old"]', "t", "t"),
+        )
+        conn.commit()
+        conn.close()
+
+        with SqliteBackend(data_dir=tmp_data_dir, auto_migrate=False) as backend:
+            assert backend.schema_version() == 0
+            pending = [m.version for m in backend.pending_migrations()]
+            assert pending == list(range(1, LATEST_VERSION + 1))
+            assert len(backend.migrate()) == LATEST_VERSION
+            assert backend.schema_version() == LATEST_VERSION
+            assert [r["id"] for r in backend.list(tags=["old"])] == ["OLD1"]
+            assert [r["id"] for r in backend.search("legacy")] == ["OLD1"]
+
+    def test_failed_step_rolls_back(self, tmp_data_dir, monkeypatch):
+        from task_manager.storage import sqlite_migrations
+
+        def boom(conn):
+            conn.execute("CREATE TABLE half_done (x)")
+            raise RuntimeError("step failed")
+
+        broken = sqlite_migrations.Migration(1, "broken", boom)
+        monkeypatch.setattr(sqlite_migrations, "MIGRATIONS", (broken,))
+        monkeypatch.setattr(sqlite_migrations, "LATEST_VERSION", 1)
+        with pytest.raises(RuntimeError):
+            SqliteBackend(data_dir=tmp_data_dir)
+        with SqliteBackend(data_dir=tmp_data_dir, auto_migrate=False) as backend:
+            assert backend.schema_version() == 0
+            tables = backend._connect().execute(
+                "SELECT name FROM sqlite_master WHERE name = 'half_done'"
+            )
+            assert tables.fetchall() == []
+
+    def test_newer_schema_refused(self, sqlite_backend, tmp_data_dir):
+        from task_manager.errors import StorageUnavailable
+
+        with sqlite_backend._connect() as conn:
+            conn.execute("PRAGMA user_version = 999")
+        with pytest.raises(StorageUnavailable):
+            SqliteBackend(data_dir=tmp_data_dir)
+
+
+class TestSqliteSortedListing:
+    @pytest.mark.parametrize("sort_by", ["created_at", "-updated_at", "priority", "due_date"])
+    def test_limited_sort_uses_index(self, sqlite_backend, sort_by):
+        from task_manager.storage.sqlite_backend import _ORDER_TERMS
+        from task_manager.utils.filters import parse_sort
+
+        key, descending = parse_sort(sort_by)
+        direction = " DESC" if descending else " ASC"
+        order = ", ".join(t + direction for t in (*_ORDER_TERMS[key], "id"))
+        plan = sqlite_backend._connect().execute(
+            f"EXPLAIN QUERY PLAN SELECT * FROM tasks ORDER BY {order} LIMIT 20"
+        )
+        details = " ".join(row[3] for row in plan)
+        assert "TEMP B-TREE" not in details, details
@@ -0,0 +1,95 @@
+"""Tests for span tracing and the --trace / --profile options."""
+
+import json
+
+import pytest
+from typer.testing import CliRunner
+
+from task_manager.cli.app import app
+from task_manager.storage import update_task
+from task_manager.storage.json_backend import JsonBackend
+from task_manager.utils import trace
+
+runner = CliRunner(env={"COLUMNS": "200"})
+
+
+@pytest.fixture()
+def tracer():
+    tracer = trace.enable()
+    yield tracer
+    trace.disable()
+
+
+def test_span_is_noop_when_disabled():
+    assert trace.active() is None
+    assert trace.span("a") is trace.span("b")  # one shared no-op context
+
+
+def test_spans_recorded(tracer):
+    with trace.span("outer", n=1):
+        with trace.span("inner"):
+            pass
+    names = [s[0] for s in tracer.spans]
+    assert names == ["inner", "outer"]
+    assert "outer" in tracer.summary()
+    events = tracer.chrome_events()
+    assert {e["ph"] for e in events} == {"X"}
+    assert events[1]["args"] == {"n": "1"}
+
+
+def test_instrument_keeps_class_introspection(tracer, tmp_data_dir):
+    backend = JsonBackend(data_dir=tmp_data_dir)
+    trace.instrument(backend, "storage")
+    assert type(backend) is JsonBackend
+    backend.create({"id": "A", "title": "t", "updated_at": "1"})
+    # update_task inspects type(backend).update to find CAS support.
+    update_task(backend, "A", {"title": "u"}, expected_updated_at="1")
+    names = {s[0] for s in tracer.spans}
+    assert {"storage.create", "storage.update"} <= names
+
+
+def test_cli_trace_writes_chrome_file(tmp_path):
+    out = tmp_path / "trace.json"
+    result = runner.invoke(
+        app,
+        ["--data-dir", str(tmp_path), "--no-plugins", "--trace", str(out), "add", "Traced"],
+    )
+    assert result.exit_code == 0
+    assert trace.active() is None
+    names = {e["name"] for e in json.loads(out.read_text())["traceEvents"]}
+    assert {"task add", "config.load", "storage.open", "storage.create"} <= names
+
+
+def test_cli_trace_summary_to_stderr(tmp_path):
+    runner.invoke(app, ["--data-dir", str(tmp_path), "--no-plugins", "add", "One"])
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--no-plugins", "list"], env={"TASK_TRACE": "stderr"}
+    )
+    assert result.exit_code == 0
+    assert "storage.list" in result.output  # CliRunner mixes stderr into output
+    assert "render.list" in result.output
+
+
+@pytest.mark.parametrize("value", ["0", "false", "OFF", ""])
+def test_cli_trace_disabled_values(tmp_path, monkeypatch, value):
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(
+        app,
+        ["--data-dir", str(tmp_path / "data"), "--no-plugins", "list"],
+        env={"TASK_TRACE": value},
+    )
+    assert result.exit_code == 0
+    assert "storage.list" not in result.output
+    assert "Trace written" not in result.output
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data"]
+
+
+def test_cli_profile(tmp_path):
+    import pstats
+
+    out = tmp_path / "run.prof"
+    result = runner.invoke(
+        app, ["--data-dir", str(tmp_path), "--no-plugins", "--profile", str(out), "list"]
+    )
+    assert result.exit_code == 0
+    assert pstats.Stats(str(out)).total_calls > 0
@@ -0,0 +1,23 @@
+"""Tests for the read-only TaskView."""
+
+from datetime import date
+
+from task_manager.contracts import Priority, Status
+from task_manager.views import TaskView
+
+
+def test_view_matches_model(sample_task):
+    view = TaskView(sample_task.to_storage())
+    for field in TaskView.__slots__:
+        assert getattr(view, field) == getattr(sample_task, field)
+    assert view.status is Status.OPEN
+    assert view.priority is Priority.HIGH
+    assert view.due_date == date(2025, 12, 31)
+
+
+def test_view_fills_defaults():
+    view = TaskView({"id": "X", "title": "bare"})
+    assert view.status is Status.OPEN
+    assert view.priority is Priority.MEDIUM
+    assert view.tags == []
+    assert view.due_date is None